@@ -14,7 +14,14 @@ package.domain = com.engenhodigital
 source.dir = .
 
 # (list) Source files to include (comma separated)
-source.include_exts = py,png,kv,atlas,md,txt
+source.include_exts = py,png,kv,kvc,atlas,md,txt
+
+# (list) List of inclusions using pattern matching
+source.include_patterns = engdigital/content.json,assets/manifest.json
+
+# (list) Source directories to exclude (let empty to not exclude anything)
+# Store listing art, CI tooling and tests are not used at runtime and must not ship in the AAB.
+source.exclude_dirs = fastlane,assets/store,benchmarks,docs,scripts,tests,.cache,.github
 
 # (str) Application versioning (method 1)
 version = 1.0.0
@@ -23,7 +30,9 @@ version = 1.0.0
 main = main.py
 
 # (list) Application requirements
-requirements = python3,kivy,plyer
+# Kivy is pinned: the bundled app.kv.kvc is keyed to the Kivy version, and CI precompiles it with
+# the version pinned here (scripts/compile_kv.py refuses to run with any other).
+requirements = python3,kivy==2.2.1,plyer
 
 # (str) Presplash of the application (optional). Provide a real image when available.
 presplash.filename = %(source.dir)s/assets/images/presplash.png
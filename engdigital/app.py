@@ -1,74 +1,168 @@
 """Main Kivy application definition for Engenho Digital."""
 
 from pathlib import Path
-from urllib.parse import quote
-import webbrowser
+from typing import Optional
 
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.image import Image as CoreImage
 from kivy.core.window import Window
-from kivy.lang import Builder
+from kivy.factory import Factory
+from kivy.metrics import Metrics
+from kivy.logger import Logger
+from kivy.properties import ObjectProperty
 from kivy.resources import resource_find
 
-from engdigital import config
+from engdigital import config, intents, startup_trace
+from engdigital.asset_resolver import APP_ROOT, resolver as assets
+from engdigital.content import load_content
+from engdigital.content_sync import ContentCache, start_refresh
+from engdigital.kv_cache import load_kv
+from engdigital.lazy_screens import LazyScreenManager
+
+# Python classes used by app.kv, imported by the Factory only when first instantiated.
+FACTORY_CLASSES = (
+    ("CardList", "engdigital.card_list"),
+    ("DetailCard", "engdigital.card_list"),
+    ("ListHeading", "engdigital.card_list"),
+    ("ListText", "engdigital.card_list"),
+    ("HomeScreen", "engdigital.screens.home_screen"),
+    ("ServicesScreen", "engdigital.screens.services_screen"),
+    ("TeamScreen", "engdigital.screens.team_screen"),
+    ("WrapLabel", "engdigital.wrap_label"),
+)
+
+# (screen name, kv class) in navigation order; the first entry is the start screen.
+SCREENS = (
+    ("inicio", "InicioScreen"),
+    ("servicos", "ServicosScreen"),
+    ("equipe", "EquipeScreen"),
+    ("contato", "ContactScreen"),
+)
 
 
 class EngenhoDigitalApp(App):
     """Kivy App class for Engenho Digital."""
 
+    # engdigital.content.Content shown by the screens (bound in app.kv).
+    content = ObjectProperty(None, allownone=True)
+    content_cache = None
+
     def build(self):
         """Configure window properties and build the root widget."""
-        self.title = config.APP_NAME
+        with startup_trace.span("build"):
+            self.title = config.APP_NAME
+
+            # Set a neutral dark background.
+            Window.clearcolor = (0.05, 0.08, 0.12, 1)
+            if startup_trace.enabled():
+                Window.bind(on_flip=self._on_first_frame)
+
+            with startup_trace.span("build.paths"):
+                kv_path = APP_ROOT / "app.kv"
+                # Looked up in assets/manifest.json (written by scripts/generate_assets.py).
+                icon_path = assets.path("icon")
+
+                if icon_path:
+                    self.icon = icon_path
+                    # UI images packed into one texture sized for this screen's density, else
+                    # the full-size logo.
+                    self.logo_source = (
+                        assets.atlas_uri("ui", "logo", Metrics.density) or assets.path("logo") or icon_path
+                    )
+                else:
+                    # Fallback to bundled Kivy icon to avoid missing file errors.
+                    self.logo_source = resource_find("data/logo/kivy-icon-512.png") or ""
+
+            self.website_url = config.WEBSITE_URL
+            self.whatsapp_url = config.WHATSAPP_URL
+            self.email_address = config.EMAIL_ADDRESS
+            self.privacy_policy_url = config.PRIVACY_POLICY_URL
+            self.support_phone = config.SUPPORT_PHONE
 
-        # Set a neutral dark background.
-        Window.clearcolor = (0.05, 0.08, 0.12, 1)
+            with startup_trace.span("build.content"):
+                # Last downloaded copy first (never waits on the network), else the bundled file.
+                # The copy is only used if it came from the current CONTENT_URL under this build's
+                # bundled content.json; an app update with newer bundled content supersedes it.
+                data_dir = self._data_dir()
+                self.content_cache = ContentCache(data_dir / "content") if data_dir else None
+                cached = self.content_cache.load(config.CONTENT_URL) if self.content_cache else None
+                self.content = cached or load_content()
 
-        kv_path = Path(__file__).resolve().parent.parent / "app.kv"
-        assets_dir = Path(__file__).resolve().parent.parent / "assets"
-        images_dir = Path(__file__).resolve().parent.parent / "assets" / "images"
-        store_icon_path = assets_dir / "store" / "icon_512.png"
-        icon_path = store_icon_path if store_icon_path.exists() else (images_dir / "icon.png")
-        logo_path = images_dir / "logo.png"
+            # app.kv only declares rules; screens are instantiated by the manager. The parsed
+            # rules come from the bundled .kvc cache, or are cached in user_data_dir on first run.
+            with startup_trace.span("build.kv"):
+                for class_name, module in FACTORY_CLASSES:
+                    if class_name not in Factory.classes:
+                        Factory.register(class_name, module=module)
+                load_kv(kv_path, write_dir=self._data_dir())
 
-        if icon_path.exists():
-            self.icon = str(icon_path)
-            self.logo_source = str(logo_path if logo_path.exists() else icon_path)
-        else:
-            # Fallback to bundled Kivy icon to avoid missing file errors.
-            self.logo_source = resource_find("data/logo/kivy-icon-512.png") or ""
+            if startup_trace.enabled() and self.logo_source:
+                # Decode the logo up front so its cost shows separately; the Image widget
+                # then reuses the cached texture.
+                with startup_trace.span("build.logo"):
+                    CoreImage(self.logo_source)
 
-        self.website_url = config.WEBSITE_URL
-        self.whatsapp_url = config.WHATSAPP_URL
-        self.email_address = config.EMAIL_ADDRESS
-        self.privacy_policy_url = config.PRIVACY_POLICY_URL
-        self.support_phone = config.SUPPORT_PHONE
+            with startup_trace.span("build.screens"):
+                return self.build_screen_manager()
 
-        return Builder.load_file(str(kv_path))
+    def _data_dir(self) -> Optional[Path]:
+        """Return user_data_dir, or None when it cannot be created."""
+        try:
+            return Path(self.user_data_dir)
+        except OSError:
+            return None
+
+    def _on_first_frame(self, *_args) -> None:
+        Window.unbind(on_flip=self._on_first_frame)
+        startup_trace.finish(self._data_dir())
+
+    def build_screen_manager(self) -> LazyScreenManager:
+        """Register every screen and build the start screen (or all, if lazy mode is off)."""
+        manager = LazyScreenManager()
+        for name, class_name in SCREENS:
+            manager.register(name, getattr(Factory, class_name))
+        manager.ensure(SCREENS[0][0])
+        if not config.LAZY_SCREENS:
+            manager.build_all()
+        return manager
+
+    def on_start(self) -> None:
+        """Build the remaining screens in the background and refresh remote content."""
+        if config.LAZY_SCREENS and self.root:
+            self.root.prebuild_when_idle(config.LAZY_SCREENS_IDLE_DELAY)
+        if config.CONTENT_URL and self.content_cache is not None:
+            start_refresh(
+                config.CONTENT_URL,
+                self.content_cache,
+                on_update=lambda content: Clock.schedule_once(lambda _dt: self._set_content(content)),
+                on_error=lambda error: Logger.info(f"ContentSync: refresh skipped ({error})"),
+            )
+
+    def _set_content(self, content) -> None:
+        """Swap in refreshed content (UI thread); bound screens rebuild their cards."""
+        Logger.info("ContentSync: content updated from the website")
+        self.content = content
 
     def go(self, screen_name: str) -> None:
-        """Navigate to the selected screen name if it exists."""
+        """Navigate to the selected screen name, building it on first use."""
         if not self.root:
             return
-        if screen_name not in self.root.screen_names:
-            return
-        self.root.current = screen_name
+        self.root.show(screen_name)
 
     def open_url(self, url: str) -> None:
-        """Open an URL in the system browser."""
-        if not url:
-            return
-        webbrowser.open(url)
+        """Open an URL in the system browser (off the UI thread, repeated taps coalesced)."""
+        intents.open_uri(url)
 
     def open_email(self) -> None:
         """Draft an email using the configured contact address."""
         if not self.email_address:
             return
-        subject = quote("Contato - Engenho Digital")
-        recipient = quote(self.email_address)
-        webbrowser.open(f"mailto:{recipient}?subject={subject}")
+        intents.open_uri(intents.mailto(self.email_address))
 
     def open_whatsapp(self) -> None:
         """Open WhatsApp chat URL, or fallback to website when unset."""
         if self.whatsapp_url and self.whatsapp_url.startswith("http"):
-            webbrowser.open(self.whatsapp_url)
+            intents.open_uri(self.whatsapp_url)
             return
         self.open_url(self.website_url)
@@ -0,0 +1,138 @@
+"""Resolve logical image names (icon, logo, atlas sprites) from a build-time manifest.
+
+``scripts/generate_assets.py`` writes ``assets/manifest.json`` with the path, pixel size and
+SHA-256 digest of every image the app loads at runtime. The resolver reads that file once and
+answers every lookup from memory, so adding images costs no filesystem probing at startup.
+Only in dev mode (desktop runs from a checkout, where assets may be regenerated without the
+manifest) does a name missing from the manifest fall back to checking `RUNTIME_ASSETS`
+candidates on disk. Images drawn at a fixed dp size ship in 1x/2x/3x variants, and
+`for_density()` picks the smallest one that stays sharp on the current screen. Standard
+library only.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = "assets/manifest.json"
+MANIFEST_VERSION = 1
+
+# Logical names with one variant per density (px per dp), registered as "<name>-<n>x".
+DENSITY_VARIANTS: dict[str, tuple[int, ...]] = {
+    "ui": (1, 2, 3),
+}
+
+# Logical name -> candidate paths relative to the app root, best first. The build step
+# records the first one that exists and is packaged (see buildozer.spec source.*); dev mode
+# probes them in the same order. Store art under assets/store is not packaged.
+RUNTIME_ASSETS: dict[str, tuple[str, ...]] = {
+    "icon": ("assets/images/icon.png",),
+    "logo": ("assets/images/logo.png",),
+    **{
+        f"ui-{density}x": (f"assets/atlas/ui-{density}x.atlas",)
+        for density in DENSITY_VARIANTS["ui"]
+    },
+}
+
+
+@dataclass(frozen=True, slots=True)
+class AssetRecord:
+    name: str
+    path: str  # absolute
+    size: tuple[int, int]  # pixels; (0, 0) when found by dev-mode probing
+    sha256: str = ""
+    sprites: tuple[str, ...] = ()  # atlas sprite names
+
+
+def _default_dev_mode() -> bool:
+    # Packaged Android builds always ship the manifest; desktop runs come from a checkout.
+    return "ANDROID_ARGUMENT" not in os.environ
+
+
+class AssetResolver:
+    """In-memory index of the asset manifest, loaded on first lookup."""
+
+    def __init__(self, root: Path = APP_ROOT, manifest: Optional[Path] = None, dev_mode: Optional[bool] = None) -> None:
+        self.root = Path(root)
+        self.manifest = manifest or self.root / MANIFEST_PATH
+        self.dev_mode = _default_dev_mode() if dev_mode is None else dev_mode
+        self._index: Optional[dict[str, Optional[AssetRecord]]] = None
+
+    def _load(self) -> dict[str, Optional[AssetRecord]]:
+        try:
+            data = json.loads(self.manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        root = str(self.root)
+        index: dict[str, Optional[AssetRecord]] = {}
+        for name, entry in data.get("assets", {}).items():
+            index[name] = AssetRecord(
+                name=name,
+                path=os.path.join(root, entry["path"]),
+                size=tuple(entry["size"]),
+                sha256=entry.get("sha256", ""),
+                sprites=tuple(entry.get("sprites", ())),
+            )
+        return index
+
+    def _probe(self, name: str) -> Optional[AssetRecord]:
+        for candidate in RUNTIME_ASSETS.get(name, ()):
+            path = self.root / candidate
+            if path.exists():
+                sprites = ()
+                if path.suffix == ".atlas":
+                    try:
+                        sheets = json.loads(path.read_text(encoding="utf-8"))
+                        sprites = tuple(sprite for coords in sheets.values() for sprite in coords)
+                    except (OSError, ValueError, AttributeError):
+                        continue
+                return AssetRecord(name, str(path), (0, 0), sprites=sprites)
+        return None
+
+    def get(self, name: str) -> Optional[AssetRecord]:
+        """Return the record for a logical name, or None if the build did not ship it."""
+        if self._index is None:
+            self._index = self._load()
+        if name not in self._index:
+            # Remembered either way, so each name is probed at most once.
+            self._index[name] = self._probe(name) if self.dev_mode else None
+        return self._index[name]
+
+    def path(self, name: str) -> Optional[str]:
+        """Return the absolute path for a logical name, or None."""
+        record = self.get(name)
+        return record.path if record else None
+
+    def for_density(self, name: str, density: float) -> Optional[AssetRecord]:
+        """Pick the smallest variant at least as dense as the screen, else the densest one.
+
+        Names without density variants resolve as usual.
+        """
+        scales = DENSITY_VARIANTS.get(name)
+        if not scales:
+            return self.get(name)
+        best = None
+        for scale in sorted(scales):
+            record = self.get(f"{name}-{scale}x")
+            if record is None:
+                continue
+            best = record
+            if scale >= density - 0.01:  # 2.0 from a rounded Metrics.density still picks 2x
+                break
+        return best
+
+    def atlas_uri(self, atlas: str, sprite: str, density: float = 1.0) -> Optional[str]:
+        """Return an ``atlas://`` URI for a sprite at `density`, or None if the atlas lacks it."""
+        record = self.for_density(atlas, density)
+        if record is None or sprite not in record.sprites:
+            return None
+        base = record.path[: -len(".atlas")] if record.path.endswith(".atlas") else record.path
+        return f"atlas://{Path(base).as_posix()}/{sprite}"
+
+
+resolver = AssetResolver()
@@ -0,0 +1,142 @@
+"""Virtualized card lists built on RecycleView.
+
+Only the cards on screen (plus a small margin) exist as widgets; scrolling rebinds them to
+other data items. Card heights depend on text wrapping, so each view reports its measured
+height back to its `CardList`, which caches it per (item, width). Unmeasured items get an
+estimate from the cache, so a resize to a width seen before needs no re-measuring.
+"""
+
+import hashlib
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+from kivy.properties import ListProperty, NumericProperty, StringProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+from engdigital.wrap_label import WrapLabel
+
+
+def item_key(item: dict) -> str:
+    """Stable identity for an item, used to key its cached heights."""
+    if "key" in item:
+        return str(item["key"])
+    text = repr(sorted((k, v) for k, v in item.items() if k != "height"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class MeasuredView(RecycleDataViewBehavior):
+    """View mixin that reports its natural height to the CardList displaying it."""
+
+    index = -1
+    card_list = None
+
+    def __init__(self, **kwargs):
+        self._measure_trigger = Clock.create_trigger(self._report_height)
+        super().__init__(**kwargs)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        self.card_list = rv
+        super().refresh_view_attrs(rv, index, data)
+        # Same-size content fires no size events, so always confirm after a rebind.
+        self._measure_trigger()
+
+    def measured_height(self) -> float:
+        """Natural height of the laid-out view; subclasses measure their content."""
+        return self.height
+
+    def _report_height(self, *_args) -> None:
+        if self.card_list is not None and self.index >= 0:
+            self.card_list.remember_height(self.index, self.measured_height())
+
+
+class DetailCard(MeasuredView, BoxLayout):
+    """Card with a heading, a summary and a bullet list (layout in app.kv)."""
+
+    heading = StringProperty("")
+    summary = StringProperty("")
+    bullets = ListProperty([])
+
+    def on_minimum_height(self, *_args) -> None:
+        self._measure_trigger()
+
+    def measured_height(self) -> float:
+        return self.minimum_height
+
+
+class ListHeading(MeasuredView, WrapLabel):
+    """Section title rendered as a list row (style in app.kv)."""
+
+    def on_texture_size(self, *_args) -> None:
+        self._measure_trigger()
+
+    def measured_height(self) -> float:
+        return self.texture_size[1] + dp(8)
+
+
+class ListText(ListHeading):
+    """Body paragraph rendered as a list row (style in app.kv)."""
+
+
+class CardList(RecycleView):
+    """RecycleView fed through `items`; heights are measured once per width and cached."""
+
+    items = ListProperty([])
+    default_viewclass = StringProperty("DetailCard")
+    default_height = NumericProperty(dp(160))
+
+    def __init__(self, **kwargs):
+        self._heights: dict[tuple[str, int], float] = {}
+        self._dirty: set[int] = set()
+        self._heights_trigger = Clock.create_trigger(self._refresh_dirty)
+        super().__init__(**kwargs)
+        self.fbind("width", self._on_width)
+
+    def _width_key(self) -> int:
+        return int(round(self.width))
+
+    def estimate_height(self, key: str, previous=None) -> float:
+        width = self._width_key()
+        cached = self._heights.get((key, width))
+        if cached is not None:
+            return cached
+        if previous is not None:
+            return previous
+        at_width = [h for (_, w), h in self._heights.items() if w == width]
+        return sum(at_width) / len(at_width) if at_width else self.default_height
+
+    def on_items(self, *_args) -> None:
+        data = []
+        for item in self.items:
+            row = dict(item)
+            row.setdefault("viewclass", self.default_viewclass)
+            row["key"] = item_key(item)
+            row["height"] = self.estimate_height(row["key"])
+            data.append(row)
+        self.data = data
+
+    def _on_width(self, *_args) -> None:
+        for row in self.data:
+            row["height"] = self.estimate_height(row["key"], row.get("height"))
+        self.refresh_from_data()
+
+    def remember_height(self, index: int, height: float) -> None:
+        """Cache a view's measured height and relayout if the estimate was off."""
+        if not 0 <= index < len(self.data) or height <= 0:
+            return
+        row = self.data[index]
+        self._heights[(row["key"], self._width_key())] = height
+        if abs(row.get("height", 0) - height) >= 1:
+            row["height"] = height
+            self._dirty.add(index)
+            self._heights_trigger()
+
+    def _refresh_dirty(self, *_args) -> None:
+        if not self._dirty:
+            return
+        lo, hi = min(self._dirty), max(self._dirty)
+        self._dirty.clear()
+        if hi < len(self.data):
+            self.refresh_from_data(modified=slice(lo, hi + 1))
@@ -8,4 +8,19 @@ WHATSAPP_URL = ""
 EMAIL_ADDRESS = "contato@engenhodigitalweb.com.br"
 PRIVACY_POLICY_URL = "https://sites.google.com/view/engenhodigital/in%C3%ADcio"
 
+# Content document (same format as engdigital/content.json) refreshed in the background at
+# startup; the last downloaded copy is shown offline. None uses only the bundled file.
+# Disabled until the endpoint is published (e.g. f"{WEBSITE_URL}/app/content.json"); the APK
+# has no CA bundle, so enabling it also needs certifi in the buildozer requirements
+# (content_sync uses it when installed).
+CONTENT_URL = None
+
 SUPPORT_PHONE = "(coloque aqui o número oficial da empresa)"
+
+# Repeated taps on the same link within this many seconds open it only once.
+INTENT_COALESCE_SECONDS = 1.0
+
+# Build only the start screen at launch; the others are built on first navigation
+# or during idle time after startup. Set to False to build every screen up front.
+LAZY_SCREENS = True
+LAZY_SCREENS_IDLE_DELAY = 1.5
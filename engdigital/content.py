@@ -0,0 +1,118 @@
+"""Marketing content (services, projects, profiles, stats) loaded from one bundled JSON file.
+
+The document is parsed once per process into immutable ``__slots__`` records and memoized,
+so every screen reads the same objects. This module is standard-library only: it can be
+imported (and benchmarked by ``scripts/bench_content.py``) without Kivy.
+"""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Union
+
+CONTENT_PATH = Path(__file__).resolve().parent / "content.json"
+CONTENT_VERSION = 1
+
+
+class ContentError(ValueError):
+    """Raised when a content document is missing fields or has the wrong shape."""
+
+
+@dataclass(frozen=True, slots=True)
+class Stat:
+    value: str
+    label: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class Service:
+    title: str
+    description: str
+    summary: str
+    bullets: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    name: str
+    role: str
+    bullets: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    category: str
+    title: str
+    summary: str
+    bullets: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    stats: tuple[Stat, ...]
+    services: tuple[Service, ...]
+    profiles: tuple[Profile, ...]
+    projects: tuple[Project, ...]
+
+
+_SECTIONS = (("stats", Stat), ("services", Service), ("profiles", Profile), ("projects", Project))
+
+
+def _record(cls, raw: Any, where: str):
+    if not isinstance(raw, dict):
+        raise ContentError(f"{where}: expected an object")
+    values = {}
+    for name in cls.__slots__:
+        value = raw.get(name)
+        if name == "bullets":
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise ContentError(f"{where}.{name}: expected a list of strings")
+            value = tuple(value)
+        elif not isinstance(value, str):
+            raise ContentError(f"{where}.{name}: expected a string")
+        values[name] = value
+    return cls(**values)
+
+
+def parse_content(data: Any) -> Content:
+    """Validate a decoded content document and build its records."""
+    if not isinstance(data, dict):
+        raise ContentError("content: expected an object")
+    if data.get("version") != CONTENT_VERSION:
+        raise ContentError(f"content: unsupported version {data.get('version')!r}")
+    sections = {}
+    for name, cls in _SECTIONS:
+        items = data.get(name)
+        if not isinstance(items, list):
+            raise ContentError(f"content.{name}: expected a list")
+        sections[name] = tuple(_record(cls, item, f"content.{name}[{i}]") for i, item in enumerate(items))
+    return Content(**sections)
+
+
+def parse_content_bytes(raw: Union[bytes, str]) -> Content:
+    try:
+        data = json.loads(raw)
+    except ValueError as exc:
+        raise ContentError(f"content: invalid JSON ({exc})") from exc
+    return parse_content(data)
+
+
+@lru_cache(maxsize=None)
+def _resolve(path: Union[Path, str]) -> Path:
+    return Path(path).resolve()
+
+
+@lru_cache(maxsize=None)
+def _load_content(path: Path) -> Content:
+    return parse_content_bytes(path.read_bytes())
+
+
+def load_content(path: Union[Path, str] = CONTENT_PATH) -> Content:
+    """Parse a content file once per process (memoized per resolved path)."""
+    return _load_content(_resolve(path))
+
+
+def clear_content_cache() -> None:
+    _load_content.cache_clear()
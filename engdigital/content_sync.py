@@ -0,0 +1,163 @@
+"""Background refresh of the content document from the website, with an offline cache.
+
+At startup the app shows the last downloaded copy (or the bundled content.json) immediately
+and calls `start_refresh()`, which fetches ``config.CONTENT_URL`` on a daemon thread. Requests
+are conditional (If-None-Match / If-Modified-Since), so an unchanged document costs one 304.
+A new document is validated before it replaces the cache; network and parse errors leave
+the cached copy untouched. The cache records the URL and the digest of the bundled
+content.json it was fetched under, and is ignored once either changes (another CONTENT_URL,
+or an app update that ships newer bundled content). Standard library only, except that certifi's CA bundle is used
+when it is installed (Android builds have no system bundle Python can read).
+"""
+
+import hashlib
+import json
+import os
+import ssl
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from engdigital.content import CONTENT_PATH, Content, ContentError, parse_content_bytes
+
+DEFAULT_TIMEOUT = 10.0
+USER_AGENT = "EngenhoDigitalApp/1 (+content-sync)"
+
+
+def _ssl_context() -> ssl.SSLContext:
+    try:
+        import certifi
+    except ImportError:
+        return ssl.create_default_context()
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    status: str  # "updated", "not-modified" or "error"
+    content: Optional[Content] = None
+    error: str = ""
+
+
+def bundle_digest(path: Path = CONTENT_PATH) -> str:
+    """SHA-256 of the bundled content document ("" if it cannot be read)."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+class ContentCache:
+    """Cached document body plus its validators (ETag, Last-Modified) in one directory."""
+
+    def __init__(self, directory: Path, bundle: Path = CONTENT_PATH) -> None:
+        self.directory = Path(directory)
+        self.body_path = self.directory / "content.json"
+        self.meta_path = self.directory / "content.meta.json"
+        self.bundle = bundle_digest(bundle)
+
+    def meta(self) -> dict:
+        """Return the validators saved with the cached body ({} if none)."""
+        try:
+            data = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def valid_for(self, url: Optional[str]) -> bool:
+        """True if the cached copy was fetched from `url` by a build with the same bundled content."""
+        meta = self.meta()
+        return bool(url) and meta.get("url") == url and meta.get("bundle") == self.bundle
+
+    def load(self, url: Optional[str]) -> Optional[Content]:
+        """Return the copy cached from `url`, or None if there is none usable for this build."""
+        if not self.valid_for(url):
+            return None
+        try:
+            return parse_content_bytes(self.body_path.read_bytes())
+        except (OSError, ContentError):
+            return None
+
+    def _write(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(self.directory))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def store(self, body: bytes, etag: str, last_modified: str, url: str) -> None:
+        """Replace the cached body and its validators, each file atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Body first: a crash in between leaves old validators, which only costs a full refetch.
+        self._write(self.body_path, body)
+        meta = {"bundle": self.bundle, "etag": etag, "last_modified": last_modified, "url": url}
+        self._write(self.meta_path, json.dumps(meta, sort_keys=True).encode("utf-8"))
+
+
+def fetch_content(url: str, cache: ContentCache, timeout: float = DEFAULT_TIMEOUT) -> FetchResult:
+    """Fetch the document with conditional headers and update the cache on a 200."""
+    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+    # A copy from another URL or app build is not shown, so it is fetched again in full.
+    current = cache.body_path.exists() and cache.valid_for(url)
+    if current:
+        meta = cache.meta()
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout, context=_ssl_context()) as response:
+            body = response.read()
+            etag = response.headers.get("ETag", "")
+            last_modified = response.headers.get("Last-Modified", "")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return FetchResult("not-modified")
+        return FetchResult("error", error=f"HTTP {exc.code}")
+    except (urllib.error.URLError, OSError) as exc:
+        return FetchResult("error", error=str(getattr(exc, "reason", exc)))
+
+    try:
+        content = parse_content_bytes(body)
+    except ContentError as exc:
+        return FetchResult("error", error=str(exc))
+    try:
+        unchanged = current and cache.body_path.read_bytes() == body
+    except OSError:
+        unchanged = False
+    try:
+        cache.store(body, etag, last_modified, url)
+    except OSError as exc:
+        return FetchResult("updated", content, error=f"cache not written: {exc}")
+    # Servers without validators answer 200 every time; only a different body is an update.
+    return FetchResult("not-modified" if unchanged else "updated", None if unchanged else content)
+
+
+def start_refresh(
+    url: str,
+    cache: ContentCache,
+    on_update: Callable[[Content], None],
+    on_error: Optional[Callable[[str], None]] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> threading.Thread:
+    """Fetch on a daemon thread. Callbacks run on that thread: hand results to the UI thread."""
+
+    def run() -> None:
+        result = fetch_content(url, cache, timeout)
+        if result.status == "updated" and result.content is not None:
+            on_update(result.content)
+        if result.error and on_error is not None:
+            on_error(result.error)
+
+    thread = threading.Thread(target=run, name="content-refresh", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,139 @@
+"""Launch external links (browser, e-mail, WhatsApp) without blocking the UI thread.
+
+`webbrowser.open` can take hundreds of milliseconds on Android, and a double tap used to open
+the browser twice. Every button goes through `open_uri()` instead: the launch runs on a worker
+thread, a repeat of the same URI within `config.INTENT_COALESCE_SECONDS` (or while the first
+launch is still running) is dropped, and each launch logs how long the platform took.
+
+On Android the URI is sent as an Android intent through pyjnius; elsewhere ``mailto:`` links
+go through plyer's e-mail facade when plyer is installed and everything else through
+`webbrowser`. Standard library only at import time.
+"""
+
+import logging
+import os
+import threading
+import time
+import webbrowser
+from typing import Callable, Optional
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from engdigital import config
+
+# Kivy's Logger is the "kivy" logging logger; using it by name keeps this module Kivy-free.
+Logger = logging.getLogger("kivy")
+
+EMAIL_SUBJECT = "Contato - Engenho Digital"
+
+
+def mailto(address: str, subject: str = EMAIL_SUBJECT) -> str:
+    """Build a mailto: URI with a percent-encoded recipient and subject."""
+    return f"mailto:{quote(address)}?subject={quote(subject)}"
+
+
+def _android_launcher() -> Optional[Callable[[str], None]]:
+    if "ANDROID_ARGUMENT" not in os.environ:
+        return None
+    try:
+        import jnius
+    except ImportError:
+        return None
+    Intent = jnius.autoclass("android.content.Intent")
+    Uri = jnius.autoclass("android.net.Uri")
+    activity = jnius.autoclass("org.kivy.android.PythonActivity").mActivity
+
+    def launch(uri: str) -> None:
+        action = Intent.ACTION_SENDTO if uri.startswith("mailto:") else Intent.ACTION_VIEW
+        intent = Intent(action, Uri.parse(uri))
+        intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
+        try:
+            activity.startActivity(intent)
+        finally:
+            # Worker threads must detach from the JVM before they exit.
+            jnius.detach()
+
+    return launch
+
+
+def _desktop_launcher(uri: str) -> None:
+    if uri.startswith("mailto:"):
+        try:
+            from plyer import email
+        except ImportError:
+            pass
+        else:
+            parts = urlsplit(uri)
+            subject = parse_qs(parts.query).get("subject", [""])[0]
+            email.send(recipient=unquote(parts.path), subject=subject)
+            return
+    if not webbrowser.open(uri):
+        raise OSError("no browser available")
+
+
+def default_launcher() -> Callable[[str], None]:
+    """Android intents when running on Android, plyer/webbrowser elsewhere."""
+    return _android_launcher() or _desktop_launcher
+
+
+class IntentDispatcher:
+    """Runs launches on worker threads and coalesces repeated requests for the same URI."""
+
+    def __init__(
+        self,
+        launcher: Optional[Callable[[str], None]] = None,
+        coalesce_seconds: float = config.INTENT_COALESCE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._launcher = launcher
+        self.coalesce_seconds = coalesce_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_launch: dict[str, float] = {}
+        self._in_flight: set[str] = set()
+        self.latencies_ms: list[float] = []
+
+    @property
+    def launcher(self) -> Callable[[str], None]:
+        # Resolved on first use so importing this module never touches pyjnius.
+        if self._launcher is None:
+            self._launcher = default_launcher()
+        return self._launcher
+
+    def launch(self, uri: str) -> Optional[threading.Thread]:
+        """Start launching `uri`; returns the worker thread, or None if coalesced or empty."""
+        if not uri:
+            return None
+        now = self._clock()
+        with self._lock:
+            last = self._last_launch.get(uri)
+            if uri in self._in_flight or (last is not None and now - last < self.coalesce_seconds):
+                Logger.debug(f"Intents: ignoring repeated launch of {uri}")
+                return None
+            self._last_launch[uri] = now
+            self._in_flight.add(uri)
+        thread = threading.Thread(target=self._run, args=(uri,), name="intent-launch", daemon=True)
+        thread.start()
+        return thread
+
+    def _run(self, uri: str) -> None:
+        scheme = urlsplit(uri).scheme or "uri"
+        start = time.perf_counter()
+        try:
+            self.launcher(uri)
+        except Exception as exc:  # noqa: BLE001 - a failed launch must not kill the app
+            Logger.warning(f"Intents: could not open {scheme} link: {exc}")
+            return
+        finally:
+            with self._lock:
+                self._in_flight.discard(uri)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.latencies_ms.append(elapsed_ms)
+        Logger.info(f"Intents: opened {scheme} link in {elapsed_ms:.0f} ms")
+
+
+dispatcher = IntentDispatcher()
+
+
+def open_uri(uri: str) -> Optional[threading.Thread]:
+    """Launch `uri` through the shared dispatcher (safe to call from the UI thread)."""
+    return dispatcher.launch(uri)
@@ -0,0 +1,158 @@
+"""Precompiled cache of parsed kv rules.
+
+Parsing app.kv (tokenizing every rule and compiling each property expression) is a
+noticeable share of cold start on slow devices. The parsed `Parser` object, including its
+compiled expressions, is pickled into a `.kvc` file next to the kv file (built by
+`scripts/compile_kv.py`) or into the app's data dir on the first launch. Each cache is keyed
+by the kv text, the Kivy version and the Python bytecode magic, so any mismatch silently falls
+back to parsing the text.
+"""
+
+import copyreg
+import hashlib
+import importlib.util
+import io
+import marshal
+import os
+import pickle
+import tempfile
+import types
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Optional
+
+import kivy
+from kivy.factory import Factory
+from kivy.lang import Builder
+from kivy.lang.parser import Parser
+from kivy.logger import Logger
+
+CACHE_FORMAT = 1
+CACHE_SUFFIX = ".kvc"
+
+
+def cache_key(text: str) -> str:
+    """Key a cache to the kv source, the Kivy version and the Python bytecode format."""
+    h = hashlib.sha256()
+    h.update(f"kvc{CACHE_FORMAT}:{kivy.__version__}:".encode("utf-8"))
+    h.update(importlib.util.MAGIC_NUMBER)
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def cache_path_for(kv_path: Path, directory: Optional[Path] = None) -> Path:
+    """Return the cache file path for a kv file, optionally inside another directory."""
+    return (directory or kv_path.parent) / (kv_path.name + CACHE_SUFFIX)
+
+
+class _KvPickler(pickle.Pickler):
+    # Parsed rules hold compiled code objects, which pickle cannot handle on its own.
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[types.CodeType] = lambda code: (marshal.loads, (marshal.dumps(code),))
+
+
+def dump_parser(parser: Parser, key: str) -> bytes:
+    buf = io.BytesIO()
+    buf.write(key.encode("ascii") + b"\n")
+    _KvPickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(parser)
+    return buf.getvalue()
+
+
+def write_cache(parser: Parser, key: str, cache_path: Path) -> None:
+    """Write the cache atomically so a crash never leaves a truncated file behind."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{cache_path.name}.", dir=str(cache_path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump_parser(parser, key))
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, cache_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_cache(cache_path: Path, key: str) -> Optional[Parser]:
+    """Return the cached parser, or None if the cache is missing, stale or unreadable."""
+    try:
+        with cache_path.open("rb") as f:
+            if f.readline().rstrip(b"\n") != key.encode("ascii"):
+                return None
+            parser = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # noqa: BLE001 - a corrupt cache must never block startup
+        Logger.warning(f"KvCache: ignoring unreadable cache {cache_path}: {exc}")
+        return None
+    return parser if isinstance(parser, Parser) else None
+
+
+def compile_kv(kv_path: Path, cache_path: Optional[Path] = None) -> Path:
+    """Parse a kv file and write its cache (build step)."""
+    text = kv_path.read_text(encoding="utf-8")
+    target = cache_path or cache_path_for(kv_path)
+    write_cache(Parser(content=text, filename=str(kv_path)), cache_key(text), target)
+    return target
+
+
+def _apply_parser(parser: Parser, filename: str):
+    """Register a parsed kv file with the Builder, like `Builder.load_string` does."""
+    if filename in Builder.files:
+        Logger.warning(f"KvCache: the file {filename} is loaded multiple times")
+    Builder._current_filename = filename
+    try:
+        Builder.rules.extend(parser.rules)
+        Builder._clear_matchcache()
+        for name, cls, template in parser.templates:
+            Builder.templates[name] = (cls, template, filename)
+            Factory.register(name, cls=partial(Builder.template, name), is_template=True, warn=True)
+        for name, baseclasses in parser.dynamic_classes.items():
+            Factory.register(name, baseclasses=baseclasses, filename=filename, warn=True)
+        if parser.templates or parser.dynamic_classes or parser.rules:
+            Builder.files.append(filename)
+
+        if not parser.root:
+            return None
+        widget = Factory.get(parser.root.name)(__no_builder=True)
+        rule_children = []
+        widget.apply_class_lang_rules(root=widget, rule_children=rule_children)
+        Builder._apply_rule(widget, parser.root, parser.root, rule_children=rule_children)
+        for child in rule_children:
+            child.dispatch("on_kv_post", widget)
+        widget.dispatch("on_kv_post", widget)
+        return widget
+    finally:
+        Builder._current_filename = None
+
+
+def load_kv(kv_path: Path, cache_dirs: Iterable[Path] = (), write_dir: Optional[Path] = None):
+    """Load a kv file through the first fresh cache found, else parse it and refresh a cache.
+
+    The kv file's own directory is tried first, then `cache_dirs`, then `write_dir`. On a miss
+    the text is parsed as usual and, if `write_dir` is given, a cache is written there for the
+    next launch. Returns the root widget, if the kv file defines one.
+    """
+    text = kv_path.read_text(encoding="utf-8")
+    key = cache_key(text)
+    filename = str(kv_path)
+
+    directories = [kv_path.parent, *cache_dirs]
+    if write_dir is not None:
+        directories.append(write_dir)
+    for directory in directories:
+        cache_path = cache_path_for(kv_path, directory)
+        parser = read_cache(cache_path, key)
+        if parser is not None:
+            Logger.info(f"KvCache: loaded {kv_path.name} from {cache_path}")
+            # Directives (#:import, #:set) populate the global idmap as a side effect of parsing.
+            parser.execute_directives()
+            parser.filename = filename
+            return _apply_parser(parser, filename)
+
+    parser = Parser(content=text, filename=filename)
+    if write_dir is not None:
+        try:
+            write_cache(parser, key, cache_path_for(kv_path, write_dir))
+        except OSError as exc:
+            Logger.warning(f"KvCache: could not write cache to {write_dir}: {exc}")
+    return _apply_parser(parser, filename)
@@ -0,0 +1,72 @@
+"""ScreenManager that creates its screens on first use instead of at startup."""
+
+from typing import Callable, Optional
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import Screen, ScreenManager
+
+ScreenFactory = Callable[[], Screen]
+
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that holds screen factories and instantiates them on demand.
+
+    Only screens that were shown (or prebuilt during idle time) exist as widgets,
+    so the first frame only pays for the start screen's widget tree and textures.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories: dict[str, ScreenFactory] = {}
+        self._idle_event = None
+
+    @property
+    def pending_names(self) -> list[str]:
+        """Registered screen names that have not been built yet."""
+        return list(self._factories)
+
+    def register(self, name: str, factory: ScreenFactory) -> None:
+        """Register a screen to be built by `factory` the first time it is needed."""
+        if name in self.screen_names:
+            raise ValueError(f"Screen {name!r} is already built.")
+        self._factories[name] = factory
+
+    def is_registered(self, name: str) -> bool:
+        """Return True if the screen is built or waiting to be built."""
+        return name in self._factories or name in self.screen_names
+
+    def ensure(self, name: str) -> Optional[Screen]:
+        """Return the named screen, building it now if it is still pending."""
+        factory = self._factories.pop(name, None)
+        if factory is None:
+            return self.get_screen(name) if name in self.screen_names else None
+        screen = factory()
+        if not screen.name:
+            screen.name = name
+        self.add_widget(screen)
+        return screen
+
+    def show(self, name: str) -> bool:
+        """Build the screen if needed and make it current."""
+        if self.ensure(name) is None:
+            return False
+        self.current = name
+        return True
+
+    def build_all(self) -> None:
+        """Build every pending screen immediately (eager mode)."""
+        for name in self.pending_names:
+            self.ensure(name)
+
+    def prebuild_when_idle(self, delay: float = 1.0) -> None:
+        """Build the remaining screens one per frame once the app has settled."""
+        if self._idle_event is None and self._factories:
+            self._idle_event = Clock.schedule_once(self._prebuild_next, delay)
+
+    def _prebuild_next(self, _dt: float) -> None:
+        self._idle_event = None
+        if not self._factories:
+            return
+        self.ensure(next(iter(self._factories)))
+        if self._factories:
+            self._idle_event = Clock.schedule_once(self._prebuild_next, 0)
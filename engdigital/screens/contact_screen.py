@@ -1,12 +1,9 @@
 """Contact screen for Engenho Digital app."""
 
-import webbrowser
-from urllib.parse import quote
-
 from kivy.properties import StringProperty
 from kivy.uix.screenmanager import Screen
 
-from engdigital import config
+from engdigital import config, intents
 
 
 class ContactScreen(Screen):
@@ -20,17 +17,16 @@ class ContactScreen(Screen):
 
     def open_website(self):
         """Open company website in default browser."""
-        webbrowser.open(self.website_url)
+        intents.open_uri(self.website_url)
 
     def open_whatsapp(self):
         """Open WhatsApp link; update number before release."""
-        webbrowser.open(self.whatsapp_url)
+        intents.open_uri(self.whatsapp_url)
 
     def open_email(self):
         """Draft an email using a mailto link."""
-        mailto_url = f"mailto:{quote(self.email_address)}?subject={quote('Contato - Engenho Digital')}"
-        webbrowser.open(mailto_url)
+        intents.open_uri(intents.mailto(self.email_address))
 
     def open_privacy_policy(self):
         """Open privacy policy page in default browser."""
-        webbrowser.open(self.privacy_policy_url)
+        intents.open_uri(self.privacy_policy_url)
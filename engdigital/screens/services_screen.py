@@ -1,81 +1,25 @@
 """Services screen for Engenho Digital app."""
 
-from kivy.properties import ListProperty, StringProperty
+from kivy.properties import AliasProperty, ObjectProperty, StringProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.screenmanager import Screen
 
 
 class ServicesScreen(Screen):
-    """Simple list of offered services."""
+    """List of offered services, rendered from the content store."""
 
-    services = ListProperty(
-        [
-            {
-                "title": "Desenvolvimento de Software",
-                "description": "Aplicações web modernas em Flask, React, APIs e bancos relacionais/NoSQL.",
-            },
-            {
-                "title": "Projetos Elétricos CAD/CAM",
-                "description": "Diagramas, layouts, quadros e listas de materiais prontos para execução.",
-            },
-            {
-                "title": "Automação e Dados",
-                "description": "ETL/ELT, relatórios automatizados e pipelines para aliviar trabalho manual.",
-            },
-        ]
-    )
+    # engdigital.content.Content, bound from app.kv (app.content).
+    content = ObjectProperty(None, allownone=True)
 
-    overview = ListProperty(
-        [
-            {
-                "index": "1",
-                "title": "Software sob medida",
-                "description": "Sistemas web em Flask, React e cloud, focados em automação, dashboards e integrações.",
-            },
-            {
-                "index": "2",
-                "title": "Projetos elétricos em CAD/CAM",
-                "description": "Plantas, diagramas, quadros e detalhamento técnico para obras e indústrias.",
-            },
-            {
-                "index": "3",
-                "title": "Consultoria em dados e automação",
-                "description": "Dados para reduzir retrabalho, padronizar processos e ganhar previsibilidade.",
-            },
+    def _get_service_cards(self):
+        if self.content is None:
+            return []
+        return [
+            {"heading": f"{i}) {service.title}", "summary": service.summary, "bullets": list(service.bullets)}
+            for i, service in enumerate(self.content.services, start=1)
         ]
-    )
 
-    detailed_services = ListProperty(
-        [
-            {
-                "title": "Desenvolvimento de Software",
-                "summary": "Aplicações web modernas usando Flask, React, APIs em Python e bancos relacionais e NoSQL.",
-                "bullets": [
-                    "Sistemas internos e portais web",
-                    "Dashboards para indicadores de gestão",
-                    "Integração com serviços em nuvem e APIs",
-                ],
-            },
-            {
-                "title": "Projetos Elétricos CAD/CAM",
-                "summary": "Projetos em AutoCAD e ferramentas CAM para instalações elétricas prediais, industriais e de infraestrutura.",
-                "bullets": [
-                    "Diagramas unifilares e trifilares",
-                    "Layouts de iluminação e tomadas",
-                    "Quadros de cargas, listas de materiais e detalhamento",
-                ],
-            },
-            {
-                "title": "Automação & Dados",
-                "summary": "Modelagem de dados, automação de relatórios e criação de pipelines que aliviam o trabalho manual do dia a dia.",
-                "bullets": [
-                    "Rotinas de ETL/ELT para planilhas e bancos",
-                    "Automatização de relatórios técnicos e laudos",
-                    "Suporte para uso de inteligência artificial aplicada ao negócio",
-                ],
-            },
-        ]
-    )
+    service_cards = AliasProperty(_get_service_cards, bind=("content",), cache=True)
 
 
 class ServiceCard(BoxLayout):
@@ -0,0 +1,31 @@
+"""Team screen for Engenho Digital app."""
+
+from kivy.properties import AliasProperty, ObjectProperty
+from kivy.uix.screenmanager import Screen
+
+
+class TeamScreen(Screen):
+    """Team profiles and highlighted projects, rendered through a CardList."""
+
+    # engdigital.content.Content, bound from app.kv (app.content).
+    content = ObjectProperty(None, allownone=True)
+
+    def _get_team_cards(self):
+        if self.content is None:
+            return []
+        cards = [
+            {"heading": profile.role, "summary": profile.name, "bullets": list(profile.bullets)}
+            for profile in self.content.profiles
+        ]
+        cards.append({"viewclass": "ListHeading", "text": "Projetos em destaque"})
+        cards += [
+            {
+                "heading": f"{project.category} — {project.title}",
+                "summary": project.summary,
+                "bullets": list(project.bullets),
+            }
+            for project in self.content.projects
+        ]
+        return cards
+
+    team_cards = AliasProperty(_get_team_cards, bind=("content",), cache=True)
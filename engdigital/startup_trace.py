@@ -0,0 +1,184 @@
+"""Opt-in startup tracer that writes a Chrome-trace JSON timeline.
+
+Set ``ENGDIGITAL_STARTUP_TRACE=1`` (or to an output file path) before launching the app.
+Every import that loads new modules, the phases of ``EngenhoDigitalApp.build()`` and the first
+frame are recorded with ``time.perf_counter_ns()`` timestamps and written as a trace that
+chrome://tracing or https://ui.perfetto.dev can open. A one-line summary goes to the Kivy log.
+
+This module only uses the standard library so it can be installed before Kivy is imported.
+When the variable is unset every helper is a cheap no-op.
+"""
+
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+ENV_VAR = "ENGDIGITAL_STARTUP_TRACE"
+DEFAULT_FILENAME = "startup-trace.json"
+
+
+class StartupTracer:
+    """Collects trace events relative to the moment the tracer was created."""
+
+    def __init__(self, output: Optional[Path] = None) -> None:
+        self.output = output
+        self.events: list[dict] = []
+        self.import_ns = 0
+        self.finished = False
+        self._t0 = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._import_depth = 0
+        self._original_import = None
+
+    def _us(self, ns: int) -> float:
+        return (ns - self._t0) / 1000
+
+    def complete(self, name: str, start_ns: int, end_ns: int, cat: str = "startup", **args) -> None:
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": self._us(start_ns),
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(self, name: str, cat: str = "startup") -> None:
+        self.events.append(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "i",
+                "s": "g",
+                "ts": self._us(time.perf_counter_ns()),
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+            }
+        )
+
+    @contextmanager
+    def span(self, name: str, cat: str = "startup") -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.complete(name, start, time.perf_counter_ns(), cat)
+
+    def install_import_hook(self) -> None:
+        """Time every import statement that loads at least one new module."""
+        if self._original_import is not None:
+            return
+        original = self._original_import = builtins.__import__
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level == 0 and name in sys.modules and not fromlist:
+                return original(name, globals, locals, fromlist, level)
+            before = len(sys.modules)
+            self._import_depth += 1
+            start = time.perf_counter_ns()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                end = time.perf_counter_ns()
+                self._import_depth -= 1
+                loaded = len(sys.modules) - before
+                if loaded > 0:
+                    label = "." * level + name
+                    self.complete(f"import {label}", start, end, "import", modules=loaded)
+                    if self._import_depth == 0:
+                        self.import_ns += end - start
+
+        builtins.__import__ = timed_import
+
+    def remove_import_hook(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def phase_ms(self, name: str) -> float:
+        return sum(e.get("dur", 0) for e in self.events if e["name"] == name) / 1000
+
+    def summary(self) -> str:
+        total_ms = (time.perf_counter_ns() - self._t0) / 1e6
+        return (
+            f"first frame at {total_ms:.1f} ms "
+            f"(imports {self.import_ns / 1e6:.1f} ms, "
+            f"window {self.phase_ms('import kivy.core.window'):.1f} ms, "
+            f"build {self.phase_ms('build'):.1f} ms, "
+            f"kv {self.phase_ms('build.kv'):.1f} ms, "
+            f"screens {self.phase_ms('build.screens'):.1f} ms)"
+        )
+
+    def write(self, output: Optional[Path] = None) -> Path:
+        target = Path(output or self.output or DEFAULT_FILENAME)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "traceEvents": sorted(self.events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"python": sys.version.split()[0], "platform": sys.platform},
+        }
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, target)
+        return target
+
+
+_tracer: Optional[StartupTracer] = None
+
+
+def install(env: Optional[dict] = None) -> Optional[StartupTracer]:
+    """Start tracing if ENGDIGITAL_STARTUP_TRACE is set; call this before importing Kivy."""
+    global _tracer
+    value = (env if env is not None else os.environ).get(ENV_VAR, "").strip()
+    if not value or value == "0" or _tracer is not None:
+        return _tracer
+    output = None if value.lower() in {"1", "true", "yes"} else Path(value)
+    _tracer = StartupTracer(output)
+    _tracer.install_import_hook()
+    _tracer.instant("trace start")
+    return _tracer
+
+
+def enabled() -> bool:
+    return _tracer is not None and not _tracer.finished
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    if not enabled():
+        yield
+        return
+    with _tracer.span(name):
+        yield
+
+
+def finish(default_dir: Optional[Path] = None) -> Optional[Path]:
+    """Record the first frame, write the trace and log the summary (once)."""
+    if not enabled():
+        return None
+    tracer = _tracer
+    tracer.instant("first frame")
+    tracer.remove_import_hook()
+    tracer.finished = True
+    summary = tracer.summary()
+    output = tracer.output or (default_dir or Path.cwd()) / DEFAULT_FILENAME
+
+    from kivy.logger import Logger
+
+    try:
+        path = tracer.write(output)
+    except OSError as exc:
+        Logger.warning(f"StartupTrace: {summary}; could not write trace: {exc}")
+        return None
+    Logger.info(f"StartupTrace: {summary}; trace written to {path}")
+    return path
@@ -0,0 +1,108 @@
+"""Wrapping label whose relayouts are batched per frame and whose textures are cached by width.
+
+A plain Label with ``text_size: self.width, None`` re-renders its texture on every width
+change, and ``height: self.texture_size[1]`` then cascades through the parent layouts one
+label at a time. `WrapLabel` instead queues itself when its width changes; a single trigger
+applies the final width of every queued label in one pass before the next frame, so a resize
+or rotation renders each label once no matter how many intermediate widths it went through.
+
+Rendered textures are kept in a Kivy `Cache` category keyed by the text, every font option
+and the wrap width, so going back to a width already seen (rotating back, closing split
+screen) reuses the textures instead of rendering the text again.
+"""
+
+import weakref
+
+from kivy.cache import Cache
+from kivy.clock import Clock
+from kivy.properties import BooleanProperty
+from kivy.uix.label import Label
+
+TEXTURE_CACHE = "engdigital.wrap_label"
+TEXTURE_CACHE_LIMIT = 400
+
+Cache.register(TEXTURE_CACHE, limit=TEXTURE_CACHE_LIMIT)
+
+_pending: "weakref.WeakSet[WrapLabel]" = weakref.WeakSet()
+
+
+def _apply_pending(*_args) -> None:
+    labels = list(_pending)
+    _pending.clear()
+    for label in labels:
+        label._apply_width()
+
+
+_relayout_trigger = Clock.create_trigger(_apply_pending)
+
+
+def flush() -> None:
+    """Apply queued widths now instead of waiting for the next frame (tests, screenshots)."""
+    _relayout_trigger.cancel()
+    _apply_pending()
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class WrapLabel(Label):
+    """Label that wraps to its width; `auto_height` makes its height follow the text."""
+
+    auto_height = BooleanProperty(True)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fbind("width", self._queue_width)
+        self._queue_width()
+
+    def _queue_width(self, *_args) -> None:
+        _pending.add(self)
+        _relayout_trigger()
+
+    def _apply_width(self) -> None:
+        """Wrap to the current width and render right away, within the batch pass."""
+        width = max(self.width, 0)
+        if self.text_size[0] != width or self.text_size[1] is not None:
+            self.text_size = (width, None)
+        self._trigger_texture.cancel()
+        self.texture_update()
+
+    def texture_key(self):
+        """Cache key for the current text and options, or None if it must not be cached."""
+        if self.markup or self.text_size[0] is None:
+            return None  # markup textures carry refs/anchors; unwrapped text has no width
+        options = tuple((name, _freeze(getattr(self, name))) for name in self._font_properties)
+        return (self.disabled, options)
+
+    def texture_update(self, *largs):
+        """Reuse a cached texture when possible; render (and cache) otherwise."""
+        if self in _pending:
+            return  # the batch pass renders this label once, at its final width
+        key = self.texture_key()
+        cached = Cache.get(TEXTURE_CACHE, key) if key is not None else None
+        if cached is not None:
+            self.texture = cached.texture
+            self.texture_size = list(cached.texture.size)
+            self.is_shortened = cached.is_shortened
+            return
+        super().texture_update(*largs)
+        core = self._label
+        texture = core.texture
+        if key is None or texture is None or texture is not self.texture or texture is core.texture_1px:
+            return
+        # The core label blits later renders into the same texture when the size matches, so
+        # the cache keeps the core label (which also re-renders the texture after a GL context
+        # loss) and this widget renders through a fresh one from now on.
+        Cache.append(TEXTURE_CACHE, key, core)
+        self._label = None
+        self._create_label()
+
+    def on_texture_size(self, _instance, size) -> None:
+        """Follow the text height when `auto_height` is set."""
+        if self.auto_height:
+            self.height = size[1]
@@ -1,6 +1,11 @@
 """Entry point for the Engenho Digital Kivy application."""
 
-from engdigital.app import EngenhoDigitalApp
+from engdigital import startup_trace
+
+# No-op unless ENGDIGITAL_STARTUP_TRACE is set; must run before Kivy is imported.
+startup_trace.install()
+
+from engdigital.app import EngenhoDigitalApp  # noqa: E402
 
 
 def main() -> None:
@@ -0,0 +1,95 @@
+"""
+Benchmark the content store loader: parse time, memoized lookups and retained memory.
+
+Compares the ``__slots__`` records built by engdigital.content with the plain decoded JSON
+dicts they replace, for the bundled document and for a synthetic catalog scaled up with
+--scale (e.g. hundreds of services). Standard library only; Kivy is not imported.
+
+Usage:
+    python scripts/bench_content.py
+    python scripts/bench_content.py --scale 200 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from engdigital.content import CONTENT_PATH, clear_content_cache, load_content, parse_content_bytes  # noqa: E402
+
+
+def scaled_document(raw: bytes, scale: int) -> bytes:
+    data = json.loads(raw)
+    for section in ("services", "profiles", "projects"):
+        data[section] = [dict(item, title=f"{item.get('title', '')} #{i}") for i in range(scale) for item in data[section]]
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def time_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def retained_kib(fn: Callable[[], object]) -> float:
+    """Memory still allocated after `fn` returns, while its result is kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return size / 1024
+
+
+def bench(label: str, raw: bytes, repeat: int) -> list[tuple[str, str, float, float]]:
+    return [
+        (label, "json dicts", time_ms(lambda: json.loads(raw), repeat), retained_kib(lambda: json.loads(raw))),
+        (
+            label,
+            "slots records",
+            time_ms(lambda: parse_content_bytes(raw), repeat),
+            retained_kib(lambda: parse_content_bytes(raw)),
+        ),
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the content store loader.")
+    parser.add_argument("--repeat", type=int, default=30, help="Timed runs per case (default: 30).")
+    parser.add_argument("--scale", type=int, default=100, help="Copies of each list item in the large case.")
+    args = parser.parse_args(argv)
+
+    raw = CONTENT_PATH.read_bytes()
+    rows = bench(f"bundled ({len(raw) / 1024:.1f} KiB)", raw, args.repeat)
+    large = scaled_document(raw, args.scale)
+    rows += bench(f"x{args.scale} ({len(large) / 1024:.0f} KiB)", large, max(args.repeat // 5, 3))
+
+    cold = time_ms(lambda: (clear_content_cache(), load_content()), args.repeat)
+    load_content()
+    warm = time_ms(load_content, args.repeat) * 1000
+
+    width = max(len(row[0]) for row in rows)
+    print(f"{'document':<{width}}  {'form':<13}  {'parse ms':>9}  {'retained KiB':>12}")
+    for label, form, ms, kib in rows:
+        print(f"{label:<{width}}  {form:<13}  {ms:9.3f}  {kib:12.1f}")
+    print(f"load_content(): cold {cold:.3f} ms (read + parse), memoized {warm:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Offline benchmark suite: asset scripts, secret scan, spec parsing and app startup.
+
+Cases (each one reports the median of --repeat timed runs, taken after one untimed warm-up run):
+
+- ``generate_assets`` / ``generate_assets_cached``: ``scripts/generate_assets.py --force``, then
+  with a warm build cache.
+- ``play_store_assets`` / ``play_store_assets_cached``: the same for
+  ``scripts/generate_play_store_assets.py`` (with presplash screenshots).
+- ``capture_screenshots``: the headless capture of every app screen at the three Play
+  screenshot resolutions (``scripts/capture_screenshots.py``).
+- ``security_scan`` / ``security_scan_cached``: ``scripts/security_scan.py`` over the tracked
+  files, without and with the blob scan cache.
+- ``spec_parse``: 1000 in-process ``BuildozerSpec`` parses of buildozer.spec.
+- ``app_first_frame``: a headless ``EngenhoDigitalApp`` start, from the startup tracer install
+  (first thing the process does) to the first frame, read from the trace it writes
+  (see engdigital/startup_trace.py).
+
+The generators run in a scratch copy of the repo, so committed assets are never rewritten. The
+app runs with the remote content refresh disabled and, when there is no display, an offscreen
+SDL window. Cases whose dependencies (Pillow, Kivy) are missing are reported as skipped.
+
+Results are written as JSON and compared with a stored baseline. A case regresses when it is
+slower than the baseline by more than --threshold percent (or the per-case value in the
+baseline's "thresholds") and by more than --min-delta-ms. Timings depend on the machine:
+refresh the baseline with --update-baseline on the machine that runs the comparison.
+
+Usage:
+    python scripts/bench_suite.py
+    python scripts/bench_suite.py --only spec_parse security_scan --repeat 10
+    python scripts/bench_suite.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+DEFAULT_OUTPUT = ROOT / ".cache" / "bench" / "results.json"
+RESULTS_VERSION = 1
+
+# Copied into the scratch tree the generators run in.
+WORKSPACE_PATHS = ("assets", "engdigital", "scripts")
+SPEC_PARSES = 1000
+SUBPROCESS_TIMEOUT = 600
+
+
+class BenchError(RuntimeError):
+    pass
+
+
+class Workspace:
+    """Scratch directory shared by the cases of one suite run."""
+
+    def __init__(self, tmp: Path) -> None:
+        self.tmp = tmp
+        self._tree: Path | None = None
+
+    @property
+    def tree(self) -> Path:
+        """Copy of the repo files the generators need, created on first use."""
+        if self._tree is None:
+            tree = self.tmp / "repo"
+            for name in WORKSPACE_PATHS:
+                shutil.copytree(ROOT / name, tree / name, ignore=shutil.ignore_patterns("__pycache__"))
+            self._tree = tree
+        return self._tree
+
+
+def _run(cmd: Sequence[str], cwd: Path, env: dict[str, str] | None = None) -> float:
+    """Run a command and return its wall time in ms; a failing command aborts the case."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd, cwd=cwd, env=env, capture_output=True, text=True, errors="replace", timeout=SUBPROCESS_TIMEOUT
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        tail = "\n".join((proc.stdout + proc.stderr).strip().splitlines()[-15:])
+        raise BenchError(f"{' '.join(cmd)} exited with {proc.returncode}:\n{tail}")
+    return elapsed
+
+
+def _script(ws: Workspace, name: str, *args: str) -> float:
+    return _run([sys.executable, str(ws.tree / "scripts" / name), *args], cwd=ws.tree)
+
+
+def _security_scan(ws: Workspace, *args: str) -> float:
+    # Read-only apart from its cache, so it scans the real checkout (and its git index).
+    return _run([sys.executable, str(SCRIPTS / "security_scan.py"), *args], cwd=ROOT)
+
+
+def _capture_screenshots(ws: Workspace) -> float:
+    # Runs from the real checkout (the app needs app.kv); it only writes under --images-root.
+    script = SCRIPTS / "capture_screenshots.py"
+    return _run([sys.executable, str(script), "--images-root", str(ws.tmp / "screenshots")], cwd=ROOT)
+
+
+def _spec_parse(ws: Workspace) -> float:
+    from buildozer_spec import SPEC_PATH, BuildozerSpec
+
+    text = SPEC_PATH.read_text(encoding="utf-8")
+    start = time.perf_counter()
+    for _ in range(SPEC_PARSES):
+        BuildozerSpec(text, SPEC_PATH)
+    return (time.perf_counter() - start) * 1000
+
+
+def _app_env(ws: Workspace, trace: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env.update(
+        {
+            "ENGDIGITAL_STARTUP_TRACE": str(trace),
+            "KIVY_NO_ARGS": "1",
+            # Keep Kivy's config and the app's user_data_dir (kv cache) out of the real home.
+            "KIVY_HOME": str(ws.tmp / "kivy-home"),
+            "XDG_CONFIG_HOME": str(ws.tmp / "xdg-config"),
+        }
+    )
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("SDL_VIDEODRIVER", "offscreen")
+    return env
+
+
+def first_frame_ms(trace: Path) -> float:
+    """Time of the "first frame" instant in a startup trace, in ms since the tracer started."""
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    for event in events:
+        if event["name"] == "first frame":
+            return event["ts"] / 1000
+    raise BenchError(f"{trace} has no first frame event")
+
+
+def _app_first_frame(ws: Workspace) -> float:
+    trace = ws.tmp / "startup-trace.json"
+    trace.unlink(missing_ok=True)
+    _run([sys.executable, str(Path(__file__).resolve()), "--app-child"], cwd=ROOT, env=_app_env(ws, trace))
+    if not trace.is_file():
+        raise BenchError("the app exited without writing a startup trace")
+    return first_frame_ms(trace)
+
+
+def _app_child() -> None:
+    """Start the app headless and stop it right after its first frame (runs in a subprocess)."""
+    sys.path.insert(0, str(ROOT))
+    from engdigital import startup_trace
+
+    startup_trace.install()
+
+    from engdigital import config
+    from engdigital.app import EngenhoDigitalApp
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+
+    config.CONTENT_URL = ""  # offline: no background refresh
+    app = EngenhoDigitalApp()
+    Window.bind(on_flip=lambda *_args: Clock.schedule_once(lambda _dt: app.stop()))
+    app.run()
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    sample: Callable[[Workspace], float]  # one timed run, in ms
+    requires: tuple[str, ...] = ()  # importable modules
+
+
+CASES: tuple[Case, ...] = (
+    Case("generate_assets", lambda ws: _script(ws, "generate_assets.py", "--force"), ("PIL",)),
+    Case("generate_assets_cached", lambda ws: _script(ws, "generate_assets.py"), ("PIL",)),
+    Case(
+        "play_store_assets",
+        lambda ws: _script(ws, "generate_play_store_assets.py", "--force", "--screenshots", "presplash"),
+        ("PIL",),
+    ),
+    Case(
+        "play_store_assets_cached",
+        lambda ws: _script(ws, "generate_play_store_assets.py", "--screenshots", "presplash"),
+        ("PIL",),
+    ),
+    Case("capture_screenshots", _capture_screenshots, ("kivy", "PIL")),
+    Case("security_scan", lambda ws: _security_scan(ws, "--no-cache")),
+    Case("security_scan_cached", lambda ws: _security_scan(ws, "--cache-path", str(ws.tmp / "security-scan.json"))),
+    Case("spec_parse", _spec_parse),
+    Case("app_first_frame", _app_first_frame, ("kivy", "PIL")),
+)
+
+
+def missing_requirement(case: Case) -> str | None:
+    for module in case.requires:
+        if importlib.util.find_spec(module) is None:
+            return f"{module} is not installed"
+    return None
+
+
+def run_case(case: Case, ws: Workspace, repeat: int) -> dict:
+    case.sample(ws)  # warm-up: fills caches and the OS page cache
+    samples = [case.sample(ws) for _ in range(repeat)]
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "samples_ms": [round(sample, 3) for sample in samples],
+    }
+
+
+def machine_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(terse=True),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count() or 1,
+    }
+
+
+def run_suite(cases: Sequence[Case], repeat: int, write: Callable[[str], None] = print) -> dict:
+    results: dict = {"version": RESULTS_VERSION, "machine": machine_info(), "repeat": repeat, "cases": {}, "skipped": {}}
+    with tempfile.TemporaryDirectory(prefix="engdigital-bench-") as tmp:
+        ws = Workspace(Path(tmp))
+        for case in cases:
+            reason = missing_requirement(case)
+            if reason:
+                results["skipped"][case.name] = reason
+                write(f"{case.name}: skipped ({reason})")
+                continue
+            try:
+                results["cases"][case.name] = run_case(case, ws, repeat)
+            except (BenchError, OSError, subprocess.TimeoutExpired) as exc:
+                raise SystemExit(f"Benchmark {case.name} failed: {exc}") from exc
+            write(f"{case.name}: {results['cases'][case.name]['median_ms']:.1f} ms")
+    return results
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    current_ms: float
+    baseline_ms: float | None
+    threshold: float  # percent
+    min_delta_ms: float
+
+    @property
+    def change(self) -> float | None:
+        """Percent change from the baseline (positive means slower)."""
+        if not self.baseline_ms:
+            return None
+        return 100 * (self.current_ms - self.baseline_ms) / self.baseline_ms
+
+    @property
+    def regressed(self) -> bool:
+        if self.baseline_ms is None:
+            return False
+        delta = self.current_ms - self.baseline_ms
+        return delta > self.min_delta_ms and delta > self.baseline_ms * self.threshold / 100
+
+
+def compare(results: dict, baseline: dict | None, threshold: float, min_delta_ms: float) -> list[Comparison]:
+    """Compare each measured case with the baseline; cases the baseline lacks are new, not regressions."""
+    baseline = baseline or {}
+    previous = baseline.get("cases", {})
+    thresholds = baseline.get("thresholds", {})
+    return [
+        Comparison(
+            name=name,
+            current_ms=case["median_ms"],
+            baseline_ms=previous[name]["median_ms"] if name in previous else None,
+            threshold=float(thresholds.get(name, threshold)),
+            min_delta_ms=min_delta_ms,
+        )
+        for name, case in results["cases"].items()
+    ]
+
+
+def print_comparison(comparisons: Sequence[Comparison], write: Callable[[str], None] = print) -> None:
+    if not comparisons:
+        return
+    width = max(len(c.name) for c in comparisons)
+    write(f"{'case':<{width}}  {'baseline':>11}  {'current':>11}  {'change':>8}  status")
+    for c in comparisons:
+        baseline = f"{c.baseline_ms:9.1f} ms" if c.baseline_ms is not None else f"{'-':>11}"
+        change = f"{c.change:+7.1f}%" if c.change is not None else f"{'-':>8}"
+        if c.baseline_ms is None:
+            status = "new"
+        elif c.regressed:
+            status = f"REGRESSION (> {c.threshold:g}%)"
+        else:
+            status = "ok"
+        write(f"{c.name:<{width}}  {baseline}  {c.current_ms:8.1f} ms  {change}  {status}")
+
+
+def load_json(path: Path) -> dict | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except ValueError as exc:
+        raise SystemExit(f"Invalid JSON in {path.as_posix()}: {exc}") from exc
+    if data.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{path.as_posix()} has version {data.get('version')!r}, expected {RESULTS_VERSION}")
+    return data
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def updated_baseline(results: dict, baseline: dict | None) -> dict:
+    """Results as the new baseline; cases not run this time and per-case thresholds are kept."""
+    data = {key: results[key] for key in ("version", "machine", "repeat")}
+    data["cases"] = {**(baseline or {}).get("cases", {}), **results["cases"]}
+    if baseline and baseline.get("thresholds"):
+        data["thresholds"] = baseline["thresholds"]
+    return data
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite and compare it with a baseline.")
+    parser.add_argument("--only", nargs="+", choices=[case.name for case in CASES], help="Run only these cases.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3).")
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT, help="Results JSON (default: .cache/bench/results.json)."
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON (default: benchmarks/baseline.json)."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=25.0,
+        help="Allowed slowdown in percent before a case counts as a regression (default: 25).",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=2.0,
+        help="Ignore slowdowns smaller than this many ms, whatever the percentage (default: 2).",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline.")
+    parser.add_argument("--app-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.app_child:
+        _app_child()
+        return
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    cases = [case for case in CASES if not args.only or case.name in args.only]
+    baseline = load_json(args.baseline)
+    results = run_suite(cases, args.repeat)
+    write_json(args.output, results)
+    print(f"Results written to {args.output.as_posix()}")
+
+    comparisons = compare(results, baseline, args.threshold, args.min_delta_ms)
+    print_comparison(comparisons)
+    if args.update_baseline:
+        write_json(args.baseline, updated_baseline(results, baseline))
+        print(f"Baseline updated: {args.baseline.as_posix()}")
+        return
+    if baseline is None:
+        print(f"No baseline at {args.baseline.as_posix()}; create one with --update-baseline.")
+        return
+    regressed = [c.name for c in comparisons if c.regressed]
+    if regressed:
+        raise SystemExit(f"Performance regression in: {', '.join(regressed)}")
+
+
+if __name__ == "__main__":
+    main()
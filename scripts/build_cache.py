@@ -0,0 +1,114 @@
+"""
+Content-hashed build cache shared by the asset generator scripts.
+
+Each output is recorded in a JSON manifest together with a key derived from everything that
+went into it (renderer source code, render parameters, source image digests). On the next run
+an output whose key is unchanged and whose file still matches the recorded digest is reused
+instead of being rendered and rewritten.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / ".cache" / "asset-build.json"
+
+_CHUNK = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def input_key(*, code: Iterable[Path] = (), params: object = None, sources: Iterable[Path] = ()) -> str:
+    """Hash renderer code, JSON-serializable parameters and source files into one key."""
+    h = hashlib.sha256()
+    for label, paths in (("code", code), ("source", sources)):
+        for path in paths:
+            h.update(f"{label}:{path.name}:{file_digest(path)}\n".encode("utf-8"))
+    h.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+class BuildCache:
+    def __init__(self, root: Path, path: Path = DEFAULT_CACHE_PATH, *, force: bool = False) -> None:
+        self.root = root
+        self.path = path
+        self.force = force
+        self.rebuilt: list[str] = []
+        self.reused: list[str] = []
+        self._entries: dict[str, dict] = {}
+        if path.is_file():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self._entries = data.get("outputs", {})
+
+    def _output_matches(self, output: str, entry: dict) -> bool:
+        path = self.root / output
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if st.st_size != entry.get("size"):
+            return False
+        if st.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+        # Touched but maybe not changed (e.g. fresh checkout): fall back to the content digest.
+        if file_digest(path) != entry.get("digest"):
+            return False
+        entry["mtime_ns"] = st.st_mtime_ns
+        return True
+
+    def is_fresh(self, output: str, key: str) -> bool:
+        if self.force:
+            return False
+        entry = self._entries.get(output)
+        if entry is None or entry.get("key") != key:
+            return False
+        if not self._output_matches(output, entry):
+            return False
+        self.reused.append(output)
+        return True
+
+    def record(self, output: str, key: str) -> None:
+        path = self.root / output
+        st = path.stat()
+        self._entries[output] = {
+            "key": key,
+            "digest": file_digest(path),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        self.rebuilt.append(output)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(
+            json.dumps({"version": CACHE_VERSION, "outputs": self._entries}, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+    def print_summary(self) -> None:
+        try:
+            cache_label = self.path.relative_to(self.root).as_posix()
+        except ValueError:
+            cache_label = self.path.as_posix()
+        print(f"Rebuilt {len(self.rebuilt)}, reused {len(self.reused)} (cache: {cache_label})")
+        for output in self.rebuilt:
+            print(f"  rebuilt  {output}")
+        for output in self.reused:
+            print(f"  reused   {output}")
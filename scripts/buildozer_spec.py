@@ -0,0 +1,212 @@
+"""
+Single-pass, round-trip-safe model of buildozer.spec shared by the CI scripts and tests.
+
+The file is parsed once into its raw lines plus an index of (section, key) -> line number, so
+lookups are dict hits and edits replace a single line in place. Comments, blank lines, ordering
+and the trailing newline are preserved exactly; `render()` of an unedited spec returns the
+original text. `load()` caches one parse per path per process (invalidated when the file
+changes on disk), and `write()` replaces the file atomically.
+
+CLI (used by CI to patch SDK/NDK paths):
+    python scripts/buildozer_spec.py get package.domain
+    python scripts/buildozer_spec.py set android.sdk_path=/opt/sdk android.ndk_path=/opt/ndk
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import os
+import re
+import tempfile
+from pathlib import Path
+
+SPEC_PATH = Path(__file__).resolve().parents[1] / "buildozer.spec"
+
+_SECTION_RE = re.compile(r"^\[(?P<name>[^\]]+)\]\s*$")
+_KEY_RE = re.compile(r"^(?P<key>[^#;\s=][^=]*?)\s*=\s*(?P<value>.*?)\s*$")
+
+
+class BuildozerSpec:
+    def __init__(self, text: str, path: Path | None = None) -> None:
+        self.path = path
+        self._newline = "\r\n" if "\r\n" in text else "\n"
+        self._trailing_newline = text.endswith(self._newline)
+        body = text[: -len(self._newline)] if self._trailing_newline else text
+        self.lines: list[str] = body.split(self._newline) if body else []
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """One pass over the lines: section spans and (section, key) -> line index."""
+        self._keys: dict[tuple[str, str], int] = {}
+        self._sections: dict[str, list[int]] = {}  # name -> [header index, end index (exclusive)]
+        current: str | None = None
+        for i, raw in enumerate(self.lines):
+            line = raw.strip()
+            match = _SECTION_RE.match(line)
+            if match:
+                if current is not None:
+                    self._sections[current][1] = i
+                current = match.group("name").strip()
+                self._sections.setdefault(current, [i, len(self.lines)])
+                continue
+            if current is None or raw[:1].isspace():
+                continue
+            match = _KEY_RE.match(line)
+            if match:
+                # Like configparser, the last assignment wins.
+                self._keys[(current, match.group("key"))] = i
+        if current is not None:
+            self._sections[current][1] = len(self.lines)
+
+    @property
+    def sections(self) -> list[str]:
+        return list(self._sections)
+
+    def get(self, key: str, default: str | None = None, section: str = "app") -> str | None:
+        index = self._keys.get((section, key))
+        if index is None:
+            return default
+        match = _KEY_RE.match(self.lines[index].strip())
+        assert match is not None
+        return match.group("value")
+
+    def requirement_version(self, package: str) -> str | None:
+        """Version pinned as ``package==X`` in the app requirements, or None if unpinned."""
+        for requirement in (self.get("requirements") or "").split(","):
+            name, sep, version = requirement.strip().partition("==")
+            if sep and name.strip().lower() == package.lower():
+                return version.strip()
+        return None
+
+    def get_list(self, key: str, section: str = "app") -> list[str]:
+        """Comma-separated value as a list of stripped, non-empty items."""
+        return [item.strip() for item in (self.get(key, section=section) or "").split(",") if item.strip()]
+
+    def packages(self, relative: str) -> bool:
+        """
+        Whether buildozer copies `relative` (a path under source.dir) into the app package.
+
+        Mirrors the source.* filters: excluded extensions, directories and patterns win; otherwise the
+        file must have an included extension (all when none are listed) or match an include pattern.
+        """
+        relative = relative.replace("\\", "/")
+        ext = Path(relative).suffix[1:].lower()
+        if ext in {e.lower() for e in self.get_list("source.exclude_exts")}:
+            return False
+        for directory in self.get_list("source.exclude_dirs"):
+            directory = directory.strip("/")
+            if relative == directory or relative.startswith(directory + "/"):
+                return False
+        if any(fnmatch.fnmatch(relative, pattern) for pattern in self.get_list("source.exclude_patterns")):
+            return False
+        include_exts = {e.lower() for e in self.get_list("source.include_exts")}
+        if not include_exts or ext in include_exts:
+            return True
+        return any(fnmatch.fnmatch(relative, pattern) for pattern in self.get_list("source.include_patterns"))
+
+    def __contains__(self, key: str) -> bool:
+        return ("app", key) in self._keys
+
+    def section(self, name: str = "app") -> dict[str, str]:
+        return {key: self.get(key, section=name) or "" for (sec, key) in self._keys if sec == name}
+
+    def set(self, key: str, value: str, section: str = "app") -> None:
+        """Replace the key's line in place, or append it after the section's last assignment."""
+        line = f"{key} = {value}"
+        index = self._keys.get((section, key))
+        if index is not None:
+            self.lines[index] = line
+            return
+
+        span = self._sections.get(section)
+        if span is None:
+            if self.lines and self.lines[-1].strip():
+                self.lines.append("")
+            self.lines += [f"[{section}]", line]
+        else:
+            header, _ = span
+            last_key = max((i for (sec, _), i in self._keys.items() if sec == section), default=header)
+            self.lines.insert(last_key + 1, line)
+        self._reindex()
+
+    def remove(self, key: str, section: str = "app") -> bool:
+        index = self._keys.get((section, key))
+        if index is None:
+            return False
+        del self.lines[index]
+        self._reindex()
+        return True
+
+    def render(self) -> str:
+        text = self._newline.join(self.lines)
+        return text + self._newline if self._trailing_newline else text
+
+    def write(self, path: Path | None = None) -> None:
+        target = Path(path or self.path or SPEC_PATH)
+        fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", dir=str(target.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(self.render())
+            if target.exists():
+                os.chmod(tmp, target.stat().st_mode & 0o777)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        resolved = target.resolve()
+        st = resolved.stat()
+        _CACHE[str(resolved)] = ((st.st_mtime_ns, st.st_size), self)
+
+
+_CACHE: dict[str, tuple[tuple[int, int], BuildozerSpec]] = {}
+
+
+def load(path: Path | str = SPEC_PATH) -> BuildozerSpec:
+    """Parse `path` once per process; re-parse only if the file changed on disk."""
+    resolved = Path(path).resolve()
+    st = resolved.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(str(resolved))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    spec = BuildozerSpec(resolved.read_text(encoding="utf-8"), resolved)
+    _CACHE[str(resolved)] = (stamp, spec)
+    return spec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Read or edit buildozer.spec keys in place.")
+    parser.add_argument("--spec", default=str(SPEC_PATH), help="Path to buildozer.spec (default: repo root).")
+    parser.add_argument("--section", default="app", help="Section to read/edit (default: app).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    get_cmd = sub.add_parser("get", help="Print a key's value.")
+    get_cmd.add_argument("key")
+    set_cmd = sub.add_parser("set", help="Set one or more key=value pairs and write the file atomically.")
+    set_cmd.add_argument("assignments", nargs="+", metavar="key=value")
+    args = parser.parse_args()
+
+    spec_path = Path(args.spec)
+    if not spec_path.is_file():
+        raise SystemExit(f"{spec_path.as_posix()} not found.")
+    spec = load(spec_path)
+
+    if args.command == "get":
+        value = spec.get(args.key, section=args.section)
+        if value is None:
+            raise SystemExit(f"Missing [{args.section}] {args.key} in {spec_path.as_posix()}")
+        print(value)
+        return
+
+    for assignment in args.assignments:
+        key, sep, value = assignment.partition("=")
+        if not sep or not key.strip():
+            raise SystemExit(f"Expected key=value, got: {assignment!r}")
+        spec.set(key.strip(), value.strip(), section=args.section)
+    spec.write()
+    for assignment in args.assignments:
+        print(f"Patched {spec_path.name}: [{args.section}] {assignment.partition('=')[0].strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Capture Play Store screenshots of the real app screens, headless, in one process.
+
+The app is started once (offscreen SDL window when there is no display). For each device
+class, `Metrics.density` is set, a fresh screen manager is built with the app's own
+`build_screen_manager()` (kv `dp()` values are evaluated when widgets are created, so the
+layout matches that density) and sized to the device resolution. Each screen is then shown
+with `show()`, the same path `app.go()` takes, and its widget tree is rendered into an FBO
+and read back. Every capture shares the same GL context, so a full set takes seconds.
+
+Outputs go to ``<images-root>/<folder>/<n>.png``, one file per screen in navigation order,
+saved as 24-bit PNGs (Play listing images must not use palettes or transparency). The app
+runs with the bundled content (no website refresh, isolated user data dir) so captures are
+reproducible.
+
+Usage:
+    python scripts/capture_screenshots.py
+    python scripts/capture_screenshots.py --devices phoneScreenshots --profile fast
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_IMAGES_ROOT = ROOT / "fastlane" / "metadata" / "android" / "pt-BR" / "images"
+
+# Screen names in the order the screenshots are numbered (must match engdigital.app.SCREENS).
+SCREENS = ("inicio", "servicos", "equipe", "contato")
+# After showing a screen, wait until triggered layouts, label relayouts and RecycleView
+# population stop changing the widget tree (same geometry for two frames in a row).
+MIN_SETTLE_FRAMES = 2
+MAX_SETTLE_FRAMES = 60
+
+
+@dataclass(frozen=True)
+class Device:
+    folder: str  # fastlane images subfolder
+    size: tuple[int, int]  # pixels (portrait)
+    density: float  # px per dp
+
+    def outputs(self, images_root: Path) -> list[Path]:
+        return [images_root / self.folder / f"{index}.png" for index, _ in enumerate(SCREENS, 1)]
+
+
+DEVICES: tuple[Device, ...] = (
+    Device("phoneScreenshots", (1080, 1920), 2.625),  # 411x731 dp
+    Device("sevenInchScreenshots", (1200, 1920), 2.0),  # 600x960 dp
+    Device("tenInchScreenshots", (1600, 2560), 2.0),  # 800x1280 dp
+)
+
+
+def _prepare_environment(data_dir: Path) -> None:
+    """Must run before Kivy is imported."""
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    if not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
+        os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+    # user_data_dir (content and kv caches) lives here, so previously downloaded content is not used.
+    os.environ["XDG_CONFIG_HOME"] = str(data_dir)
+
+
+def layout_signature(widget) -> tuple:
+    """Geometry of every widget in the tree; equal signatures mean the layout has settled."""
+    return tuple((type(w).__name__, tuple(w.pos), tuple(w.size)) for w in widget.walk(restrict=True))
+
+
+def capture(devices: tuple[Device, ...], images_root: Path, profile: str = "smallest") -> list[tuple[Path, float]]:
+    """Boot the app once and write every screenshot; returns (output, capture ms) pairs."""
+    with tempfile.TemporaryDirectory(prefix="engdigital-capture-") as data_dir:
+        _prepare_environment(Path(data_dir))
+        return _run_app(devices, images_root, profile)
+
+
+def _run_app(devices: tuple[Device, ...], images_root: Path, profile: str) -> list[tuple[Path, float]]:
+    sys.path.insert(0, str(ROOT))
+    from kivy.config import Config
+
+    Config.set("graphics", "window_state", "hidden")
+
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+    from kivy.metrics import Metrics
+    from kivy.uix.screenmanager import NoTransition
+    from PIL import Image
+
+    from engdigital import config, wrap_label
+    from engdigital.app import EngenhoDigitalApp
+    from engdigital.asset_resolver import resolver as assets
+    from image_compression import PROFILES, compress_file
+
+    config.CONTENT_URL = ""  # bundled content only
+    app = EngenhoDigitalApp()
+    written: list[tuple[Path, float]] = []
+    errors: list[BaseException] = []
+
+    def save(widget, out: Path) -> None:
+        texture = widget.export_as_image().texture
+        shot = Image.frombytes("RGBA", texture.size, texture.pixels)
+        background = Image.new("RGBA", shot.size, tuple(round(c * 255) for c in Window.clearcolor))
+        out.parent.mkdir(parents=True, exist_ok=True)
+        # Staged and moved into place: `out` may be a hardlink shared with other screenshots
+        # (presplash copies placed by generate_play_store_assets.py), which must not be written through.
+        tmp = out.with_name(f".{out.name}.tmp")
+        Image.alpha_composite(background, shot).convert("RGB").save(tmp, format="PNG")
+        compress_file(tmp, PROFILES[profile], truecolor_only=True)
+        os.replace(tmp, out)
+
+    def steps():
+        for device in devices:
+            Metrics.density = device.density
+            app.logo_source = assets.atlas_uri("ui", "logo", device.density) or app.logo_source
+            manager = app.build_screen_manager()
+            manager.transition = NoTransition()
+            manager.size_hint = (None, None)
+            manager.size = device.size
+            for name, out in zip(SCREENS, device.outputs(images_root)):
+                start = time.perf_counter()
+                if not manager.show(name):
+                    raise SystemExit(f"Screen {name!r} is not registered by the app.")
+                previous = None
+                for frame in range(MAX_SETTLE_FRAMES):
+                    wrap_label.flush()
+                    signature = layout_signature(manager)
+                    if frame >= MIN_SETTLE_FRAMES and signature == previous:
+                        break
+                    previous = signature
+                    yield
+                save(manager, out)
+                written.append((out, (time.perf_counter() - start) * 1000))
+
+    pending = steps()
+
+    def tick(_dt) -> None:
+        try:
+            next(pending)
+        except StopIteration:
+            app.stop()
+            return
+        except BaseException as exc:  # surfaced after the loop exits
+            errors.append(exc)
+            app.stop()
+            return
+        Clock.schedule_once(tick, 0)
+
+    Clock.schedule_once(tick, 0)
+    app.run()
+    if errors:
+        raise errors[0]
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Capture Play Store screenshots of the app screens, headless.")
+    parser.add_argument(
+        "--images-root",
+        type=Path,
+        default=DEFAULT_IMAGES_ROOT,
+        help="Fastlane images folder (default: fastlane/metadata/android/pt-BR/images).",
+    )
+    parser.add_argument(
+        "--devices",
+        nargs="+",
+        choices=[device.folder for device in DEVICES],
+        help="Device classes to capture (default: all).",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=("fast", "smallest"),
+        default="smallest",
+        help="Compression profile, lossless only (see scripts/image_compression.py; default: smallest, as committed).",
+    )
+    args = parser.parse_args(argv)
+
+    devices = tuple(device for device in DEVICES if not args.devices or device.folder in args.devices)
+    start = time.perf_counter()
+    written = capture(devices, args.images_root.resolve(), args.profile)
+    for out, elapsed in written:
+        print(f"{out.as_posix()}  {elapsed:8.1f} ms")
+    print(f"Captured {len(written)} screenshot(s) in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
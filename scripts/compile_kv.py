@@ -0,0 +1,74 @@
+"""
+Precompile app.kv into the cached rule file bundled with the app (app.kv.kvc).
+
+The cache is only valid for the Kivy version and Python bytecode format it was built with, so
+it must be built with the Kivy version the APK ships: the one pinned as ``kivy==X`` in the
+buildozer.spec requirements. Both modes exit with an error if the installed Kivy differs (CI
+installs the pinned version before running this). A stale or mismatched cache is ignored at
+runtime and the app falls back to parsing app.kv.
+
+Usage:
+    python scripts/compile_kv.py
+    python scripts/compile_kv.py --check   # exit 1 if the cache is missing or stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+
+import kivy  # noqa: E402
+
+from buildozer_spec import SPEC_PATH, load  # noqa: E402
+from engdigital.kv_cache import cache_key, cache_path_for, compile_kv, read_cache  # noqa: E402
+
+
+def check_kivy_version(spec_path: Path) -> None:
+    """Exit unless the installed Kivy is the version buildozer.spec pins for the APK."""
+    pinned = load(spec_path).requirement_version("kivy")
+    if pinned is None:
+        raise SystemExit(f"Pin kivy==<version> in the requirements of {spec_path.name}; the cache is keyed to it.")
+    if pinned != kivy.__version__:
+        raise SystemExit(
+            f"Installed Kivy {kivy.__version__} does not match kivy=={pinned} in {spec_path.name}; "
+            "the APK would ignore this cache."
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompile kv rules into a bundled cache.")
+    parser.add_argument("--kv", type=Path, default=ROOT / "app.kv", help="kv file (default: app.kv).")
+    parser.add_argument("--output", type=Path, help="Cache path (default: <kv>.kvc next to the kv file).")
+    parser.add_argument("--check", action="store_true", help="Only verify that the cache is fresh.")
+    parser.add_argument("--spec", type=Path, default=SPEC_PATH, help="buildozer.spec pinning the Kivy version.")
+    args = parser.parse_args(argv)
+
+    check_kivy_version(args.spec)
+
+    kv_path = args.kv.resolve()
+    if not kv_path.is_file():
+        raise SystemExit(f"{kv_path} not found.")
+    output = args.output or cache_path_for(kv_path)
+
+    if args.check:
+        key = cache_key(kv_path.read_text(encoding="utf-8"))
+        if read_cache(output, key) is None:
+            print(f"STALE: {output.name} does not match {kv_path.name}")
+            return 1
+        print(f"OK: {output.name} is fresh")
+        return 0
+
+    target = compile_kv(kv_path, output)
+    print(f"Wrote {target.name} ({target.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,30 +2,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from buildozer_spec import load
+
 
 def main() -> None:
     spec_path = Path("buildozer.spec")
     if not spec_path.exists():
         raise SystemExit("buildozer.spec not found.")
 
-    domain = ""
-    name = ""
-    in_app = False
-
-    for raw in spec_path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            in_app = line == "[app]"
-            continue
-        if not in_app or "=" not in line:
-            continue
-        key, value = [x.strip() for x in line.split("=", 1)]
-        if key == "package.domain":
-            domain = value
-        elif key == "package.name":
-            name = value
+    spec = load(spec_path)
+    domain = spec.get("package.domain", "")
+    name = spec.get("package.name", "")
 
     if not domain or not name:
         raise SystemExit("Could not detect package.domain/package.name in buildozer.spec")
@@ -35,4 +22,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,153 @@
+"""
+System font discovery and memoized font/text-metric lookups for the asset generators.
+
+The system font directories are scanned once per process and indexed by (family, weight), so
+asking for "Arial bold" or "DejaVu Sans regular" is a dict lookup. `FreeTypeFont` objects are
+memoized per (path, size) and text bounding boxes per (font, text), which keeps repeated asset
+renders from re-probing the disk or re-parsing font files.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import ImageDraw, ImageFont
+
+FONT_EXTS = {".ttf", ".otf", ".ttc"}
+
+# Brand fonts first (macOS/Windows), then metric-compatible or close Linux equivalents for CI.
+PREFERRED_FAMILIES = (
+    "Arial",
+    "Helvetica",
+    "Verdana",
+    "Liberation Sans",
+    "Arimo",
+    "DejaVu Sans",
+    "Noto Sans",
+    "FreeSans",
+)
+
+REGULAR = "regular"
+BOLD = "bold"
+
+_REGULAR_STYLES = {"", "regular", "book", "roman", "normal"}
+_SUFFIX_STYLE_RE = re.compile(r"^(?P<family>.+?)(?P<style>bold|bd)$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class FontFace:
+    path: str
+    family: str
+    weight: str
+
+
+def _family_key(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def font_dirs() -> list[Path]:
+    home = Path.home()
+    dirs: list[Path] = []
+    extra = os.getenv("ASSET_FONT_DIRS", "")
+    dirs.extend(Path(p) for p in extra.split(os.pathsep) if p)
+    if sys.platform == "darwin":
+        dirs += [Path("/System/Library/Fonts"), Path("/Library/Fonts"), home / "Library" / "Fonts"]
+    elif sys.platform.startswith("win"):
+        dirs.append(Path(os.getenv("WINDIR", r"C:\Windows")) / "Fonts")
+        if os.getenv("LOCALAPPDATA"):
+            dirs.append(Path(os.environ["LOCALAPPDATA"]) / "Microsoft" / "Windows" / "Fonts")
+    else:
+        data_home = Path(os.getenv("XDG_DATA_HOME", str(home / ".local" / "share")))
+        dirs += [Path("/usr/share/fonts"), Path("/usr/local/share/fonts"), data_home / "fonts", home / ".fonts"]
+    return dirs
+
+
+def classify_font_file(path: Path) -> FontFace | None:
+    """Derive (family, weight) from a font file name; italic and unusual weights are skipped."""
+    stem = path.stem
+    family, sep, style = stem.partition("-")
+    if not sep:
+        family, sep, style = stem.rpartition(" ")
+        if not sep:
+            family, style = stem, ""
+    if not style:
+        match = _SUFFIX_STYLE_RE.match(family)
+        if match:
+            family, style = match.group("family"), "bold"
+
+    style_key = _family_key(style)
+    if style_key in _REGULAR_STYLES:
+        weight = REGULAR
+    elif style_key in {"bold", "bd"}:
+        weight = BOLD
+    else:
+        return None
+    return FontFace(path=str(path), family=_family_key(family), weight=weight)
+
+
+@lru_cache(maxsize=None)
+def font_index() -> dict[tuple[str, str], FontFace]:
+    index: dict[tuple[str, str], FontFace] = {}
+    for root in font_dirs():
+        if not root.is_dir():
+            continue
+        for dirpath, _, filenames in os.walk(root):
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                if path.suffix.lower() not in FONT_EXTS:
+                    continue
+                face = classify_font_file(path)
+                if face is not None:
+                    # Earlier directories win (user overrides, then system).
+                    index.setdefault((face.family, face.weight), face)
+    return index
+
+
+@lru_cache(maxsize=None)
+def find_font_path(bold: bool = False, families: tuple[str, ...] = PREFERRED_FAMILIES) -> str | None:
+    index = font_index()
+    weights = (BOLD, REGULAR) if bold else (REGULAR,)
+    for weight in weights:
+        for family in families:
+            face = index.get((_family_key(family), weight))
+            if face is not None:
+                return face.path
+    return None
+
+
+@lru_cache(maxsize=None)
+def truetype(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size=size)
+
+
+@lru_cache(maxsize=None)
+def default_font() -> ImageFont.ImageFont:
+    return ImageFont.load_default()
+
+
+def load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    path = find_font_path(bold)
+    if path is not None:
+        try:
+            return truetype(path, size)
+        except OSError:
+            pass
+    return default_font()
+
+
+_bbox_cache: dict[tuple[object, str, str], tuple[int, int, int, int]] = {}
+
+
+def text_bbox(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
+    font_path = getattr(font, "path", None)
+    font_key = (font_path, font.size) if isinstance(font_path, str) else id(font)
+    key = (font_key, text, draw.fontmode)
+    bbox = _bbox_cache.get(key)
+    if bbox is None:
+        bbox = _bbox_cache[key] = draw.textbbox((0, 0), text, font=font)
+    return bbox
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
+from typing import Callable, Sequence
 
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 
+import buildozer_spec
+import font_index
+import image_compression
+from build_cache import BuildCache, input_key
+from font_index import find_font_path, load_font, text_bbox
+from image_compression import PROFILES, CompressionResult, compress_file, print_report
+
 ROOT = Path(__file__).resolve().parents[1]
-IMAGES_DIR = ROOT / "assets" / "images"
-STORE_DIR = ROOT / "assets" / "store"
-SCREEN_DIR = STORE_DIR / "screenshots"
+sys.path.insert(0, str(ROOT))
+
+from engdigital.asset_resolver import DENSITY_VARIANTS, MANIFEST_PATH, MANIFEST_VERSION, RUNTIME_ASSETS  # noqa: E402
 
 BRAND = {
     "name": "Engenho Digital",
@@ -20,28 +38,8 @@ BRAND = {
 }
 
 
-FONT_CANDIDATES = [
-    "/System/Library/Fonts/Supplemental/Arial.ttf",
-    "/Library/Fonts/Arial.ttf",
-    "/System/Library/Fonts/Supplemental/Helvetica.ttf",
-    "/Library/Fonts/Helvetica.ttf",
-    "/System/Library/Fonts/Supplemental/Verdana.ttf",
-    "/Library/Fonts/Verdana.ttf",
-]
-
-
-def load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-    for path in FONT_CANDIDATES:
-        if Path(path).exists():
-            try:
-                return ImageFont.truetype(path, size=size)
-            except OSError:
-                continue
-    return ImageFont.load_default()
-
-
 def center_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, box: tuple[int, int, int, int], fill):
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = text_bbox(draw, text, font)
     text_w = bbox[2] - bbox[0]
     text_h = bbox[3] - bbox[1]
     x0, y0, x1, y1 = box
@@ -50,15 +48,55 @@ def center_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFo
     draw.text((x, y), text, font=font, fill=fill)
 
 
-def add_gradient(img: Image.Image, top: tuple[int, int, int], bottom: tuple[int, int, int]) -> None:
-    width, height = img.size
-    for y in range(height):
-        ratio = y / max(height - 1, 1)
-        r = int(top[0] + (bottom[0] - top[0]) * ratio)
-        g = int(top[1] + (bottom[1] - top[1]) * ratio)
-        b = int(top[2] + (bottom[2] - top[2]) * ratio)
-        for x in range(width):
-            img.putpixel((x, y), (r, g, b))
+Color = tuple[int, int, int]
+GradientStops = Sequence[tuple[float, Color]]
+
+
+def gradient_colors(length: int, stops: GradientStops) -> list[Color]:
+    # One color per row (or column); truncation matches the original per-pixel loop exactly.
+    if len(stops) < 2:
+        raise ValueError("A gradient needs at least two stops.")
+    stops = sorted(stops, key=lambda stop: stop[0])
+    colors: list[Color] = []
+    segment = 0
+    for i in range(length):
+        ratio = i / max(length - 1, 1)
+        while segment < len(stops) - 2 and ratio > stops[segment + 1][0]:
+            segment += 1
+        (p0, c0), (p1, c1) = stops[segment], stops[segment + 1]
+        t = (ratio - p0) / (p1 - p0) if p1 > p0 else 0.0
+        t = min(max(t, 0.0), 1.0)
+        colors.append(tuple(int(c0[k] + (c1[k] - c0[k]) * t) for k in range(3)))
+    return colors
+
+
+def render_gradient(size: tuple[int, int], stops: GradientStops, direction: str = "vertical") -> Image.Image:
+    """Render a gradient as a one-pixel strip stretched to full size (no per-pixel Python work)."""
+    width, height = size
+    if direction == "vertical":
+        strip_size = (1, height)
+        colors = gradient_colors(height, stops)
+    elif direction == "horizontal":
+        strip_size = (width, 1)
+        colors = gradient_colors(width, stops)
+    else:
+        raise ValueError(f"Unknown gradient direction: {direction!r}")
+
+    strip = Image.frombytes("RGB", strip_size, bytes(channel for color in colors for channel in color))
+    return strip.resize(size, Image.Resampling.NEAREST)
+
+
+def add_gradient(
+    img: Image.Image,
+    top: Color,
+    bottom: Color,
+    direction: str = "vertical",
+) -> None:
+    add_multistop_gradient(img, [(0.0, top), (1.0, bottom)], direction)
+
+
+def add_multistop_gradient(img: Image.Image, stops: GradientStops, direction: str = "vertical") -> None:
+    img.paste(render_gradient(img.size, stops, direction), (0, 0))
 
 
 def make_icon(path: Path, size: int = 512) -> None:
@@ -146,33 +184,293 @@ def make_screenshot(path: Path, title: str, subtitle: str, width: int = 1080, he
     img.save(path)
 
 
-def main() -> None:
-    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-    STORE_DIR.mkdir(parents=True, exist_ok=True)
-    SCREEN_DIR.mkdir(parents=True, exist_ok=True)
+@dataclass(frozen=True)
+class AssetSpec:
+    output: str
+    kind: str
+    size: tuple[int, int]
+    texts: tuple[str, ...] = ()
+    # Keep a 24/32-bit PNG: Play listing images (and the presplash, which
+    # generate_play_store_assets.py copies into the listing) may not be palette PNGs.
+    truecolor: bool = False
+
+
+# Declarative list of every generated image; paths are relative to the repo root.
+ASSET_MANIFEST: tuple[AssetSpec, ...] = (
+    AssetSpec("assets/images/icon.png", "icon", (512, 512)),
+    AssetSpec("assets/images/logo.png", "logo", (512, 512)),
+    AssetSpec("assets/images/presplash.png", "presplash", (1080, 1920), truecolor=True),
+    AssetSpec("assets/store/icon_512.png", "icon", (512, 512), truecolor=True),
+    AssetSpec("assets/store/feature_graphic_1024x500.png", "feature_graphic", (1024, 500), truecolor=True),
+    AssetSpec(
+        "assets/store/screenshots/screenshot_1.png",
+        "screenshot",
+        (1080, 1920),
+        ("Software sob medida", "Sistemas, dashboards e integrações para acelerar decisões."),
+        truecolor=True,
+    ),
+    AssetSpec(
+        "assets/store/screenshots/screenshot_2.png",
+        "screenshot",
+        (1080, 1920),
+        ("Projetos elétricos CAD/CAM", "Plantas, diagramas e documentação técnica completa."),
+        truecolor=True,
+    ),
+    AssetSpec(
+        "assets/store/screenshots/screenshot_3.png",
+        "screenshot",
+        (1080, 1920),
+        ("Automação e dados", "Processos automatizados e indicadores em tempo real."),
+        truecolor=True,
+    ),
+)
+
+RENDERERS: dict[str, Callable[[Path, AssetSpec], None]] = {
+    "icon": lambda path, spec: make_icon(path, spec.size[0]),
+    "logo": lambda path, spec: make_logo(path, spec.size[0]),
+    "presplash": lambda path, spec: make_presplash(path, *spec.size),
+    "feature_graphic": lambda path, spec: make_feature_graphic(path, *spec.size),
+    "screenshot": lambda path, spec: make_screenshot(path, *spec.texts, *spec.size),
+}
+
+
+def render_asset(spec: AssetSpec, profile: str = "fast") -> tuple[str, float, CompressionResult]:
+    """Render and compress one manifest entry; runs inside a worker process when --jobs > 1."""
+    start = time.perf_counter()
+    path = ROOT / spec.output
+    path.parent.mkdir(parents=True, exist_ok=True)
+    RENDERERS[spec.kind](path, spec)
+    compression = compress_file(path, PROFILES[profile], spec.truecolor, label=spec.output)
+    return (spec.output, time.perf_counter() - start, compression)
+
+
+def render_manifest(
+    specs: Sequence[AssetSpec], jobs: int, profile: str = "fast"
+) -> list[tuple[str, float, CompressionResult]]:
+    for spec in specs:
+        if spec.kind not in RENDERERS:
+            raise SystemExit(f"Unknown asset kind {spec.kind!r} for {spec.output}")
 
-    make_icon(IMAGES_DIR / "icon.png")
-    make_logo(IMAGES_DIR / "logo.png")
-    make_presplash(IMAGES_DIR / "presplash.png")
+    render = partial(render_asset, profile=profile)
+    if jobs <= 1 or len(specs) <= 1:
+        return [render(spec) for spec in specs]
 
-    make_icon(STORE_DIR / "icon_512.png")
-    make_feature_graphic(STORE_DIR / "feature_graphic_1024x500.png")
+    with ProcessPoolExecutor(max_workers=min(jobs, len(specs))) as pool:
+        return list(pool.map(render, specs))
 
-    make_screenshot(
-        SCREEN_DIR / "screenshot_1.png",
-        "Software sob medida",
-        "Sistemas, dashboards e integrações para acelerar decisões.",
+
+def asset_key(spec: AssetSpec, profile: str = "fast") -> str:
+    fonts = sorted({path for path in (find_font_path(False), find_font_path(True)) if path})
+    return input_key(
+        code=[Path(__file__).resolve(), Path(font_index.__file__).resolve(), Path(image_compression.__file__).resolve()],
+        params={"spec": asdict(spec), "brand": BRAND, "pillow": PIL.__version__, "fonts": fonts, "profile": profile},
+        sources=[Path(path) for path in fonts],
+    )
+
+
+@dataclass(frozen=True)
+class AtlasEntry:
+    name: str
+    source: str
+    size_dp: int
+
+
+# UI images packed into one texture, resized to the size app.kv draws them at. One atlas per
+# density (px per dp): the app loads the smallest one at least as dense as the screen.
+ATLAS_NAME = "assets/atlas/ui"
+ATLAS_DENSITIES = DENSITY_VARIANTS["ui"]
+ATLAS_PADDING = 2
+ATLAS_ENTRIES: tuple[AtlasEntry, ...] = (
+    AtlasEntry("logo", "assets/images/logo.png", 36),  # ScreenHeader Image: dp(36)
+    AtlasEntry("icon", "assets/images/icon.png", 36),  # logo fallback, same slot
+)
+
+
+def atlas_variant_name(density: int, name: str = ATLAS_NAME) -> str:
+    return f"{name}-{density}x"
+
+
+def atlas_outputs(name: str) -> tuple[str, str]:
+    return (f"{name}.atlas", f"{name}-0.png")
+
+
+def _next_pow2(value: int) -> int:
+    return 1 << max(value - 1, 0).bit_length()
+
+
+def pack_atlas(
+    images: Sequence[tuple[str, Image.Image]], padding: int = ATLAS_PADDING
+) -> tuple[Image.Image, dict[str, list[int]]]:
+    """Shelf-pack images (tallest first) into one power-of-two RGBA sheet.
+
+    Returns the sheet and Kivy atlas coordinates (x, y, w, h) with y measured from the bottom.
+    Each image's edge pixels are extruded into its padding so linear filtering never samples
+    a neighbour.
+    """
+    order = sorted(images, key=lambda item: (-item[1].height, item[0]))
+    total_area = sum((im.width + 2 * padding) * (im.height + 2 * padding) for _, im in order)
+    width = _next_pow2(max([int(total_area**0.5)] + [im.width + 2 * padding for _, im in order]))
+
+    placements: list[tuple[str, Image.Image, int, int]] = []
+    x = y = shelf_h = 0
+    for name, im in order:
+        w, h = im.width + 2 * padding, im.height + 2 * padding
+        if x + w > width:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        placements.append((name, im, x + padding, y + padding))
+        x += w
+        shelf_h = max(shelf_h, h)
+    height = _next_pow2(y + shelf_h)
+
+    sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    coords: dict[str, list[int]] = {}
+    for name, im, px, py in placements:
+        im = im.convert("RGBA")
+        w, h = im.size
+        if padding:
+            sheet.paste(im.crop((0, 0, w, 1)).resize((w, padding)), (px, py - padding))
+            sheet.paste(im.crop((0, h - 1, w, h)).resize((w, padding)), (px, py + h))
+            sheet.paste(im.crop((0, 0, 1, h)).resize((padding, h)), (px - padding, py))
+            sheet.paste(im.crop((w - 1, 0, w, h)).resize((padding, h)), (px + w, py))
+        sheet.paste(im, (px, py))
+        coords[name] = [px, height - py - h, w, h]
+    return sheet, coords
+
+
+def build_atlas(
+    density: int, entries: Sequence[AtlasEntry] = ATLAS_ENTRIES, name: str = ATLAS_NAME, profile: str = "fast"
+) -> CompressionResult:
+    images = []
+    for entry in entries:
+        px = entry.size_dp * density
+        with Image.open(ROOT / entry.source) as src:
+            images.append((entry.name, src.convert("RGBA").resize((px, px), Image.Resampling.LANCZOS)))
+    sheet, coords = pack_atlas(images)
+
+    atlas_path, sheet_path = (ROOT / output for output in atlas_outputs(atlas_variant_name(density, name)))
+    atlas_path.parent.mkdir(parents=True, exist_ok=True)
+    sheet.save(sheet_path, optimize=True)
+    atlas_path.write_text(json.dumps({sheet_path.name: coords}, sort_keys=True) + "\n", encoding="utf-8")
+    return compress_file(sheet_path, PROFILES[profile], label=sheet_path.relative_to(ROOT).as_posix())
+
+
+def atlas_key(density: int, entries: Sequence[AtlasEntry] = ATLAS_ENTRIES, profile: str = "fast") -> str:
+    return input_key(
+        code=[Path(__file__).resolve(), Path(image_compression.__file__).resolve()],
+        params={
+            "entries": [asdict(entry) for entry in entries],
+            "density": density,
+            "padding": ATLAS_PADDING,
+            "profile": profile,
+        },
+        sources=[ROOT / entry.source for entry in entries],
     )
-    make_screenshot(
-        SCREEN_DIR / "screenshot_2.png",
-        "Projetos elétricos CAD/CAM",
-        "Plantas, diagramas e documentação técnica completa.",
+
+
+def runtime_manifest_entry(candidates: Sequence[str]) -> dict | None:
+    """Describe the first existing candidate: path, pixel size and SHA-256 digest."""
+    for relative in candidates:
+        path = ROOT / relative
+        if path.exists():
+            break
+    else:
+        return None
+    digest = hashlib.sha256(path.read_bytes())
+    entry: dict = {"path": relative}
+    if path.suffix == ".atlas":
+        sheets = json.loads(path.read_text(encoding="utf-8"))
+        sheet_name = next(iter(sheets))
+        sheet_path = path.parent / sheet_name
+        digest.update(sheet_path.read_bytes())
+        with Image.open(sheet_path) as sheet:
+            entry["size"] = list(sheet.size)
+        entry["sprites"] = sorted(sprite for coords in sheets.values() for sprite in coords)
+    else:
+        with Image.open(path) as image:
+            entry["size"] = list(image.size)
+    entry["sha256"] = digest.hexdigest()
+    return entry
+
+
+def build_runtime_manifest() -> dict:
+    # Only files buildozer packages can be resolved on a device.
+    spec = buildozer_spec.load()
+    assets = {}
+    for name, candidates in RUNTIME_ASSETS.items():
+        entry = runtime_manifest_entry([candidate for candidate in candidates if spec.packages(candidate)])
+        if entry is not None:
+            assets[name] = entry
+    return {"version": MANIFEST_VERSION, "assets": assets}
+
+
+def write_runtime_manifest() -> bool:
+    """Write assets/manifest.json for engdigital.asset_resolver; returns True if it changed."""
+    path = ROOT / MANIFEST_PATH
+    text = json.dumps(build_runtime_manifest(), indent=2, sort_keys=True) + "\n"
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def _print_timings(timings: list[tuple[str, float, CompressionResult]], wall: float, jobs: int) -> None:
+    if not timings:
+        return
+    width = max(len(label) for label, _, _ in timings)
+    for label, elapsed, _ in timings:
+        print(f"{label:<{width}}  {elapsed * 1000:8.1f} ms")
+    print(f"{'sum':<{width}}  {sum(elapsed for _, elapsed, _ in timings) * 1000:8.1f} ms")
+    print(f"{f'wall ({jobs} jobs)':<{width}}  {wall * 1000:8.1f} ms")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate app icon, presplash, store artwork, the UI texture atlas and the asset manifest.")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count; 1 renders in-process).",
     )
-    make_screenshot(
-        SCREEN_DIR / "screenshot_3.png",
-        "Automação e dados",
-        "Processos automatizados e indicadores em tempo real.",
+    parser.add_argument("--force", action="store_true", help="Rebuild every asset, ignoring the build cache.")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        default="fast",
+        help="Compression profile: fast for day-to-day work, smallest before committing a release (default: fast).",
     )
+    args = parser.parse_args(argv)
+
+    cache = BuildCache(ROOT, force=args.force)
+    keys = {spec.output: asset_key(spec, args.profile) for spec in ASSET_MANIFEST}
+    stale = [spec for spec in ASSET_MANIFEST if not cache.is_fresh(spec.output, keys[spec.output])]
+
+    start = time.perf_counter()
+    timings = render_manifest(stale, args.jobs, args.profile)
+    _print_timings(timings, time.perf_counter() - start, max(args.jobs, 1))
+    compression = [result for _, _, result in timings]
+
+    for spec in stale:
+        cache.record(spec.output, keys[spec.output])
+
+    # Atlas stage: runs after the manifest because it packs some of its outputs.
+    for density in ATLAS_DENSITIES:
+        key = atlas_key(density, profile=args.profile)
+        outputs = atlas_outputs(atlas_variant_name(density))
+        if [output for output in outputs if not cache.is_fresh(output, key)]:
+            compression.append(build_atlas(density, profile=args.profile))
+            for output in outputs:
+                cache.record(output, key)
+    cache.save()
+    cache.print_summary()
+    if compression:
+        print(f"Compression ({args.profile} profile):")
+        print_report(compression)
+
+    # Runtime manifest: hashes the final images, so it runs last (and always; it is cheap).
+    if write_runtime_manifest():
+        print(f"Updated {MANIFEST_PATH}")
 
 
 if __name__ == "__main__":
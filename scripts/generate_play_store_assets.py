@@ -12,16 +12,37 @@ Inputs (expected to exist in this repo):
 Outputs (generated, safe to commit if you want, but not required):
 - fastlane/metadata/android/<locale>/images/icon.png
 - fastlane/metadata/android/<locale>/images/featureGraphic.png (1024x500)
-- fastlane/metadata/android/<locale>/images/phoneScreenshots/{1,2}.png
-- fastlane/metadata/android/<locale>/images/sevenInchScreenshots/{1,2}.png
-- fastlane/metadata/android/<locale>/images/tenInchScreenshots/{1,2}.png
+- fastlane/metadata/android/<locale>/images/phoneScreenshots/<n>.png
+- fastlane/metadata/android/<locale>/images/sevenInchScreenshots/<n>.png
+- fastlane/metadata/android/<locale>/images/tenInchScreenshots/<n>.png
+
+Screenshots (--screenshots): "capture" renders every app screen at the phone, 7-inch and 10-inch
+resolutions in one headless app process (scripts/capture_screenshots.py, needs Kivy);
+"presplash" fills each folder with two copies of presplash.png; "auto" (default) captures when
+Kivy is installed and uses the presplash copies only when it is not. A failed capture is always
+an error: falling back would replace real screenshots with placeholders.
+Numbered screenshots beyond the current set are removed.
+
+Outputs whose inputs are unchanged since the last run are skipped (see scripts/build_cache.py);
+pass --force to regenerate everything. Identical images (the screenshot placeholders) are written
+once and the other destinations are reflinked/hardlinked to it where the filesystem allows
+(--link-mode), falling back to a plain copy.
 """
 
 from __future__ import annotations
 
 import argparse
+import importlib.util
+import os
 import shutil
+import subprocess
+import sys
+from dataclasses import asdict
 from pathlib import Path
+from typing import Callable
+
+from build_cache import BuildCache, input_key
+from capture_screenshots import DEVICES, SCREENS
 
 
 def _require(path: Path) -> None:
@@ -29,12 +50,83 @@ def _require(path: Path) -> None:
         raise SystemExit(f"Missing required file: {path.as_posix()}")
 
 
-def _copy(src: Path, dst: Path) -> None:
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+
+# Linux FICLONE ioctl (btrfs, XFS, bcachefs, ...): shares extents copy-on-write.
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    import fcntl
+
+    with src.open("rb") as s, dst.open("wb") as d:
+        fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+
+
+def _place(src: Path, dst: Path, mode: str = "copy") -> str:
+    """
+    Materialize `src` at `dst` and return the method used ("reflink", "hardlink" or "copy").
+
+    The result is staged next to `dst` and moved into place, so an existing `dst` that is a
+    hardlink to other outputs is replaced instead of being written through.
+    """
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(src, dst)
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    methods = {"auto": ["reflink", "hardlink", "copy"], "copy": ["copy"]}.get(mode, [mode, "copy"])
+    for method in methods:
+        tmp.unlink(missing_ok=True)
+        try:
+            if method == "reflink":
+                _reflink(src, tmp)
+            elif method == "hardlink":
+                os.link(src, tmp)
+            else:
+                shutil.copyfile(src, tmp)
+        except (OSError, ImportError):
+            if method == methods[-1]:
+                tmp.unlink(missing_ok=True)
+                raise
+            continue
+        os.replace(tmp, dst)
+        return method
+    raise AssertionError("unreachable")
+
+
+class DedupWriter:
+    """Writes each distinct image once; later destinations with the same key are linked to it."""
+
+    def __init__(self, link_mode: str) -> None:
+        self.link_mode = link_mode
+        self.bytes_written = 0
+        self.bytes_avoided = 0
+        self.methods: dict[str, int] = {}
+        self._by_key: dict[str, Path] = {}
+
+    def remember(self, key: str, path: Path) -> None:
+        self._by_key.setdefault(key, path)
 
+    def copy(self, key: str, src: Path, dst: Path) -> None:
+        first = self._by_key.get(key)
+        if first is None or self.link_mode == "copy":
+            method = _place(src, dst, "copy")
+            self.remember(key, dst)
+        else:
+            method = _place(first, dst, self.link_mode)
+        size = dst.stat().st_size
+        if method == "copy":
+            self.bytes_written += size
+        else:
+            self.bytes_avoided += size
+        self.methods[method] = self.methods.get(method, 0) + 1
 
-def _generate_feature_graphic(presplash_png: Path, out_png: Path) -> None:
+    def print_summary(self) -> None:
+        methods = ", ".join(f"{count} {method}" for method, count in sorted(self.methods.items())) or "nothing placed"
+        print(
+            f"Bytes written: {self.bytes_written:,}; avoided via links: {self.bytes_avoided:,} ({methods})"
+        )
+
+
+def _generate_feature_graphic(presplash_png: Path, out_png: Path, profile: str = "smallest") -> None:
     # Pillow is intentionally imported lazily so the script can fail with a clear message.
     try:
         from PIL import Image  # type: ignore
@@ -61,6 +153,47 @@ def _generate_feature_graphic(presplash_png: Path, out_png: Path) -> None:
         out_png.parent.mkdir(parents=True, exist_ok=True)
         cropped.save(out_png, format="PNG", optimize=True)
 
+    # Play requires a 24-bit PNG here: lossless encoders only (this also drops the unused alpha).
+    from image_compression import PROFILES, compress_file, print_report
+
+    print_report([compress_file(out_png, PROFILES[profile], truecolor_only=True, label=out_png.name)])
+
+
+SCREENSHOT_MODES = ("auto", "capture", "presplash")
+PRESPLASH_SCREENSHOTS = 2
+
+
+def capture_inputs(repo_root: Path) -> list[Path]:
+    """Files whose content shows up in captured screenshots: app code, kv rules, content and the UI atlas."""
+    app_files = [path for path in (repo_root / "engdigital").rglob("*") if path.suffix in {".py", ".json"}]
+    atlas_files = (repo_root / "assets" / "atlas").glob("*")
+    return sorted([*app_files, repo_root / "app.kv", *atlas_files])
+
+
+def _capture_screenshots(images_root: Path, profile: str) -> str | None:
+    """Run the headless capture in its own process (Kivy owns it); returns an error or None."""
+    script = Path(__file__).resolve().with_name("capture_screenshots.py")
+    proc = subprocess.run(
+        [sys.executable, str(script), "--images-root", str(images_root), "--profile", profile],
+        capture_output=True,
+        text=True,
+        errors="replace",
+    )
+    if proc.returncode != 0:
+        return "\n".join((proc.stdout + proc.stderr).strip().splitlines()[-10:])
+    print(proc.stdout.strip().splitlines()[-1])
+    return None
+
+
+def prune_screenshots(folder: Path, keep: int) -> list[Path]:
+    """Delete numbered screenshots past `keep` (left over from a larger set); returns them."""
+    removed = []
+    for path in sorted(folder.glob("*.png")):
+        if path.stem.isdigit() and int(path.stem) > keep:
+            path.unlink()
+            removed.append(path)
+    return removed
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate Play Store listing images for Fastlane Supply.")
@@ -70,6 +203,28 @@ def main() -> None:
         default="fastlane/metadata/android",
         help="Fastlane metadata root (default: fastlane/metadata/android)",
     )
+    parser.add_argument("--force", action="store_true", help="Regenerate every image, ignoring the build cache.")
+    parser.add_argument(
+        "--profile",
+        choices=("fast", "smallest"),
+        default="smallest",
+        help=(
+            "Compression profile for the feature graphic and screenshots (see scripts/image_compression.py; "
+            "default: smallest, the profile the committed store assets are built with)."
+        ),
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="auto",
+        help="How duplicate images are materialized: auto tries reflink, then hardlink, then copy (default: auto).",
+    )
+    parser.add_argument(
+        "--screenshots",
+        choices=SCREENSHOT_MODES,
+        default="auto",
+        help="capture the real app screens headless, or copy presplash.png (default: auto, capture when Kivy is installed).",
+    )
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parent.parent
@@ -81,17 +236,71 @@ def main() -> None:
     _require(presplash_src)
 
     images_root = repo_root / args.metadata_root / args.locale / "images"
+    cache = BuildCache(repo_root, force=args.force)
+    script = Path(__file__).resolve()
+
+    writer = DedupWriter(args.link_mode)
+
+    # (output, key, build). Copies only depend on their source; the feature graphic also on this script.
+    # Equal keys mean equal content, so the DedupWriter writes each distinct image once.
+    jobs: list[tuple[Path, str, Callable[[Path, str], None]]] = [
+        (images_root / "icon.png", input_key(sources=[icon_src]), lambda out, key: writer.copy(key, icon_src, out)),
+        (
+            images_root / "featureGraphic.png",
+            input_key(code=[script], params={"size": [1024, 500], "profile": args.profile}, sources=[presplash_src]),
+            lambda out, key: _generate_feature_graphic(presplash_src, out, args.profile),
+        ),
+    ]
+
+    def output_name(out: Path) -> str:
+        return out.relative_to(repo_root).as_posix() if out.is_relative_to(repo_root) else out.as_posix()
 
-    # Core assets
-    _copy(icon_src, images_root / "icon.png")
-    _generate_feature_graphic(presplash_src, images_root / "featureGraphic.png")
+    mode = args.screenshots
+    if mode == "auto":
+        mode = "capture" if importlib.util.find_spec("kivy") is not None else "presplash"
+    if mode == "capture":
+        # One app process renders the whole set, so it is cached (and rebuilt) as a unit.
+        capture_key = input_key(
+            code=[script, script.with_name("capture_screenshots.py")],
+            params={"devices": [asdict(device) for device in DEVICES], "screens": SCREENS, "profile": args.profile},
+            sources=capture_inputs(repo_root),
+        )
+        captured = [out for device in DEVICES for out in device.outputs(images_root)]
+        if not all([cache.is_fresh(output_name(out), capture_key) for out in captured]):
+            error = _capture_screenshots(images_root, args.profile)
+            if error is None:
+                for out in captured:
+                    cache.record(output_name(out), capture_key)
+            else:
+                raise SystemExit(f"Screenshot capture failed:\n{error}")
+    if mode == "presplash":
+        # Minimal screenshots: duplicate presplash to satisfy minimum counts.
+        presplash_key = input_key(sources=[presplash_src])
+        for device in DEVICES:
+            for index in range(1, PRESPLASH_SCREENSHOTS + 1):
+                jobs.append(
+                    (
+                        images_root / device.folder / f"{index}.png",
+                        presplash_key,
+                        lambda out, key: writer.copy(key, presplash_src, out),
+                    )
+                )
+    keep = len(SCREENS) if mode == "capture" else PRESPLASH_SCREENSHOTS
+    for device in DEVICES:
+        for path in prune_screenshots(images_root / device.folder, keep):
+            print(f"Removed stale screenshot: {output_name(path)}")
 
-    # Minimal screenshots: duplicate presplash to satisfy minimum counts.
-    # You can replace these later with real app screenshots, keeping the same paths.
-    for folder in ["phoneScreenshots", "sevenInchScreenshots", "tenInchScreenshots"]:
-        _copy(presplash_src, images_root / folder / "1.png")
-        _copy(presplash_src, images_root / folder / "2.png")
+    for out, key, build in jobs:
+        output = output_name(out)
+        if cache.is_fresh(output, key):
+            writer.remember(key, out)
+            continue
+        build(out, key)
+        cache.record(output, key)
+    cache.save()
 
+    cache.print_summary()
+    writer.print_summary()
     print(f"Generated Play Store assets under: {images_root.as_posix()}")
 
 
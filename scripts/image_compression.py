@@ -0,0 +1,161 @@
+"""
+Re-encode generated PNGs with the smallest encoder whose output still looks the same.
+
+A profile lists the encoders to try and the largest visual difference allowed:
+
+- ``fast`` (dev default): a single lossless PNG pass with Pillow's default settings.
+- ``smallest`` (release): lossless PNG with ``optimize`` plus palette PNGs quantized to 256,
+  64 and 16 colours. The smallest candidate whose RMS difference from the rendered image is
+  within ``max_rms`` (0-255 scale) wins.
+
+Outputs keep their file names and stay PNG: the launcher icon, the presplash and the Play
+listing all require PNG (or JPEG). Play listing images must also be 24/32-bit, so callers pass
+``truecolor=True`` for anything that is uploaded there, which skips the palette encoders.
+A file is rewritten only when the winner is smaller than what is already on disk.
+
+Usage:
+    python scripts/image_compression.py --profile smallest assets/images/icon.png ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+from PIL import Image, ImageChops, ImageStat
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    optimize: bool
+    palette_colors: tuple[int, ...]
+    max_rms: float
+
+
+PROFILES: dict[str, Profile] = {
+    "fast": Profile("fast", optimize=False, palette_colors=(), max_rms=0.0),
+    "smallest": Profile("smallest", optimize=True, palette_colors=(256, 64, 16), max_rms=1.0),
+}
+
+
+@dataclass(frozen=True)
+class CompressionResult:
+    output: str
+    before: int
+    after: int
+    encoder: str
+    rms: float
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+
+def _has_alpha(img: Image.Image) -> bool:
+    return img.mode == "RGBA" and img.getchannel("A").getextrema()[0] < 255
+
+
+def truecolor(img: Image.Image) -> Image.Image:
+    """RGB, or RGBA only when some pixel is actually transparent (lossless either way)."""
+    rgba = img.convert("RGBA")
+    return rgba if _has_alpha(rgba) else rgba.convert("RGB")
+
+
+def _png_bytes(img: Image.Image, optimize: bool) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", optimize=optimize)
+    return buf.getvalue()
+
+
+def _quantize(img: Image.Image, colors: int) -> Image.Image:
+    # Median cut handles flat brand art well but only supports RGB; alpha needs octree.
+    method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else Image.Quantize.MEDIANCUT
+    return img.quantize(colors=colors, method=method, dither=Image.Dither.NONE)
+
+
+def rms_difference(a: Image.Image, b: Image.Image) -> float:
+    """Root-mean-square difference over all RGBA channels, on a 0-255 scale."""
+    diff = ImageChops.difference(a.convert("RGBA"), b.convert("RGBA"))
+    squares = ImageStat.Stat(diff).sum2
+    return math.sqrt(sum(squares) / (len(squares) * diff.width * diff.height))
+
+
+def candidates(img: Image.Image, profile: Profile, truecolor_only: bool = False):
+    """Yield (encoder name, PNG bytes, decoded image) for every encoder in the profile."""
+    base = truecolor(img)
+    yield "png", _png_bytes(base, profile.optimize), base
+    if truecolor_only:
+        return
+    for colors in profile.palette_colors:
+        quantized = _quantize(base, colors)
+        yield f"png-palette{colors}", _png_bytes(quantized, profile.optimize), quantized
+
+
+def encode_best(img: Image.Image, profile: Profile, truecolor_only: bool = False) -> tuple[str, bytes, float]:
+    """Return (encoder, bytes, rms) for the smallest candidate within the profile's threshold."""
+    reference = img.convert("RGBA")
+    best: tuple[str, bytes, float] | None = None
+    for encoder, data, decoded in candidates(img, profile, truecolor_only):
+        if best is not None and len(data) >= len(best[1]):
+            continue
+        rms = 0.0 if encoder == "png" else rms_difference(reference, decoded)
+        if rms <= profile.max_rms:
+            best = (encoder, data, rms)
+    assert best is not None  # the lossless PNG candidate always passes
+    return best
+
+
+def compress_file(path: Path, profile: Profile, truecolor_only: bool = False, label: str | None = None) -> CompressionResult:
+    """Re-encode `path` in place if the profile finds a smaller equivalent encoding."""
+    before = path.stat().st_size
+    with Image.open(path) as img:
+        img.load()
+    encoder, data, rms = encode_best(img, profile, truecolor_only)
+    output = label or path.as_posix()
+    if len(data) >= before:
+        return CompressionResult(output, before, before, "kept", 0.0)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return CompressionResult(output, before, len(data), encoder, rms)
+
+
+def print_report(results: Sequence[CompressionResult], write: Callable[[str], None] = print) -> None:
+    if not results:
+        return
+    width = max(len(result.output) for result in results)
+    for result in results:
+        write(
+            f"{result.output:<{width}}  {result.before:>9,} -> {result.after:>9,} B"
+            f"  saved {result.saved:>8,} B  {result.encoder:<14} rms {result.rms:.2f}"
+        )
+    before = sum(result.before for result in results)
+    after = sum(result.after for result in results)
+    percent = 100 * (before - after) / before if before else 0.0
+    write(f"{'total':<{width}}  {before:>9,} -> {after:>9,} B  saved {before - after:>8,} B  ({percent:.1f}%)")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-encode PNG files in place with a compression profile.")
+    parser.add_argument("paths", nargs="+", type=Path, help="PNG files to compress.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="smallest", help="Compression profile (default: smallest).")
+    parser.add_argument(
+        "--truecolor",
+        action="store_true",
+        help="Keep 24/32-bit PNGs (skip palette encoders), e.g. for Play listing images.",
+    )
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not path.is_file():
+            raise SystemExit(f"Missing file: {path.as_posix()}")
+    print_report([compress_file(path, PROFILES[args.profile], args.truecolor) for path in args.paths])
+
+
+if __name__ == "__main__":
+    main()
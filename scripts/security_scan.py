@@ -1,33 +1,86 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import hashlib
+import json
+import mmap
 import os
+import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Iterable, Iterator
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+# Files at least this large are scanned through mmap instead of being read into memory.
+MMAP_THRESHOLD = 256 * 1024
+BINARY_SNIFF_BYTES = 8192
+# `re` matching holds the GIL, so threads only overlap file reads. Past this much text a process
+# pool is used so the matching itself runs on every core; below it, process startup costs more.
+PROCESS_POOL_MIN_BYTES = 8 * 1024 * 1024
 
-def _git_ls_files_json(repo_root: Path) -> tuple[list[Path], bool]:
-    try:
-        out = subprocess.check_output(
-            ["git", "ls-files", "-z", "--", "*.json"],
-            cwd=str(repo_root),
-        )
-    except (OSError, subprocess.CalledProcessError):
-        return ([], False)
+SCAN_CACHE_VERSION = 1
+DEFAULT_SCAN_CACHE = REPO_ROOT / ".cache" / "security-scan.json"
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    description: str
+    pattern: re.Pattern[bytes]
+    # fnmatch patterns matched against the file name; empty means every text file.
+    path_globs: tuple[str, ...] = ()
+
+    def applies_to(self, path: Path) -> bool:
+        return not self.path_globs or any(fnmatch.fnmatch(path.name, g) for g in self.path_globs)
 
-    paths: list[Path] = []
-    for raw in out.decode("utf-8", errors="replace").split("\0"):
-        if not raw:
-            continue
-        paths.append((repo_root / raw).resolve())
-    return (paths, True)
 
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    path: Path
+    line: int
+    # Git blob object ID when the content came from the index/history rather than the working tree.
+    blob: str = ""
 
-def _walk_json_files(repo_root: Path) -> list[Path]:
+
+RULES: tuple[Rule, ...] = (
+    Rule(
+        "service-account-key",
+        "Google service account key (\"private_key\" in a JSON file)",
+        re.compile(rb'"private_key"'),
+        ("*.json",),
+    ),
+    Rule(
+        "pem-private-key",
+        "PEM private key block",
+        # Require key material after the header so placeholders like the .example file don't match.
+        # Accepts a real newline or a JSON-escaped "\n".
+        re.compile(rb"-----BEGIN (?:[A-Z0-9]+ )*PRIVATE KEY-----(?:\r?\n|\\n)[A-Za-z0-9+/=]{40,}"),
+    ),
+    Rule(
+        "google-api-key",
+        "Google API key",
+        re.compile(rb"AIza[0-9A-Za-z_\-]{35}"),
+    ),
+    Rule(
+        "buildozer-keystore-password",
+        "Keystore/key password committed to a buildozer spec",
+        re.compile(rb"(?m)^[ \t]*android\.release_(?:keystore_pass|keyalias_pass)[ \t]*=[ \t]*\S"),
+        ("*.spec",),
+    ),
+)
+
+
+def _walk_files(repo_root: Path) -> list[Path]:
     excluded = {
         ".git",
         ".venv",
@@ -43,22 +96,392 @@ def _walk_json_files(repo_root: Path) -> list[Path]:
         # Prune excluded directories
         dirs[:] = [d for d in dirs if d not in excluded]
         for name in files:
-            if not name.lower().endswith(".json"):
-                continue
             results.append((Path(root) / name).resolve())
     return results
 
 
-def _looks_like_service_account_key(text: str) -> bool:
-    # CI-oriented heuristic: fail fast if a tracked JSON file contains "private_key".
-    # This catches committed Google service account keys (and other likely secrets).
-    return '"private_key"' in text
+def _looks_binary(head: bytes) -> bool:
+    return b"\0" in head
+
+
+def _scan_buffer(path: Path, data, rules: tuple[Rule, ...]) -> list[Finding]:
+    findings: list[Finding] = []
+    for rule in rules:
+        for match in rule.pattern.finditer(data):
+            line = data[: match.start()].count(b"\n") + 1
+            findings.append(Finding(rule.name, path, line))
+    return findings
+
+
+def _applicable(path: Path, rules: tuple[Rule, ...]) -> tuple[Rule, ...]:
+    return tuple(rule for rule in rules if rule.applies_to(path))
+
+
+def _rule_paths(paths: Iterable[Path], rules: tuple[Rule, ...]) -> dict[str, Path]:
+    """Rule name -> first of `paths` it applies to, in rule order (the union of applicable rules)."""
+    paths = list(paths)
+    owners: dict[str, Path] = {}
+    for rule in rules:
+        owner = next((path for path in paths if rule.applies_to(path)), None)
+        if owner is not None:
+            owners[rule.name] = owner
+    return owners
+
+
+def scan_file(path: Path, rules: tuple[Rule, ...] = RULES, max_bytes: int = DEFAULT_MAX_BYTES) -> list[Finding]:
+    """Scan one file; binary files, empty files and files over `max_bytes` are skipped."""
+    applicable = _applicable(path, rules)
+    if not applicable:
+        return []
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size > max_bytes:
+                return []
+            if _looks_binary(f.read(BINARY_SNIFF_BYTES)):
+                return []
+            if size < MMAP_THRESHOLD:
+                f.seek(0)
+                return _scan_buffer(path, f.read(), applicable)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_buffer(path, mm, applicable)
+    except (OSError, ValueError):
+        return []
+
+
+def scan_blob(
+    path: Path, data: bytes, blob: str, rules: tuple[Rule, ...] = RULES, max_bytes: int = DEFAULT_MAX_BYTES
+) -> list[Finding]:
+    """Scan in-memory blob content (index or history) with the same skip rules as scan_file."""
+    return _scan_blob_owned(_rule_paths([path], rules), data, blob, rules, max_bytes)
+
+
+def _scan_blob_owned(
+    owners: dict[str, Path], data: bytes, blob: str, rules: tuple[Rule, ...], max_bytes: int
+) -> list[Finding]:
+    """Scan a blob once with every rule in `owners`; each finding is reported at its rule's path."""
+    applicable = tuple(rule for rule in rules if rule.name in owners)
+    if not applicable or not data or len(data) > max_bytes or _looks_binary(data[:BINARY_SNIFF_BYTES]):
+        return []
+    return [Finding(f.rule, owners[f.rule], f.line, blob) for f in _scan_buffer(Path(), data, applicable)]
+
+
+def _scannable_bytes(files: list[Path], max_bytes: int) -> int:
+    total = 0
+    for path in files:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        if size <= max_bytes:
+            total += size
+    return total
+
+
+def _scan_many(
+    files: list[Path], rules: tuple[Rule, ...], *, max_bytes: int, jobs: int
+) -> list[list[Finding]]:
+    """
+    Scan files in parallel: a process pool (one worker per CPU) for large inputs, where regex
+    matching dominates, else a thread pool that overlaps file I/O.
+    """
+    scan = partial(scan_file, rules=rules, max_bytes=max_bytes)
+    cpus = os.cpu_count() or 1
+    workers = jobs or cpus
+    if workers > 1 and len(files) > 1 and _scannable_bytes(files, max_bytes) >= PROCESS_POOL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(scan, files, chunksize=max(1, len(files) // (workers * 4))))
+    workers = jobs or min(32, cpus + 4)
+    if workers <= 1 or len(files) <= 1:
+        return [scan(p) for p in files]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan, files))
+
+
+def scan_paths(
+    paths: list[Path],
+    rules: tuple[Rule, ...] = RULES,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    jobs: int = 0,
+) -> list[Finding]:
+    files = [p for p in paths if p.is_file()]
+    return [finding for per_file in _scan_many(files, rules, max_bytes=max_bytes, jobs=jobs) for finding in per_file]
+
+
+class ScanCache:
+    """
+    Results per git blob object ID, so unchanged content is never rescanned.
+
+    Entries are keyed by blob ID plus the names of the rules that apply to the file name (rules can be
+    path-specific), and the whole cache is invalidated when the rule set or size cap changes.
+    """
+
+    def __init__(self, path: Path, rules: tuple[Rule, ...], max_bytes: int) -> None:
+        self.path = path
+        self.hits = 0
+        h = hashlib.sha256(f"{SCAN_CACHE_VERSION}:{max_bytes}".encode("utf-8"))
+        for rule in rules:
+            h.update(rule.name.encode("utf-8") + b"\0" + rule.pattern.pattern + b"\0")
+            h.update("|".join(rule.path_globs).encode("utf-8") + b"\n")
+        self.fingerprint = h.hexdigest()
+        self._entries: dict[str, list[list]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("fingerprint") == self.fingerprint:
+            self._entries = data.get("blobs", {})
+
+    @staticmethod
+    def key(blob: str, paths: Iterable[Path], rules: tuple[Rule, ...]) -> str:
+        return blob + ":" + ",".join(_rule_paths(paths, rules))
+
+    def get(self, key: str, path: Path, blob: str = "") -> list[Finding] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.hits += 1
+        return [Finding(rule, path, line, blob) for rule, line in entry]
+
+    def put(self, key: str, findings: list[Finding]) -> None:
+        self._entries[key] = [[f.rule, f.line] for f in findings]
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"fingerprint": self.fingerprint, "blobs": self._entries}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def _git(repo_root: Path, *args: str) -> bytes | None:
+    try:
+        return subprocess.check_output(["git", *args], cwd=str(repo_root), stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _split_z(out: bytes) -> list[str]:
+    return [raw for raw in out.decode("utf-8", errors="replace").split("\0") if raw]
+
+
+def _index_blobs(repo_root: Path, paths: list[str] | None = None) -> dict[str, str] | None:
+    """Map tracked path -> blob ID from the index (`git ls-files -s`)."""
+    out = _git(repo_root, "ls-files", "-s", "-z", "--", *(paths or []))
+    if out is None:
+        return None
+    blobs: dict[str, str] = {}
+    for entry in _split_z(out):
+        meta, _, path = entry.partition("\t")
+        mode, oid, stage = meta.split()
+        if stage == "0" and not mode.startswith("160"):  # skip conflicts and submodules
+            blobs[path] = oid
+    return blobs
+
+
+def _history_blobs(repo_root: Path) -> dict[str, list[str]] | None:
+    """Map blob ID -> every path it was seen at, for every object reachable from any ref."""
+    # --filter (git >= 2.32) drops trees up front; older gits list them and cat-file skips non-blobs.
+    out = _git(repo_root, "rev-list", "--objects", "--all", "--filter=object:type=blob")
+    if out is None:
+        out = _git(repo_root, "rev-list", "--objects", "--all")
+    if out is None:
+        return None
+    objects: dict[str, list[str]] = {}
+
+    def add(oid: str, path: str) -> None:
+        paths = objects.setdefault(oid, [])
+        if path not in paths:
+            paths.append(path)
+
+    for line in out.decode("utf-8", errors="replace").splitlines():
+        oid, _, path = line.partition(" ")
+        if path:
+            add(oid, path)
+    # rev-list names each blob once; the raw log adds every other path a blob was committed at
+    # (renames and copies), so path-specific rules see all of them.
+    log = _git(repo_root, "log", "--all", "--root", "-m", "--no-renames", "--raw", "--no-abbrev", "--format=", "-z")
+    fields = iter(_split_z(log or b""))
+    for meta in fields:
+        meta = meta.strip()
+        if not meta.startswith(":"):
+            continue
+        _, new_mode, _, oid, _ = meta[1:].split()
+        path = next(fields, "")
+        if path and oid.strip("0") and not new_mode.startswith("160"):
+            add(oid, path)
+    return objects
+
+
+def _cat_file_batch(repo_root: Path, oids: list[str], max_bytes: int) -> Iterator[tuple[str, bytes | None]]:
+    """
+    Stream object contents through a single `git cat-file --batch` process.
+
+    Yields (oid, content) for blobs; content is None for oversized blobs (skipped without buffering).
+    """
+    if not oids:
+        return
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        cwd=str(repo_root),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+
+    def feed() -> None:
+        try:
+            for oid in oids:
+                proc.stdin.write(oid.encode("ascii") + b"\n")
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        for _ in oids:
+            header = proc.stdout.readline()
+            if not header:
+                break
+            parts = header.split()
+            if len(parts) < 3:  # "<oid> missing"
+                continue
+            oid, kind, size = parts[0].decode("ascii"), parts[1], int(parts[2])
+            if kind != b"blob" or size > max_bytes:
+                remaining = size + 1
+                while remaining:
+                    chunk = proc.stdout.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                if kind == b"blob":
+                    yield (oid, None)
+                continue
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing newline
+            yield (oid, data)
+    finally:
+        writer.join()
+        proc.stdout.close()
+        proc.wait()
+
+
+def scan_worktree(
+    repo_root: Path, rules: tuple[Rule, ...], *, max_bytes: int, jobs: int, cache: ScanCache | None
+) -> tuple[list[Finding], int] | None:
+    """Scan tracked files, reusing cached results for files whose content equals their index blob."""
+    tracked = _index_blobs(repo_root)
+    if tracked is None:
+        return None
+    modified = set(_split_z(_git(repo_root, "ls-files", "-m", "-z") or b""))
+
+    findings: list[Finding] = []
+    to_scan: list[tuple[Path, str | None]] = []
+    for rel, oid in tracked.items():
+        path = repo_root / rel
+        key = ScanCache.key(oid, [path], rules) if rel not in modified else None
+        cached = cache.get(key, path) if (cache and key) else None
+        if cached is None:
+            to_scan.append((path, key))
+        else:
+            findings.extend(cached)
+
+    files = [(path, key) for path, key in to_scan if path.is_file()]
+    results = _scan_many([path for path, _ in files], rules, max_bytes=max_bytes, jobs=jobs)
+    for (path, key), per_file in zip(files, results):
+        findings.extend(per_file)
+        if cache and key:
+            cache.put(key, per_file)
+    return (findings, len(tracked))
+
+
+def scan_staged(
+    repo_root: Path, rules: tuple[Rule, ...], *, max_bytes: int, cache: ScanCache | None
+) -> tuple[list[Finding], int]:
+    """Pre-commit fast path: scan only added/changed paths, reading the staged blobs from the index."""
+    changed = _split_z(_git(repo_root, "diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR") or b"")
+    blobs = _index_blobs(repo_root, changed) if changed else {}
+    objects: dict[str, list[str]] = {}
+    for rel, oid in (blobs or {}).items():
+        objects.setdefault(oid, []).append(rel)
+    return _scan_blobs(repo_root, objects, rules, max_bytes=max_bytes, cache=cache)
+
+
+def scan_history(
+    repo_root: Path, rules: tuple[Rule, ...], *, max_bytes: int, cache: ScanCache | None
+) -> tuple[list[Finding], int]:
+    """Scan every blob reachable from any ref, so secrets that were committed and later removed are found."""
+    objects = _history_blobs(repo_root)
+    if objects is None:
+        raise SystemExit("--history requires a git checkout with full history (e.g. fetch-depth: 0).")
+    return _scan_blobs(repo_root, objects, rules, max_bytes=max_bytes, cache=cache)
+
+
+def _scan_blobs(
+    repo_root: Path, objects: dict[str, list[str]], rules: tuple[Rule, ...], *, max_bytes: int, cache: ScanCache | None
+) -> tuple[list[Finding], int]:
+    """
+    Scan each blob once. A blob stored at several paths (renames, copies) gets the union of the rules that
+    apply to any of them, so content first seen as x.txt is still checked as a key when it is also key.json.
+    """
+    findings: list[Finding] = []
+    pending: list[str] = []
+    owners: dict[str, dict[str, Path]] = {}
+    for oid, rels in objects.items():
+        owners[oid] = _rule_paths([repo_root / rel for rel in rels], rules)
+        if not owners[oid]:
+            continue
+        cached = cache.get(ScanCache.key(oid, owners[oid].values(), rules), repo_root, oid) if cache else None
+        if cached is None:
+            pending.append(oid)
+        else:
+            findings.extend(Finding(f.rule, owners[oid][f.rule], f.line, oid) for f in cached)
+
+    blobs = 0
+    for oid, data in _cat_file_batch(repo_root, pending, max_bytes):
+        blobs += 1
+        per_blob = _scan_blob_owned(owners[oid], data, oid, rules, max_bytes) if data is not None else []
+        findings.extend(per_blob)
+        if cache:
+            cache.put(ScanCache.key(oid, owners[oid].values(), rules), per_blob)
+    return (findings, blobs + (cache.hits if cache else 0))
+
+
+def _rel(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _report(findings: list[Finding], rules: tuple[Rule, ...]) -> None:
+    print("ERROR: Potential secrets detected in tracked file(s):", file=sys.stderr)
+    for rule in rules:
+        hits = [f for f in findings if f.rule == rule.name]
+        if not hits:
+            continue
+        print(f"[{rule.name}] {rule.description}", file=sys.stderr)
+        for f in hits:
+            suffix = f" (blob {f.blob[:12]})" if f.blob else ""
+            print(f"- {_rel(f.path)}:{f.line}{suffix}", file=sys.stderr)
+    print("", file=sys.stderr)
+    print("Fix:", file=sys.stderr)
+    print("- Remove the file(s) from git history if needed (and from the repo working tree).", file=sys.stderr)
+    print("- Rotate/revoke the leaked key(s)/password(s) immediately.", file=sys.stderr)
+    print("- Keep real keys out of the repo (use GitHub Secrets or WIF/OIDC).", file=sys.stderr)
 
 
 def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(
         description=(
-            "Scan tracked JSON files for patterns that look like Google service account keys. "
+            "Scan tracked files for committed secrets: Google service account keys, PEM private keys, "
+            "Google API keys and keystore passwords in buildozer.spec. "
             "This is meant to fail CI if secrets are accidentally committed."
         )
     )
@@ -66,43 +489,70 @@ def main(argv: list[str]) -> int:
         "--paths",
         nargs="*",
         default=None,
-        help="Optional explicit paths to scan. If omitted, scans tracked *.json files via git.",
+        help="Optional explicit paths to scan. If omitted, scans every tracked file via git.",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help=f"Skip files larger than this many bytes (default: {DEFAULT_MAX_BYTES}).",
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="Scan workers: processes for large inputs, else threads (default: auto; 1 scans in-process).")
+    parser.add_argument(
+        "--rules",
+        nargs="*",
+        choices=[rule.name for rule in RULES],
+        default=None,
+        help="Only run these rules (default: all).",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--staged", action="store_true", help="Only scan staged changes (pre-commit hook fast path).")
+    mode.add_argument(
+        "--history",
+        action="store_true",
+        help="Scan every blob reachable from any ref through one `git cat-file --batch` process.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the blob scan cache.")
+    parser.add_argument(
+        "--cache-path",
+        default=str(DEFAULT_SCAN_CACHE),
+        help="Blob scan cache location (default: .cache/security-scan.json).",
     )
     args = parser.parse_args(argv)
 
+    rules = tuple(rule for rule in RULES if args.rules is None or rule.name in args.rules)
+    cache = None if args.no_cache else ScanCache(Path(args.cache_path), rules, args.max_bytes)
+
     if args.paths:
+        if args.staged or args.history:
+            parser.error("--paths cannot be combined with --staged/--history")
         candidates = [(REPO_ROOT / p).resolve() for p in args.paths]
+        findings, scanned = scan_paths(candidates, rules, max_bytes=args.max_bytes, jobs=args.jobs), len(candidates)
+        scope = "file(s)"
+    elif args.staged:
+        findings, scanned = scan_staged(REPO_ROOT, rules, max_bytes=args.max_bytes, cache=cache)
+        scope = "staged blob(s)"
+    elif args.history:
+        findings, scanned = scan_history(REPO_ROOT, rules, max_bytes=args.max_bytes, cache=cache)
+        scope = "historical blob(s)"
     else:
-        candidates, ok = _git_ls_files_json(REPO_ROOT)
-        if not ok:
+        result = scan_worktree(REPO_ROOT, rules, max_bytes=args.max_bytes, jobs=args.jobs, cache=cache)
+        if result is None:
             # Fallback (e.g., running outside git). In CI, checkout normally includes git metadata.
-            candidates = _walk_json_files(REPO_ROOT)
+            candidates = _walk_files(REPO_ROOT)
+            result = (scan_paths(candidates, rules, max_bytes=args.max_bytes, jobs=args.jobs), len(candidates))
+        findings, scanned = result
+        scope = "file(s)"
 
-    offenders: list[Path] = []
-    for path in candidates:
-        if not path.is_file():
-            continue
-        try:
-            text = path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
+    if cache:
+        cache.save()
 
-        if _looks_like_service_account_key(text):
-            offenders.append(path)
-
-    if offenders:
-        rel = [str(p.relative_to(REPO_ROOT)) for p in offenders]
-        print("ERROR: Potential Google service account key detected in tracked JSON file(s):", file=sys.stderr)
-        for p in rel:
-            print(f"- {p}", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Fix:", file=sys.stderr)
-        print("- Remove the file(s) from git history if needed (and from the repo working tree).", file=sys.stderr)
-        print("- Rotate/revoke the leaked key(s) in Google Cloud immediately.", file=sys.stderr)
-        print("- Keep real keys out of the repo (use GitHub Secrets or WIF/OIDC).", file=sys.stderr)
+    if findings:
+        _report(findings, rules)
         return 2
 
-    print("OK: no committed service account keys detected in tracked JSON files.")
+    cached = f", {cache.hits} from cache" if cache and cache.hits else ""
+    print(f"OK: no committed secrets detected ({scanned} {scope}{cached}, {len(rules)} rule(s)).")
     return 0
 
 
@@ -7,6 +7,20 @@ Why not Fastlane supply here?
   which fails for apps still in "draft" state (and can also default to `production` track).
 - This script only touches listing resources (listings/details/images) and avoids track/release changes.
 
+Images:
+- By default (`--image-sync diff`) remote images are listed with their SHA digests and compared with the
+  local files; only new/changed images are uploaded and only stale ones deleted. `--image-sync replace`
+  restores the old deleteall + re-upload behaviour.
+- Image types are synced concurrently on a bounded thread pool (`--upload-workers`); requests within one
+  type stay sequential so screenshot order is kept. Transient errors (408/429/5xx, connection resets) are
+  retried with exponential backoff and jitter (`--max-retries`), and a per-type timing report is printed.
+  Uploads are not idempotent: before an upload is retried the image type is listed again, and the retry is
+  skipped if the failed attempt already stored the image.
+
+Locales:
+- `--all-locales` syncs every locale directory under the metadata root. All locales are loaded/validated
+  concurrently and pushed inside one edit with a single commit; per-locale timings are printed.
+
 Auth:
 - Uses the same credential file already produced by GitHub Actions WIF (`PLAY_JSON_KEY_PATH`), or the
   fallback service account JSON file path.
@@ -15,10 +29,17 @@ Auth:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import os
+import random
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
 ANDROIDPUBLISHER_SCOPE = "https://www.googleapis.com/auth/androidpublisher"
 
@@ -34,6 +55,7 @@ class ListingInputs:
 
 
 def _read_text(path: Path) -> str:
+    _require_file(path)
     text = path.read_text(encoding="utf-8").strip()
     if not text:
         raise SystemExit(f"Empty file: {path.as_posix()}")
@@ -106,6 +128,145 @@ def _mime_for(path: Path) -> str:
     return "application/octet-stream"
 
 
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def _execute_once(request, *, already_applied: Callable[[], bool] | None = None) -> Any:
+    return request.execute()
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    # googleapiclient.errors.HttpError exposes the status on `.resp.status` (and `.status_code` in newer versions).
+    status = getattr(getattr(exc, "resp", None), "status", None) or getattr(exc, "status_code", None)
+    if status is not None:
+        try:
+            return int(status) in RETRYABLE_STATUSES
+        except (TypeError, ValueError):
+            return False
+    return isinstance(exc, (ConnectionError, TimeoutError, socket.timeout))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 32.0
+    sleep: Callable[[float], None] = time.sleep
+
+    def delay(self, attempt: int) -> float:
+        # Exponential backoff with full jitter.
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+
+class RetryingExecutor:
+    """
+    Callable that runs `request.execute()`, retrying retryable errors; counts requests/retries.
+
+    Requests are assumed idempotent (list/get/update/delete/commit). Non-idempotent ones (uploads) must
+    pass `already_applied`, which is checked before each retry: a failed attempt may still have reached
+    Play, and when it did the request is not sent again and None is returned.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.requests = 0
+        self.retries = 0
+
+    def __call__(self, request, *, already_applied: Callable[[], bool] | None = None) -> Any:
+        self.requests += 1
+        attempt = 0
+        while True:
+            try:
+                return request.execute()
+            except Exception as e:
+                if attempt >= self.policy.max_retries or not _is_retryable(e):
+                    raise
+                self.policy.sleep(self.policy.delay(attempt))
+                if already_applied is not None and already_applied():
+                    return None
+                attempt += 1
+                self.retries += 1
+
+
+@dataclass(frozen=True)
+class ImageTypeReport:
+    locale: str
+    image_type: str
+    seconds: float
+    requests: int
+    retries: int
+
+
+def _run_image_jobs(
+    jobs: list[tuple[str, str, Callable[[Callable[..., Any]], object]]],
+    *,
+    workers: int,
+    policy: RetryPolicy,
+) -> list[ImageTypeReport]:
+    """
+    Run one job per (locale, image type) on a bounded thread pool.
+
+    Requests inside a job stay sequential so screenshot order is preserved; different image types
+    upload concurrently. Each job receives its own RetryingExecutor.
+    """
+
+    def run(locale: str, image_type: str, job) -> ImageTypeReport:
+        executor = RetryingExecutor(policy)
+        start = time.perf_counter()
+        job(executor)
+        return ImageTypeReport(locale, image_type, time.perf_counter() - start, executor.requests, executor.retries)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(run, locale, image_type, job) for locale, image_type, job in jobs]
+        return [f.result() for f in futures]
+
+
+def _print_image_reports(reports: list[ImageTypeReport]) -> None:
+    for r in reports:
+        print(
+            f"{r.image_type} ({r.locale}): {r.seconds:.2f}s, {r.requests} request(s), {r.retries} retr{'y' if r.retries == 1 else 'ies'}"
+        )
+
+
+def _thread_local(factory: Callable[[], Any]) -> Callable[[], Any]:
+    local = threading.local()
+
+    def get() -> Any:
+        if not hasattr(local, "value"):
+            local.value = factory()
+        return local.value
+
+    return get
+
+
+def _default_media_factory(path: Path):
+    from googleapiclient.http import MediaFileUpload  # type: ignore
+
+    return MediaFileUpload(str(path), mimetype=_mime_for(path), resumable=False)
+
+
+def _upload_landed(
+    images,
+    execute: Callable[..., Any],
+    *,
+    package_name: str,
+    edit_id: str,
+    locale: str,
+    image_type: str,
+    position: int,
+    path: Path,
+) -> Callable[[], bool]:
+    """`already_applied` check for an upload: True if the remote image at `position` is already `path`."""
+
+    def landed() -> bool:
+        remote = execute(
+            images.list(packageName=package_name, editId=edit_id, language=locale, imageType=image_type)
+        ).get("images", [])
+        return len(remote) > position and _same_image(remote[position], _file_digests(path))
+
+    return landed
+
+
 def _upload_images(
     service,
     *,
@@ -115,9 +276,9 @@ def _upload_images(
     image_type: str,
     files: Iterable[Path],
     dry_run: bool,
+    media_factory: Callable[[Path], object] = _default_media_factory,
+    execute: Callable[..., Any] = _execute_once,
 ) -> None:
-    from googleapiclient.http import MediaFileUpload  # type: ignore
-
     files = list(files)
     if not files:
         return
@@ -125,25 +286,264 @@ def _upload_images(
     if dry_run:
         print(f"[dry-run] deleteall {image_type} ({locale})")
     else:
-        service.edits().images().deleteall(
-            packageName=package_name,
-            editId=edit_id,
-            language=locale,
-            imageType=image_type,
-        ).execute()
-
-    for f in files:
+        execute(
+            service.edits().images().deleteall(
+                packageName=package_name,
+                editId=edit_id,
+                language=locale,
+                imageType=image_type,
+            )
+        )
+
+    images = service.edits().images()
+    for position, f in enumerate(files):
         if dry_run:
             print(f"[dry-run] upload {image_type} ({locale}): {f.as_posix()}")
             continue
-        media = MediaFileUpload(str(f), mimetype=_mime_for(f), resumable=False)
-        service.edits().images().upload(
-            packageName=package_name,
-            editId=edit_id,
-            language=locale,
-            imageType=image_type,
-            media_body=media,
-        ).execute()
+        execute(
+            images.upload(
+                packageName=package_name,
+                editId=edit_id,
+                language=locale,
+                imageType=image_type,
+                media_body=media_factory(f),
+            ),
+            already_applied=_upload_landed(
+                images,
+                execute,
+                package_name=package_name,
+                edit_id=edit_id,
+                locale=locale,
+                image_type=image_type,
+                position=position,
+                path=f,
+            ),
+        )
+
+
+def _file_digests(path: Path) -> tuple[str, str]:
+    sha1 = hashlib.sha1()
+    sha256 = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(chunk)
+            sha256.update(chunk)
+    return (sha1.hexdigest(), sha256.hexdigest())
+
+
+def _same_image(remote: dict, local: tuple[str, str]) -> bool:
+    if remote.get("sha256"):
+        return remote["sha256"].lower() == local[1]
+    return bool(remote.get("sha1")) and remote["sha1"].lower() == local[0]
+
+
+@dataclass(frozen=True)
+class ImageSyncPlan:
+    keep: list[str]
+    delete: list[str]
+    upload: list[Path]
+
+
+def _plan_image_sync(remote: list[dict], files: list[Path]) -> ImageSyncPlan:
+    """
+    Diff remote images against local files (order matters for screenshots).
+
+    Remote images are kept while they match the local list position by position; everything
+    after the first mismatch is deleted and the remaining local files are uploaded, so the
+    final remote order always equals the local order.
+    """
+    local = [_file_digests(f) for f in files]
+    keep: list[str] = []
+    for image, digests in zip(remote, local):
+        if not _same_image(image, digests):
+            break
+        keep.append(image["id"])
+    delete = [image["id"] for image in remote[len(keep) :]]
+    return ImageSyncPlan(keep=keep, delete=delete, upload=files[len(keep) :])
+
+
+def _sync_images(
+    service,
+    *,
+    package_name: str,
+    edit_id: str,
+    locale: str,
+    image_type: str,
+    files: Iterable[Path],
+    media_factory: Callable[[Path], object] = _default_media_factory,
+    execute: Callable[..., Any] = _execute_once,
+) -> ImageSyncPlan:
+    """Upload only new/changed images and delete only stale ones, based on remote SHA digests."""
+    files = list(files)
+    images = service.edits().images()
+    remote = execute(
+        images.list(packageName=package_name, editId=edit_id, language=locale, imageType=image_type)
+    ).get("images", [])
+    plan = _plan_image_sync(remote, files)
+    print(f"{image_type} ({locale}): keep {len(plan.keep)}, delete {len(plan.delete)}, upload {len(plan.upload)}")
+
+    for image_id in plan.delete:
+        execute(
+            images.delete(
+                packageName=package_name,
+                editId=edit_id,
+                language=locale,
+                imageType=image_type,
+                imageId=image_id,
+            )
+        )
+    for position, f in enumerate(plan.upload, len(plan.keep)):
+        execute(
+            images.upload(
+                packageName=package_name,
+                editId=edit_id,
+                language=locale,
+                imageType=image_type,
+                media_body=media_factory(f),
+            ),
+            already_applied=_upload_landed(
+                images,
+                execute,
+                package_name=package_name,
+                edit_id=edit_id,
+                locale=locale,
+                image_type=image_type,
+                position=position,
+                path=f,
+            ),
+        )
+    return plan
+
+
+LOCALE_DIR_RE = re.compile(r"^[a-z]{2,3}(-[A-Za-z0-9]{2,8})*$")
+
+
+def _discover_locales(metadata_root: Path) -> list[str]:
+    if not metadata_root.is_dir():
+        raise SystemExit(f"Metadata root not found: {metadata_root.as_posix()}")
+    locales = sorted(d.name for d in metadata_root.iterdir() if d.is_dir() and LOCALE_DIR_RE.match(d.name))
+    if not locales:
+        raise SystemExit(f"No locale directories under: {metadata_root.as_posix()}")
+    return locales
+
+
+def _load_all_listing_inputs(
+    metadata_root: Path, locales: list[str], package_name: str
+) -> tuple[list[ListingInputs], dict[str, float]]:
+    """Load and validate every locale concurrently; report all invalid locales at once."""
+
+    def load(locale: str) -> tuple[ListingInputs, float]:
+        start = time.perf_counter()
+        inputs = _load_listing_inputs(metadata_root, locale, package_name)
+        return (inputs, time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(locales)))) as pool:
+        futures = [(locale, pool.submit(load, locale)) for locale in locales]
+
+    listings: list[ListingInputs] = []
+    load_seconds: dict[str, float] = {}
+    errors: list[str] = []
+    for locale, future in futures:
+        try:
+            inputs, seconds = future.result()
+        except SystemExit as e:
+            errors.append(f"- {locale}: {e}")
+            continue
+        listings.append(inputs)
+        load_seconds[locale] = seconds
+    if errors:
+        raise SystemExit("Invalid listing metadata:\n" + "\n".join(errors))
+    return (listings, load_seconds)
+
+
+def _image_sets(listing: ListingInputs) -> list[tuple[str, list[Path]]]:
+    images_root = listing.images_root
+    return [
+        ("icon", [images_root / "icon.png"]),
+        ("featureGraphic", [images_root / "featureGraphic.png"]),
+        ("phoneScreenshots", _iter_sorted_images(images_root / "phoneScreenshots")),
+        ("sevenInchScreenshots", _iter_sorted_images(images_root / "sevenInchScreenshots")),
+        ("tenInchScreenshots", _iter_sorted_images(images_root / "tenInchScreenshots")),
+    ]
+
+
+def _sync_edit(
+    service,
+    listings: list[ListingInputs],
+    *,
+    edit_id: str,
+    image_sync: str,
+    workers: int,
+    policy: RetryPolicy,
+    thread_service: Callable[[], Any] | None = None,
+    media_factory: Callable[[Path], object] = _default_media_factory,
+) -> tuple[dict[str, float], list[ImageTypeReport]]:
+    """
+    Push listing text and image sets for every locale into one open edit (the caller commits).
+
+    Returns per-locale listing update seconds and per (locale, image type) reports.
+    """
+    thread_service = thread_service or (lambda: service)
+    execute = RetryingExecutor(policy)
+
+    # 1) Ensure listings exist / update required text fields
+    listing_seconds: dict[str, float] = {}
+    for listing in listings:
+        start = time.perf_counter()
+        execute(
+            service.edits().listings().update(
+                packageName=listing.package_name,
+                editId=edit_id,
+                language=listing.locale,
+                body={
+                    "title": listing.title,
+                    "shortDescription": listing.short_description,
+                    "fullDescription": listing.full_description,
+                },
+            )
+        )
+        listing_seconds[listing.locale] = time.perf_counter() - start
+
+    # 2) Upload images/screenshots. "diff" compares remote SHA digests and only touches what changed.
+    sync_fn = _sync_images if image_sync == "diff" else _upload_images
+    extra = {} if image_sync == "diff" else {"dry_run": False}
+
+    def make_job(listing: ListingInputs, image_type: str, files: list[Path]):
+        def job(execute) -> None:
+            sync_fn(
+                thread_service(),
+                package_name=listing.package_name,
+                edit_id=edit_id,
+                locale=listing.locale,
+                image_type=image_type,
+                files=files,
+                media_factory=media_factory,
+                execute=execute,
+                **extra,
+            )
+
+        return job
+
+    jobs = [
+        (listing.locale, image_type, make_job(listing, image_type, files))
+        for listing in listings
+        for image_type, files in _image_sets(listing)
+        if files
+    ]
+    reports = _run_image_jobs(jobs, workers=workers, policy=policy)
+    return (listing_seconds, reports)
+
+
+def _print_locale_timings(
+    load_seconds: dict[str, float], listing_seconds: dict[str, float], reports: list[ImageTypeReport]
+) -> None:
+    for locale in load_seconds:
+        mine = [r for r in reports if r.locale == locale]
+        print(
+            f"{locale}: load {load_seconds[locale]:.2f}s, listing {listing_seconds.get(locale, 0.0):.2f}s, "
+            f"images {sum(r.seconds for r in mine):.2f}s across {len(mine)} type(s) "
+            f"({sum(r.requests for r in mine)} request(s), {sum(r.retries for r in mine)} retries)"
+        )
 
 
 def main() -> None:
@@ -155,11 +555,34 @@ def main() -> None:
         help="Credentials file path (WIF external_account JSON or service account JSON). Defaults to PLAY_JSON_KEY_PATH/GOOGLE_APPLICATION_CREDENTIALS.",
     )
     parser.add_argument("--locale", default="pt-BR", help="Play listing locale (default: pt-BR)")
+    parser.add_argument(
+        "--all-locales",
+        action="store_true",
+        help="Sync every locale directory under --metadata-root in a single edit (ignores --locale).",
+    )
     parser.add_argument(
         "--metadata-root",
         default="fastlane/metadata/android",
         help="Fastlane metadata root (default: fastlane/metadata/android)",
     )
+    parser.add_argument(
+        "--image-sync",
+        choices=["diff", "replace"],
+        default="diff",
+        help="diff: upload only new/changed images by SHA digest (default). replace: deleteall + re-upload every image.",
+    )
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=4,
+        help="Image types uploaded concurrently inside the edit (default: 4). Order within a type is preserved.",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=5,
+        help="Retries per request on 408/429/5xx and connection errors, with exponential backoff + jitter (default: 5).",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Do not call the API; only validate and print actions.")
     args = parser.parse_args()
 
@@ -169,11 +592,14 @@ def main() -> None:
 
     repo_root = Path(__file__).resolve().parent.parent
     metadata_root = (repo_root / args.metadata_root).resolve()
-    listing = _load_listing_inputs(metadata_root, args.locale, package_name)
+    locales = _discover_locales(metadata_root) if args.all_locales else [args.locale]
+    listings, load_seconds = _load_all_listing_inputs(metadata_root, locales, package_name)
+    locale_label = ", ".join(locales)
 
     if args.dry_run:
-        print(f"[dry-run] package={listing.package_name} locale={listing.locale} metadata_root={metadata_root.as_posix()}")
-        print(f"[dry-run] title: {listing.title}")
+        print(f"[dry-run] package={package_name} locale(s)={locale_label} metadata_root={metadata_root.as_posix()}")
+        for listing in listings:
+            print(f"[dry-run] title ({listing.locale}): {listing.title}")
 
     creds_path = _get_creds_path(args.json_key_path)
     if args.dry_run:
@@ -184,71 +610,46 @@ def main() -> None:
 
     creds, _ = load_credentials_from_file(creds_path, scopes=[ANDROIDPUBLISHER_SCOPE])
     service = build("androidpublisher", "v3", credentials=creds, cache_discovery=False)
+    # The underlying httplib2 transport is not thread-safe: upload workers each build their own client.
+    thread_service = _thread_local(lambda: build("androidpublisher", "v3", credentials=creds, cache_discovery=False))
 
     if args.dry_run:
+        # Dry runs never query the API, so they print the full replace plan instead of a diff.
         edit_id = "dry-run-edit"
+        for listing in listings:
+            print(f"[dry-run] listings.update ({listing.locale})")
+            for image_type, files in _image_sets(listing):
+                _upload_images(
+                    service,
+                    package_name=package_name,
+                    edit_id=edit_id,
+                    locale=listing.locale,
+                    image_type=image_type,
+                    files=files,
+                    dry_run=True,
+                )
     else:
-        edit = service.edits().insert(packageName=listing.package_name, body={}).execute()
+        # One edit for every locale: a single insert and a single commit.
+        edit = service.edits().insert(packageName=package_name, body={}).execute()
         edit_id = edit["id"]
-
-    # 1) Ensure listing exists / update required text fields
-    listing_body = {
-        "title": listing.title,
-        "shortDescription": listing.short_description,
-        "fullDescription": listing.full_description,
-    }
-    if args.dry_run:
-        print(f"[dry-run] listings.update ({listing.locale})")
-    else:
-        service.edits().listings().update(
-            packageName=listing.package_name,
-            editId=edit_id,
-            language=listing.locale,
-            body=listing_body,
-        ).execute()
-
-    # 2) Upload images/screenshots (replace existing)
-    images_root = listing.images_root
-    _upload_images(
-        service,
-        package_name=listing.package_name,
-        edit_id=edit_id,
-        locale=listing.locale,
-        image_type="icon",
-        files=[images_root / "icon.png"],
-        dry_run=args.dry_run,
-    )
-    _upload_images(
-        service,
-        package_name=listing.package_name,
-        edit_id=edit_id,
-        locale=listing.locale,
-        image_type="featureGraphic",
-        files=[images_root / "featureGraphic.png"],
-        dry_run=args.dry_run,
-    )
-
-    for folder, image_type in [
-        ("phoneScreenshots", "phoneScreenshots"),
-        ("sevenInchScreenshots", "sevenInchScreenshots"),
-        ("tenInchScreenshots", "tenInchScreenshots"),
-    ]:
-        _upload_images(
+        listing_seconds, reports = _sync_edit(
             service,
-            package_name=listing.package_name,
+            listings,
             edit_id=edit_id,
-            locale=listing.locale,
-            image_type=image_type,
-            files=_iter_sorted_images(images_root / folder),
-            dry_run=args.dry_run,
+            image_sync=args.image_sync,
+            workers=args.upload_workers,
+            policy=RetryPolicy(max_retries=args.max_retries),
+            thread_service=thread_service,
         )
+        _print_image_reports(reports)
+        _print_locale_timings(load_seconds, listing_seconds, reports)
 
     # 3) Commit
     if args.dry_run:
         print("[dry-run] edits.commit")
     else:
         try:
-            service.edits().commit(packageName=listing.package_name, editId=edit_id).execute()
+            service.edits().commit(packageName=package_name, editId=edit_id).execute()
         except Exception as e:
             # In early Play Console onboarding, apps can remain in "draft" state. In that state,
             # the Android Publisher API can reject edit commits with this message.
@@ -266,7 +667,7 @@ def main() -> None:
                 return
             raise
 
-        print(f"Synced Play Store listing for {listing.package_name} ({listing.locale}).")
+        print(f"Synced Play Store listing for {package_name} ({locale_label}).")
 
 
 if __name__ == "__main__":
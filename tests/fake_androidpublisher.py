@@ -0,0 +1,195 @@
+"""
+In-memory stand-in for the parts of the Android Publisher v3 `edits()` API used by
+scripts/sync_play_store_listing.py, so listing sync logic can be tested offline.
+
+Uploaded media is whatever the caller's media factory returns; pass `media_factory=Path`-like
+callables (e.g. `lambda p: p`) and the fake reads the file to compute Play-style SHA digests.
+
+`latency` adds a fixed delay to every request and `fail_next()` queues HTTP-style failures for a
+method, so retry/backoff and concurrency behaviour can be exercised without the network. With
+`after=True` the request takes effect before the error is raised, like a response lost in transit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+class FakeResponse:
+    def __init__(self, status: int) -> None:
+        self.status = status
+
+
+class FakeHttpError(Exception):
+    """Shaped like googleapiclient.errors.HttpError (`.resp.status`)."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"HTTP {status}")
+        self.resp = FakeResponse(status)
+
+
+class FakeRequest:
+    def __init__(self, publisher: "FakePublisher", method: str, fn: Callable[[], Any]) -> None:
+        self._p = publisher
+        self._method = method
+        self._fn = fn
+
+    def execute(self) -> Any:
+        failure = self._p._before(self._method)
+        if failure and not failure[1]:
+            raise FakeHttpError(failure[0])
+        with self._p._lock:
+            result = self._fn()
+        if failure:
+            raise FakeHttpError(failure[0])
+        return result
+
+
+def _image_record(image_id: str, data: bytes) -> dict:
+    return {
+        "id": image_id,
+        "url": f"https://play.example/{image_id}",
+        "sha1": hashlib.sha1(data).hexdigest(),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+class FakeImages:
+    def __init__(self, publisher: "FakePublisher") -> None:
+        self._p = publisher
+
+    def _slot(self, packageName: str, editId: str, language: str, imageType: str) -> list[dict]:
+        self._p._require_edit(editId)
+        return self._p.images.setdefault((packageName, language, imageType), [])
+
+    def list(self, *, packageName, editId, language, imageType) -> FakeRequest:
+        def run() -> dict:
+            self._p.calls.append(("list", imageType))
+            images = self._slot(packageName, editId, language, imageType)
+            return {"images": [dict(image) for image in images]} if images else {}
+
+        return FakeRequest(self._p, "list", run)
+
+    def delete(self, *, packageName, editId, language, imageType, imageId) -> FakeRequest:
+        def run() -> None:
+            self._p.calls.append(("delete", imageType))
+            images = self._slot(packageName, editId, language, imageType)
+            images[:] = [image for image in images if image["id"] != imageId]
+
+        return FakeRequest(self._p, "delete", run)
+
+    def deleteall(self, *, packageName, editId, language, imageType) -> FakeRequest:
+        def run() -> dict:
+            self._p.calls.append(("deleteall", imageType))
+            images = self._slot(packageName, editId, language, imageType)
+            deleted = [dict(image) for image in images]
+            images.clear()
+            return {"deleted": deleted}
+
+        return FakeRequest(self._p, "deleteall", run)
+
+    def upload(self, *, packageName, editId, language, imageType, media_body) -> FakeRequest:
+        def run() -> dict:
+            self._p.calls.append(("upload", imageType))
+            data = Path(media_body).read_bytes()
+            record = _image_record(f"img-{next(self._p._ids)}", data)
+            self._slot(packageName, editId, language, imageType).append(record)
+            return {"image": dict(record)}
+
+        return FakeRequest(self._p, "upload", run)
+
+
+class FakeListings:
+    def __init__(self, publisher: "FakePublisher") -> None:
+        self._p = publisher
+
+    def update(self, *, packageName, editId, language, body) -> FakeRequest:
+        def run() -> dict:
+            self._p._require_edit(editId)
+            self._p.calls.append(("listings.update", language))
+            self._p.listings[(packageName, language)] = dict(body)
+            return dict(body, language=language)
+
+        return FakeRequest(self._p, "update", run)
+
+
+class FakeEdits:
+    def __init__(self, publisher: "FakePublisher") -> None:
+        self._p = publisher
+
+    def images(self) -> FakeImages:
+        return FakeImages(self._p)
+
+    def listings(self) -> FakeListings:
+        return FakeListings(self._p)
+
+    def insert(self, *, packageName, body) -> FakeRequest:
+        def run() -> dict:
+            edit_id = f"edit-{next(self._p._ids)}"
+            self._p.open_edits.add(edit_id)
+            self._p.calls.append(("insert", edit_id))
+            return {"id": edit_id}
+
+        return FakeRequest(self._p, "insert", run)
+
+    def commit(self, *, packageName, editId) -> FakeRequest:
+        def run() -> dict:
+            self._p._require_edit(editId)
+            self._p.open_edits.discard(editId)
+            self._p.calls.append(("commit", editId))
+            return {"id": editId}
+
+        return FakeRequest(self._p, "commit", run)
+
+
+class FakePublisher:
+    """Mimics `googleapiclient.discovery.build("androidpublisher", "v3", ...)`."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.images: dict[tuple[str, str, str], list[dict]] = {}
+        self.listings: dict[tuple[str, str], dict] = {}
+        self.open_edits: set[str] = set()
+        self.calls: list[tuple[str, str]] = []
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._failures: dict[str, list[tuple[int, bool]]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def fail_next(self, method: str, times: int = 1, status: int = 503, after: bool = False) -> None:
+        with self._lock:
+            self._failures.setdefault(method, []).extend([(status, after)] * times)
+
+    def _before(self, method: str) -> tuple[int, bool] | None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            pending = self._failures.get(method)
+            failure = pending.pop(0) if pending else None
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if failure is not None:
+            self.calls.append((f"{method}:failed", str(failure[0])))
+        return failure
+
+    def _require_edit(self, edit_id: str) -> None:
+        if edit_id not in self.open_edits:
+            raise RuntimeError(f"Edit {edit_id} is not open")
+
+    def edits(self) -> FakeEdits:
+        return FakeEdits(self)
+
+    def seed_images(self, package_name: str, language: str, image_type: str, files: list[Path]) -> None:
+        slot = self.images.setdefault((package_name, language, image_type), [])
+        for f in files:
+            slot.append(_image_record(f"img-{next(self._ids)}", f.read_bytes()))
@@ -0,0 +1,97 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engdigital.asset_resolver import APP_ROOT, MANIFEST_VERSION, AssetResolver  # noqa: E402
+
+
+class AssetResolverTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def _write_manifest(self, assets: dict) -> None:
+        path = self.root / "assets" / "manifest.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"version": MANIFEST_VERSION, "assets": assets}), encoding="utf-8")
+
+    def _touch(self, relative: str, text: str = "") -> None:
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def test_lookups_come_from_the_manifest_without_probing(self) -> None:
+        self._write_manifest(
+            {
+                "icon": {"path": "assets/images/icon.png", "size": [512, 512], "sha256": "ab"},
+                "ui-1x": {"path": "assets/atlas/ui-1x.atlas", "size": [64, 64], "sprites": ["logo"]},
+            }
+        )
+        resolver = AssetResolver(self.root, dev_mode=True)
+        with mock.patch.object(Path, "exists", side_effect=AssertionError("probed")):
+            record = resolver.get("icon")
+            self.assertEqual(record.path, str(self.root / "assets/images/icon.png"))
+            self.assertEqual(record.size, (512, 512))
+            self.assertEqual(resolver.atlas_uri("ui", "logo"), f"atlas://{(self.root / 'assets/atlas/ui-1x').as_posix()}/logo")
+            self.assertIsNone(resolver.atlas_uri("ui", "missing"))
+
+    def test_release_mode_never_probes_for_unlisted_names(self) -> None:
+        self._write_manifest({})
+        self._touch("assets/images/logo.png")
+        resolver = AssetResolver(self.root, dev_mode=False)
+        with mock.patch.object(Path, "exists", side_effect=AssertionError("probed")):
+            self.assertIsNone(resolver.path("logo"))
+
+    def test_dev_mode_probes_candidates_once(self) -> None:
+        self._touch("assets/store/icon_512.png")  # store art is not a runtime candidate
+        self._touch("assets/atlas/ui-2x.atlas", json.dumps({"ui-2x-0.png": {"logo": [0, 0, 8, 8]}}))
+        resolver = AssetResolver(self.root, dev_mode=True)
+        self.assertIsNone(resolver.path("icon"))
+        self.assertIsNotNone(resolver.atlas_uri("ui", "logo"))
+
+        self._touch("assets/images/icon.png")
+        self.assertIsNone(resolver.path("icon"))
+        fresh = AssetResolver(self.root, dev_mode=True)
+        self.assertEqual(fresh.path("icon"), str(self.root / "assets/images/icon.png"))
+        self.assertEqual(fresh.get("icon").size, (0, 0))
+
+    def test_density_picks_the_smallest_sharp_variant(self) -> None:
+        self._write_manifest(
+            {
+                f"ui-{scale}x": {"path": f"assets/atlas/ui-{scale}x.atlas", "size": [8, 8], "sprites": ["logo"]}
+                for scale in (1, 2, 3)
+            }
+        )
+        resolver = AssetResolver(self.root, dev_mode=False)
+        cases = {0.75: "ui-1x", 1.0: "ui-1x", 1.5: "ui-2x", 2.0: "ui-2x", 2.625: "ui-3x", 3.5: "ui-3x"}
+        for density, expected in cases.items():
+            self.assertEqual(resolver.for_density("ui", density).name, expected, density)
+        self.assertTrue(resolver.atlas_uri("ui", "logo", 1.5).endswith("/ui-2x/logo"))
+        self.assertIsNone(resolver.for_density("icon", 2.0))
+
+    def test_missing_variants_fall_back_to_the_densest_available(self) -> None:
+        self._write_manifest({"ui-1x": {"path": "assets/atlas/ui-1x.atlas", "size": [8, 8], "sprites": ["logo"]}})
+        resolver = AssetResolver(self.root, dev_mode=False)
+        self.assertEqual(resolver.for_density("ui", 3.0).name, "ui-1x")
+
+    def test_manifest_with_another_version_is_ignored(self) -> None:
+        path = self.root / "assets" / "manifest.json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"version": 99, "assets": {"icon": {"path": "x.png", "size": [1, 1]}}}))
+        self.assertIsNone(AssetResolver(self.root, dev_mode=False).get("icon"))
+
+    def test_bundled_manifest_resolves_the_app_images(self) -> None:
+        resolver = AssetResolver(APP_ROOT, dev_mode=False)
+        for name in ("icon", "logo"):
+            self.assertTrue(Path(resolver.path(name)).is_file(), name)
+        self.assertIsNotNone(resolver.atlas_uri("ui", "logo"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import bench_suite  # noqa: E402
+from bench_suite import Case, compare  # noqa: E402
+
+
+def results(**medians: float) -> dict:
+    return {"version": bench_suite.RESULTS_VERSION, "cases": {name: {"median_ms": ms} for name, ms in medians.items()}}
+
+
+class CompareTests(unittest.TestCase):
+    def test_regression_needs_both_the_percentage_and_the_minimum_delta(self) -> None:
+        baseline = results(scan=100.0, parse=1.0, build=100.0)
+        current = results(scan=130.0, parse=1.9, build=120.0)
+        verdicts = {c.name: c.regressed for c in compare(current, baseline, threshold=25, min_delta_ms=2)}
+        # parse is 90% slower but only 0.9 ms; build is 20% slower.
+        self.assertEqual(verdicts, {"scan": True, "parse": False, "build": False})
+
+    def test_per_case_thresholds_in_the_baseline_override_the_default(self) -> None:
+        baseline = dict(results(app=400.0), thresholds={"app": 50})
+        (comparison,) = compare(results(app=560.0), baseline, threshold=25, min_delta_ms=2)
+        self.assertEqual(comparison.threshold, 50)
+        self.assertAlmostEqual(comparison.change, 40.0)
+        self.assertFalse(comparison.regressed)
+
+    def test_cases_missing_from_the_baseline_are_new(self) -> None:
+        (comparison,) = compare(results(scan=999.0), None, threshold=25, min_delta_ms=2)
+        self.assertIsNone(comparison.baseline_ms)
+        self.assertIsNone(comparison.change)
+        self.assertFalse(comparison.regressed)
+
+        lines = []
+        bench_suite.print_comparison([comparison], write=lines.append)
+        self.assertTrue(lines[1].endswith("new"))
+
+    def test_updated_baseline_keeps_other_cases_and_thresholds(self) -> None:
+        old = dict(results(scan=100.0, parse=1.0), thresholds={"scan": 40})
+        new = dict(results(scan=90.0), machine={"cpus": 4}, repeat=3)
+        updated = bench_suite.updated_baseline(new, old)
+        self.assertEqual(updated["cases"], {"scan": {"median_ms": 90.0}, "parse": {"median_ms": 1.0}})
+        self.assertEqual(updated["thresholds"], {"scan": 40})
+
+
+class SuiteTests(unittest.TestCase):
+    def test_suite_times_cases_and_skips_missing_requirements(self) -> None:
+        calls = []
+
+        def sample(ws) -> float:
+            calls.append(ws.tmp)
+            return float(len(calls))
+
+        cases = [Case("fake", sample), Case("needs_module", sample, ("engdigital_missing_module",))]
+        out = bench_suite.run_suite(cases, repeat=3, write=lambda line: None)
+
+        self.assertEqual(len(calls), 4)  # one warm-up run plus three timed runs
+        self.assertEqual(out["cases"]["fake"]["samples_ms"], [2.0, 3.0, 4.0])
+        self.assertEqual(out["cases"]["fake"]["median_ms"], 3.0)
+        self.assertEqual(out["skipped"], {"needs_module": "engdigital_missing_module is not installed"})
+
+    def test_first_frame_is_read_from_the_startup_trace(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            trace = Path(tmp) / "trace.json"
+            events = [{"name": "build", "ph": "X", "ts": 10.0}, {"name": "first frame", "ph": "i", "ts": 412500.0}]
+            trace.write_text(json.dumps({"traceEvents": events}), encoding="utf-8")
+            self.assertEqual(bench_suite.first_frame_ms(trace), 412.5)
+
+    def test_committed_baseline_covers_every_case(self) -> None:
+        baseline = bench_suite.load_json(bench_suite.DEFAULT_BASELINE)
+        self.assertEqual(set(baseline["cases"]), {case.name for case in bench_suite.CASES})
+
+
+if __name__ == "__main__":
+    unittest.main()
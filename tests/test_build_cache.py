@@ -0,0 +1,52 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from build_cache import BuildCache, input_key  # noqa: E402
+
+
+class BuildCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.cache_path = self.root / ".cache" / "asset-build.json"
+        self.source = self.root / "source.png"
+        self.source.write_bytes(b"source-v1")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _build(self, *, force: bool = False) -> BuildCache:
+        cache = BuildCache(self.root, self.cache_path, force=force)
+        key = input_key(params={"size": [10, 10]}, sources=[self.source])
+        if not cache.is_fresh("out.png", key):
+            (self.root / "out.png").write_bytes(self.source.read_bytes())
+            cache.record("out.png", key)
+        cache.save()
+        return cache
+
+    def test_unchanged_inputs_are_reused(self) -> None:
+        self.assertEqual(self._build().rebuilt, ["out.png"])
+        self.assertEqual(self._build().reused, ["out.png"])
+
+    def test_changed_source_or_output_triggers_rebuild(self) -> None:
+        self._build()
+        self.source.write_bytes(b"source-v2")
+        self.assertEqual(self._build().rebuilt, ["out.png"])
+
+        (self.root / "out.png").write_bytes(b"edited by hand")
+        self.assertEqual(self._build().rebuilt, ["out.png"])
+
+        (self.root / "out.png").unlink()
+        self.assertEqual(self._build().rebuilt, ["out.png"])
+
+    def test_force_rebuilds_everything(self) -> None:
+        self._build()
+        self.assertEqual(self._build(force=True).rebuilt, ["out.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,48 +1,130 @@
+import os
+import sys
+import tempfile
 import unittest
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
 
-def parse_buildozer_spec(path: str = "buildozer.spec") -> dict[str, str]:
-    values: dict[str, str] = {}
-    in_app = False
+from buildozer_spec import SPEC_PATH, BuildozerSpec, load  # noqa: E402
 
-    for raw in Path(path).read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            in_app = line == "[app]"
-            continue
-        if not in_app or "=" not in line:
-            continue
-        key, value = [x.strip() for x in line.split("=", 1)]
-        values[key] = value
+SAMPLE = """# header comment
+[app]
+title = Demo
+package.name = demo
+# android.api = 33
+android.api = 35
 
-    return values
+[buildozer]
+log_level = 2
+"""
 
 
 class BuildozerSpecTests(unittest.TestCase):
     def test_package_name_is_present(self) -> None:
-        spec = parse_buildozer_spec()
+        spec = load(SPEC_PATH)
         self.assertIn("package.domain", spec)
         self.assertIn("package.name", spec)
 
-        package_name = f"{spec['package.domain']}.{spec['package.name']}"
+        package_name = f"{spec.get('package.domain')}.{spec.get('package.name')}"
         self.assertTrue(package_name)
         self.assertIn(".", package_name)
 
     def test_release_artifact_is_aab(self) -> None:
-        spec = parse_buildozer_spec()
-        self.assertEqual(spec.get("android.release_artifact", "").strip().lower(), "aab")
+        spec = load(SPEC_PATH)
+        self.assertEqual((spec.get("android.release_artifact") or "").strip().lower(), "aab")
 
     def test_target_api_is_35_or_higher(self) -> None:
-        spec = parse_buildozer_spec()
+        spec = load(SPEC_PATH)
         self.assertIn("android.api", spec)
 
-        api_raw = spec.get("android.api", "").strip()
+        api_raw = (spec.get("android.api") or "").strip()
         self.assertTrue(api_raw.isdigit(), f"android.api must be numeric (got: {api_raw!r})")
         self.assertGreaterEqual(int(api_raw), 35)
 
+    def test_store_and_tooling_dirs_are_not_packaged(self) -> None:
+        spec = load(SPEC_PATH)
+        excluded = {d.strip() for d in (spec.get("source.exclude_dirs") or "").split(",")}
+        self.assertTrue({"fastlane", "assets/store", "benchmarks", "scripts", "tests", ".cache"} <= excluded)
+
+    def test_repo_spec_round_trips_unchanged(self) -> None:
+        text = SPEC_PATH.read_text(encoding="utf-8")
+        self.assertEqual(BuildozerSpec(text).render(), text)
+
+
+class BuildozerSpecEditTests(unittest.TestCase):
+    def test_lookup_skips_comments_and_other_sections(self) -> None:
+        spec = BuildozerSpec(SAMPLE)
+        self.assertEqual(spec.get("android.api"), "35")
+        self.assertIsNone(spec.get("log_level"))
+        self.assertEqual(spec.get("log_level", section="buildozer"), "2")
+        self.assertEqual(spec.sections, ["app", "buildozer"])
+
+    def test_set_replaces_in_place_and_appends_to_section(self) -> None:
+        spec = BuildozerSpec(SAMPLE)
+        spec.set("title", "Other")
+        spec.set("android.sdk_path", "/opt/sdk")
+        lines = spec.render().splitlines()
+        self.assertEqual(lines[2], "title = Other")
+        self.assertEqual(lines[6], "android.sdk_path = /opt/sdk")
+        self.assertEqual(lines[8], "[buildozer]")
+        self.assertEqual(spec.get("android.sdk_path"), "/opt/sdk")
+
+        spec.set("key", "value", section="extra")
+        self.assertTrue(spec.render().endswith("[extra]\nkey = value\n"))
+
+    def test_requirement_version_reads_pins_only(self) -> None:
+        spec = BuildozerSpec("[app]\nrequirements = python3, Kivy == 2.2.1,plyer\n")
+        self.assertEqual(spec.requirement_version("kivy"), "2.2.1")
+        self.assertIsNone(spec.requirement_version("plyer"))
+        self.assertIsNone(BuildozerSpec(SAMPLE).requirement_version("kivy"))
+
+    def test_apk_kivy_matches_the_desktop_requirements(self) -> None:
+        # app.kv.kvc is built with the pinned Kivy and is only valid for that version.
+        pins = dict(
+            line.split("==", 1)
+            for line in (SPEC_PATH.parent / "requirements.txt").read_text(encoding="utf-8").split()
+            if "==" in line
+        )
+        self.assertEqual(load(SPEC_PATH).requirement_version("kivy"), pins["kivy"])
+
+    def test_packages_applies_the_source_filters(self) -> None:
+        spec = BuildozerSpec(
+            "[app]\nsource.include_exts = py,png\nsource.include_patterns = data/*.json\n"
+            "source.exclude_dirs = assets/store, tests\nsource.exclude_patterns = *_debug.py\n"
+        )
+        self.assertTrue(spec.packages("assets/images/icon.png"))
+        self.assertTrue(spec.packages("data/content.json"))
+        self.assertFalse(spec.packages("assets/store/icon_512.png"))
+        self.assertFalse(spec.packages("tests/test_x.py"))
+        self.assertFalse(spec.packages("main_debug.py"))
+        self.assertFalse(spec.packages("notes.json"))
+        self.assertTrue(spec.packages("assets/storefront.png"))
+
+    def test_crlf_newlines_are_preserved(self) -> None:
+        text = SAMPLE.replace("\n", "\r\n")
+        spec = BuildozerSpec(text)
+        self.assertEqual(spec.render(), text)
+        spec.set("title", "Other")
+        self.assertIn("title = Other\r\n", spec.render())
+
+    def test_write_is_atomic_and_load_is_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "buildozer.spec"
+            path.write_text(SAMPLE, encoding="utf-8")
+            spec = load(path)
+            self.assertIs(load(path), spec)
+
+            spec.set("android.api", "36")
+            spec.write()
+            self.assertEqual(os.listdir(tmp), ["buildozer.spec"])
+            self.assertIn("android.api = 36\n", path.read_text(encoding="utf-8"))
+            self.assertIs(load(path), spec)
+
+            path.write_text(SAMPLE.replace("Demo", "Changed"), encoding="utf-8")
+            os.utime(path, ns=(1, 1))
+            self.assertEqual(load(path).get("title"), "Changed")
+
 
 if __name__ == "__main__":
     unittest.main()
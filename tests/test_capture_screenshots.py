@@ -0,0 +1,116 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import capture_screenshots  # noqa: E402
+import generate_play_store_assets as gen  # noqa: E402
+
+HAS_KIVY = importlib.util.find_spec("kivy") is not None
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is only needed by the asset scripts
+    Image = None
+
+
+class ScreenshotSetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def test_every_device_gets_one_numbered_file_per_screen(self) -> None:
+        for device in capture_screenshots.DEVICES:
+            names = [out.name for out in device.outputs(self.root)]
+            self.assertEqual(names, [f"{i}.png" for i in range(1, len(capture_screenshots.SCREENS) + 1)])
+            width, height = device.size
+            self.assertLessEqual(height, 2 * width)  # Play rejects screenshots longer than 2:1
+
+    def test_prune_removes_only_numbered_files_past_the_set(self) -> None:
+        for name in ("1.png", "2.png", "3.png", "4.png", "cover.png"):
+            (self.root / name).write_bytes(b"png")
+        removed = gen.prune_screenshots(self.root, keep=2)
+        self.assertEqual([path.name for path in removed], ["3.png", "4.png"])
+        self.assertEqual(sorted(path.name for path in self.root.iterdir()), ["1.png", "2.png", "cover.png"])
+        self.assertEqual(gen.prune_screenshots(self.root / "missing", keep=2), [])
+
+    def test_failed_capture_in_auto_mode_is_fatal(self) -> None:
+        argv = ["generate_play_store_assets.py", "--metadata-root", str(self.root), "--link-mode", "copy"]
+        with mock.patch.object(sys, "argv", argv), mock.patch.object(
+            gen.importlib.util, "find_spec", return_value=object()
+        ), mock.patch.object(gen, "_capture_screenshots", return_value="no EGL display") as run_capture:
+            with self.assertRaises(SystemExit) as raised:
+                gen.main()
+        run_capture.assert_called_once()
+        self.assertIn("no EGL display", str(raised.exception))
+        self.assertEqual(list(self.root.rglob("*Screenshots/*.png")), [])  # no presplash fallback
+
+    def test_capture_inputs_cover_the_app_sources(self) -> None:
+        names = {path.relative_to(ROOT).as_posix() for path in gen.capture_inputs(ROOT)}
+        self.assertTrue({"app.kv", "engdigital/app.py", "engdigital/content.json"} <= names)
+        self.assertTrue(any(name.startswith("assets/atlas/") for name in names))
+
+
+@unittest.skipIf(not HAS_KIVY or Image is None, "Kivy and Pillow are required")
+class HeadlessCaptureTests(unittest.TestCase):
+    def test_phone_screens_are_captured_in_one_process(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            # Like a previous presplash run: every screenshot is a hardlink to one file.
+            placeholder = Path(tmp) / "sevenInchScreenshots" / "1.png"
+            placeholder.parent.mkdir()
+            placeholder.write_bytes(b"presplash")
+            phone = Path(tmp) / "phoneScreenshots"
+            phone.mkdir()
+            for index in range(1, len(capture_screenshots.SCREENS) + 1):
+                try:
+                    os.link(placeholder, phone / f"{index}.png")
+                except OSError:
+                    self.skipTest("hardlinks not supported here")
+
+            proc = subprocess.run(
+                [
+                    sys.executable,
+                    str(ROOT / "scripts" / "capture_screenshots.py"),
+                    "--images-root",
+                    tmp,
+                    "--devices",
+                    "phoneScreenshots",
+                ],
+                capture_output=True,
+                text=True,
+                timeout=300,
+            )
+            self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+            (device,) = [d for d in capture_screenshots.DEVICES if d.folder == "phoneScreenshots"]
+            digests = set()
+            for out in device.outputs(Path(tmp)):
+                with Image.open(out) as img:
+                    self.assertEqual((img.mode, img.size), ("RGB", device.size))
+                    digests.add(img.tobytes())
+            self.assertEqual(len(digests), len(capture_screenshots.SCREENS))  # every screen differs
+            self.assertEqual(placeholder.read_bytes(), b"presplash")  # links were replaced, not written through
+
+    def test_screen_order_matches_the_app(self) -> None:
+        code = "from engdigital.app import SCREENS; print(','.join(name for name, _ in SCREENS))"
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            env={**os.environ, "KIVY_NO_ARGS": "1", "SDL_VIDEODRIVER": "offscreen"},
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        self.assertEqual(proc.stdout.strip().splitlines()[-1], ",".join(capture_screenshots.SCREENS))
+
+
+if __name__ == "__main__":
+    unittest.main()
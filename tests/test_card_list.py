@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+HAS_KIVY = importlib.util.find_spec("kivy") is not None
+
+if HAS_KIVY:
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+    from engdigital.card_list import CardList, item_key  # noqa: E402
+    from engdigital.content import load_content  # noqa: E402
+    from engdigital.screens.services_screen import ServicesScreen  # noqa: E402
+    from engdigital.screens.team_screen import TeamScreen  # noqa: E402
+
+
+ITEMS = [
+    {"heading": "A", "summary": "first", "bullets": ["x"]},
+    {"heading": "B", "summary": "second", "bullets": ["y", "z"]},
+    {"viewclass": "ListHeading", "text": "Section"},
+]
+
+
+@unittest.skipIf(not HAS_KIVY, "Kivy is not installed")
+class CardListTests(unittest.TestCase):
+    def _card_list(self) -> "CardList":
+        card_list = CardList(default_height=100, width=300)
+        card_list.items = ITEMS
+        return card_list
+
+    def test_items_become_data_rows_with_estimated_heights(self) -> None:
+        card_list = self._card_list()
+        self.assertEqual([row["viewclass"] for row in card_list.data], ["DetailCard", "DetailCard", "ListHeading"])
+        self.assertEqual([row["height"] for row in card_list.data], [100, 100, 100])
+        self.assertEqual(card_list.data[0]["key"], item_key(ITEMS[0]))
+        self.assertNotEqual(item_key(ITEMS[0]), item_key(ITEMS[1]))
+
+    def test_measured_heights_are_cached_per_width(self) -> None:
+        card_list = self._card_list()
+        card_list.remember_height(0, 140)
+        card_list.remember_height(1, 180)
+        self.assertEqual([row["height"] for row in card_list.data[:2]], [140, 180])
+
+        card_list.width = 500
+        card_list.remember_height(0, 90)
+        self.assertEqual(card_list.data[0]["height"], 90)
+
+        card_list.width = 300
+        self.assertEqual([row["height"] for row in card_list.data[:2]], [140, 180])
+        # A new list at a known width starts from the measured average instead of the default.
+        card_list.items = ITEMS + [{"heading": "C", "summary": "new", "bullets": []}]
+        self.assertEqual(card_list.data[3]["height"], 160)
+
+    def test_screens_expose_card_rows(self) -> None:
+        self.assertEqual(ServicesScreen().service_cards, [])
+        services = ServicesScreen(content=load_content()).service_cards
+        self.assertEqual(len(services), len(load_content().services))
+        self.assertTrue(services[0]["heading"].startswith("1) "))
+        self.assertTrue(all(isinstance(card["bullets"], list) for card in services))
+
+        team = TeamScreen(content=load_content()).team_cards
+        self.assertIn({"viewclass": "ListHeading", "text": "Projetos em destaque"}, team)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engdigital.content import (  # noqa: E402
+    CONTENT_PATH,
+    ContentError,
+    Service,
+    load_content,
+    parse_content,
+    parse_content_bytes,
+)
+
+
+class ContentStoreTests(unittest.TestCase):
+    def test_bundled_content_parses_into_slot_records(self) -> None:
+        content = load_content()
+        self.assertEqual(len(content.services), 3)
+        self.assertEqual(len(content.profiles), 2)
+        self.assertEqual(len(content.projects), 3)
+        self.assertEqual(len(content.stats), 3)
+
+        service = content.services[0]
+        self.assertIsInstance(service, Service)
+        self.assertFalse(hasattr(service, "__dict__"))
+        self.assertIsInstance(service.bullets, tuple)
+
+    def test_load_is_memoized(self) -> None:
+        self.assertIs(load_content(), load_content(CONTENT_PATH))
+
+    def test_invalid_documents_are_rejected_with_a_location(self) -> None:
+        data = json.loads(CONTENT_PATH.read_text(encoding="utf-8"))
+        data["projects"][1]["bullets"] = "not a list"
+        with self.assertRaisesRegex(ContentError, r"content\.projects\[1\]\.bullets"):
+            parse_content(data)
+
+        with self.assertRaisesRegex(ContentError, "version"):
+            parse_content(dict(data, version=99))
+        with self.assertRaisesRegex(ContentError, "invalid JSON"):
+            parse_content_bytes(b"{")
+
+    def test_other_files_are_cached_separately(self) -> None:
+        data = json.loads(CONTENT_PATH.read_text(encoding="utf-8"))
+        data["services"] = data["services"][:1]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "content.json"
+            path.write_text(json.dumps(data), encoding="utf-8")
+            self.assertEqual(len(load_content(path).services), 1)
+        self.assertEqual(len(load_content().services), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import json
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engdigital.content import CONTENT_PATH  # noqa: E402
+from engdigital.content_sync import ContentCache, bundle_digest, fetch_content, start_refresh  # noqa: E402
+
+
+class _ContentHandler(BaseHTTPRequestHandler):
+    """Serves `server.body` with an ETag and answers 304 to a matching If-None-Match."""
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        server = self.server
+        server.requests.append(dict(self.headers))
+        etag = server.etag
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(server.body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+class ContentSyncTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ContentHandler)
+        self.server.body = CONTENT_PATH.read_bytes()
+        self.server.etag = '"v1"'
+        self.server.status = 200
+        self.server.requests = []
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/app/content.json"
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = ContentCache(Path(tmp.name) / "content")
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_first_fetch_stores_body_and_etag(self) -> None:
+        result = fetch_content(self.url, self.cache, timeout=5)
+        self.assertEqual(result.status, "updated")
+        self.assertEqual(len(result.content.services), 3)
+        self.assertEqual(self.cache.body_path.read_bytes(), self.server.body)
+        self.assertEqual(self.cache.meta()["etag"], '"v1"')
+        self.assertEqual(self.cache.load(self.url), result.content)
+        self.assertNotIn("If-None-Match", self.server.requests[0])
+
+    def test_second_fetch_is_conditional_and_not_modified(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        result = fetch_content(self.url, self.cache, timeout=5)
+        self.assertEqual(result.status, "not-modified")
+        self.assertIsNone(result.content)
+        self.assertEqual(self.server.requests[1].get("If-None-Match"), '"v1"')
+
+    def test_changed_document_replaces_cache(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        data = json.loads(self.server.body)
+        data["stats"][0]["value"] = "+11"
+        self.server.body = json.dumps(data).encode("utf-8")
+        self.server.etag = '"v2"'
+
+        result = fetch_content(self.url, self.cache, timeout=5)
+        self.assertEqual(result.status, "updated")
+        self.assertEqual(result.content.stats[0].value, "+11")
+        self.assertEqual(self.cache.meta()["etag"], '"v2"')
+
+    def test_same_body_without_validators_is_not_an_update(self) -> None:
+        self.server.etag = ""
+        self.assertEqual(fetch_content(self.url, self.cache, timeout=5).status, "updated")
+        self.assertEqual(fetch_content(self.url, self.cache, timeout=5).status, "not-modified")
+
+    def test_invalid_document_keeps_cached_copy(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        self.server.body = b'{"version": 99}'
+        self.server.etag = '"broken"'
+
+        result = fetch_content(self.url, self.cache, timeout=5)
+        self.assertEqual(result.status, "error")
+        self.assertIn("version", result.error)
+        self.assertEqual(self.cache.meta()["etag"], '"v1"')
+        self.assertIsNotNone(self.cache.load(self.url))
+
+    def test_http_error_and_offline_server_keep_cached_copy(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        self.server.etag = ""
+        self.server.status = 500
+        self.assertEqual(fetch_content(self.url, self.cache, timeout=5).error, "HTTP 500")
+
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            offline_url = f"http://127.0.0.1:{probe.getsockname()[1]}/app/content.json"
+        result = fetch_content(offline_url, self.cache, timeout=2)
+        self.assertEqual(result.status, "error")
+        self.assertIsNotNone(self.cache.load(self.url))
+
+    def test_validators_are_not_sent_to_another_url(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        fetch_content(self.url + "?lang=en", self.cache, timeout=5)
+        self.assertNotIn("If-None-Match", self.server.requests[1])
+
+    def test_copy_from_another_url_or_no_url_is_not_used(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        self.assertIsNotNone(self.cache.load(self.url))
+        self.assertIsNone(self.cache.load(self.url + "?lang=en"))
+        self.assertIsNone(self.cache.load(None))  # CONTENT_URL disabled: bundled content only
+
+    def test_copy_from_a_build_with_other_bundled_content_is_not_used(self) -> None:
+        fetch_content(self.url, self.cache, timeout=5)
+        bundle = self.cache.directory.parent / "content.json"
+        bundle.write_bytes(CONTENT_PATH.read_bytes() + b"\n")  # the app update ships new content
+        updated = ContentCache(self.cache.directory, bundle)
+        self.assertNotEqual(updated.bundle, bundle_digest())
+        self.assertIsNone(updated.load(self.url))
+
+        # Fetched again in full (no validators), reported as an update and valid for this build.
+        result = fetch_content(self.url, updated, timeout=5)
+        self.assertNotIn("If-None-Match", self.server.requests[-1])
+        self.assertEqual(result.status, "updated")
+        self.assertIsNotNone(updated.load(self.url))
+        self.assertIsNone(self.cache.load(self.url))
+
+    def test_start_refresh_reports_updates_off_the_calling_thread(self) -> None:
+        updates = []
+
+        def on_update(content) -> None:
+            updates.append((content, threading.current_thread()))
+
+        start_refresh(self.url, self.cache, on_update, timeout=5).join(10)
+        self.assertEqual(len(updates), 1)
+        self.assertIsNot(updates[0][1], threading.current_thread())
+
+        errors = []
+        self.server.status = 404
+        self.server.etag = ""
+        start_refresh(self.url, self.cache, updates.append, on_error=errors.append, timeout=5).join(10)
+        self.assertEqual(errors, ["HTTP 404"])
+        self.assertEqual(len(updates), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is only needed by the asset scripts
+    Image = None
+
+
+def per_pixel_gradient(img, top, bottom) -> None:
+    width, height = img.size
+    for y in range(height):
+        ratio = y / max(height - 1, 1)
+        color = tuple(int(top[k] + (bottom[k] - top[k]) * ratio) for k in range(3))
+        for x in range(width):
+            img.putpixel((x, y), color)
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class GradientTests(unittest.TestCase):
+    def test_vertical_gradient_matches_per_pixel_fill(self) -> None:
+        import generate_assets
+
+        for size, top, bottom in [
+            ((64, 240), generate_assets.BRAND["bg"], generate_assets.BRAND["surface"]),
+            ((5, 3), (250, 148, 46), (12, 20, 30)),
+            ((4, 1), (0, 0, 0), (255, 255, 255)),
+        ]:
+            expected = Image.new("RGB", size)
+            per_pixel_gradient(expected, top, bottom)
+            actual = Image.new("RGB", size)
+            generate_assets.add_gradient(actual, top, bottom)
+            self.assertEqual(list(actual.getdata()), list(expected.getdata()), size)
+
+    def test_horizontal_multistop_gradient_hits_every_stop(self) -> None:
+        import generate_assets
+
+        img = Image.new("RGB", (101, 2))
+        generate_assets.add_multistop_gradient(
+            img,
+            [(0.0, (0, 0, 0)), (0.5, (200, 100, 0)), (1.0, (0, 0, 250))],
+            direction="horizontal",
+        )
+        self.assertEqual(img.getpixel((0, 1)), (0, 0, 0))
+        self.assertEqual(img.getpixel((50, 0)), (200, 100, 0))
+        self.assertEqual(img.getpixel((100, 1)), (0, 0, 250))
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class AssetManifestTests(unittest.TestCase):
+    def test_manifest_entries_are_unique_and_renderable(self) -> None:
+        import generate_assets
+
+        outputs = [spec.output for spec in generate_assets.ASSET_MANIFEST]
+        self.assertEqual(len(outputs), len(set(outputs)))
+        for spec in generate_assets.ASSET_MANIFEST:
+            self.assertIn(spec.kind, generate_assets.RENDERERS, spec.output)
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class AtlasTests(unittest.TestCase):
+    def test_packed_regions_hold_their_images_in_kivy_coordinates(self) -> None:
+        import generate_assets
+
+        images = [
+            ("red", Image.new("RGBA", (30, 20), (255, 0, 0, 255))),
+            ("green", Image.new("RGBA", (12, 40), (0, 255, 0, 255))),
+            ("blue", Image.new("RGBA", (50, 10), (0, 0, 255, 255))),
+        ]
+        sheet, coords = generate_assets.pack_atlas(images, padding=2)
+
+        self.assertEqual(set(coords), {"red", "green", "blue"})
+        for size in sheet.size:
+            self.assertEqual(size & (size - 1), 0, sheet.size)
+        boxes = []
+        for name, image in images:
+            x, y, w, h = coords[name]
+            self.assertEqual((w, h), image.size)
+            top = sheet.height - y - h  # Kivy atlas y is measured from the bottom.
+            region = sheet.crop((x, top, x + w, top + h))
+            self.assertEqual(region.getcolors(), [(w * h, image.getpixel((0, 0)))], name)
+            # Padding repeats the edge pixels so filtering never bleeds in a neighbour.
+            self.assertEqual(sheet.getpixel((x - 1, top)), image.getpixel((0, 0)), name)
+            boxes.append((x - 2, top - 2, x + w + 2, top + h + 2))
+        for i, a in enumerate(boxes):
+            for b in boxes[i + 1 :]:
+                self.assertTrue(a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1], (a, b))
+
+    def test_committed_variants_are_sized_per_density(self) -> None:
+        import json
+
+        import generate_assets
+
+        for density in generate_assets.ATLAS_DENSITIES:
+            atlas_path, sheet_path = generate_assets.atlas_outputs(generate_assets.atlas_variant_name(density))
+            sheets = json.loads((generate_assets.ROOT / atlas_path).read_text(encoding="utf-8"))
+            self.assertEqual(list(sheets), [Path(sheet_path).name])
+            for entry in generate_assets.ATLAS_ENTRIES:
+                self.assertEqual(sheets[Path(sheet_path).name][entry.name][2:], [entry.size_dp * density] * 2)
+
+    def test_atlas_entries_point_at_manifest_outputs(self) -> None:
+        import generate_assets
+
+        outputs = {spec.output for spec in generate_assets.ASSET_MANIFEST}
+        for entry in generate_assets.ATLAS_ENTRIES:
+            self.assertIn(entry.source, outputs)
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class RuntimeManifestTests(unittest.TestCase):
+    def test_committed_manifest_matches_the_committed_images(self) -> None:
+        import json
+
+        import generate_assets
+
+        committed = json.loads((generate_assets.ROOT / generate_assets.MANIFEST_PATH).read_text(encoding="utf-8"))
+        self.assertEqual(committed, generate_assets.build_runtime_manifest())
+
+    def test_every_manifest_path_is_packaged(self) -> None:
+        import json
+
+        import buildozer_spec
+        import generate_assets
+
+        spec = buildozer_spec.load()
+        paths = [generate_assets.MANIFEST_PATH]
+        for entry in generate_assets.build_runtime_manifest()["assets"].values():
+            paths.append(entry["path"])
+            if entry["path"].endswith(".atlas"):
+                sheets = json.loads((generate_assets.ROOT / entry["path"]).read_text(encoding="utf-8"))
+                paths += [(Path(entry["path"]).parent / sheet).as_posix() for sheet in sheets]
+        for path in paths:
+            self.assertTrue(spec.packages(path), path)
+
+    def test_entries_record_size_digest_and_atlas_sprites(self) -> None:
+        import generate_assets
+
+        manifest = generate_assets.build_runtime_manifest()["assets"]
+        self.assertEqual(manifest["icon"]["path"], "assets/images/icon.png")
+        self.assertEqual(manifest["icon"]["size"], [512, 512])
+        self.assertEqual(len(manifest["icon"]["sha256"]), 64)
+        for density in generate_assets.ATLAS_DENSITIES:
+            variant = manifest[f"ui-{density}x"]
+            self.assertEqual(variant["sprites"], sorted(entry.name for entry in generate_assets.ATLAS_ENTRIES))
+        self.assertIsNone(generate_assets.runtime_manifest_entry(["assets/missing.png"]))
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class FontIndexTests(unittest.TestCase):
+    def test_font_file_names_are_indexed_by_family_and_weight(self) -> None:
+        import font_index
+
+        cases = {
+            "Arial.ttf": ("arial", font_index.REGULAR),
+            "Arial Bold.ttf": ("arial", font_index.BOLD),
+            "arialbd.ttf": ("arial", font_index.BOLD),
+            "DejaVuSans-Bold.ttf": ("dejavusans", font_index.BOLD),
+            "LiberationSans-Regular.ttf": ("liberationsans", font_index.REGULAR),
+            "FreeSansBold.otf": ("freesans", font_index.BOLD),
+        }
+        for name, expected in cases.items():
+            face = font_index.classify_font_file(Path(name))
+            self.assertIsNotNone(face, name)
+            self.assertEqual((face.family, face.weight), expected, name)
+
+        self.assertIsNone(font_index.classify_font_file(Path("DejaVuSans-BoldOblique.ttf")))
+
+    def test_fonts_are_memoized_per_size(self) -> None:
+        import font_index
+
+        self.assertIs(font_index.load_font(24), font_index.load_font(24))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import generate_play_store_assets as gen  # noqa: E402
+
+
+class DedupWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "presplash.png"
+        self.src.write_bytes(b"x" * 1000)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_duplicates_are_written_once(self) -> None:
+        writer = gen.DedupWriter("auto")
+        outputs = [self.root / folder / "1.png" for folder in ("phone", "seven", "ten")]
+        for out in outputs:
+            writer.copy("presplash", self.src, out)
+
+        for out in outputs:
+            self.assertEqual(out.read_bytes(), self.src.read_bytes())
+        self.assertEqual(writer.bytes_written + writer.bytes_avoided, 3000)
+        self.assertEqual(sum(writer.methods.values()), 3)
+        self.assertGreaterEqual(writer.methods.get("copy", 0), 1)
+
+    def test_copy_mode_never_links(self) -> None:
+        writer = gen.DedupWriter("copy")
+        writer.copy("k", self.src, self.root / "a.png")
+        writer.copy("k", self.src, self.root / "b.png")
+        self.assertEqual((writer.bytes_written, writer.bytes_avoided), (2000, 0))
+
+    def test_replacing_a_hardlinked_output_does_not_write_through(self) -> None:
+        a, b = self.root / "a.png", self.root / "b.png"
+        gen._place(self.src, a, "copy")
+        try:
+            gen._place(a, b, "hardlink")
+        except OSError:
+            self.skipTest("hardlinks not supported here")
+
+        other = self.root / "other.png"
+        other.write_bytes(b"new content")
+        gen._place(other, a, "copy")
+
+        self.assertEqual(a.read_bytes(), b"new content")
+        self.assertEqual(b.read_bytes(), b"x" * 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
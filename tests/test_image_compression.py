@@ -0,0 +1,111 @@
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:  # pragma: no cover - Pillow is only needed by the asset scripts
+    Image = None
+
+
+def flat_art() -> "Image.Image":
+    img = Image.new("RGB", (256, 256), (12, 20, 30))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((30, 30, 226, 226), fill=(250, 148, 46))
+    draw.rectangle((90, 110, 166, 146), fill=(12, 20, 30))
+    return img
+
+
+def noise(size: int = 64) -> "Image.Image":
+    rng = random.Random(7)
+    return Image.frombytes("RGB", (size, size), bytes(rng.randrange(256) for _ in range(size * size * 3)))
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class ImageCompressionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def test_flat_art_becomes_a_palette_png_within_the_threshold(self) -> None:
+        import image_compression
+
+        path = self.dir / "icon.png"
+        flat_art().save(path)
+        result = image_compression.compress_file(path, image_compression.PROFILES["smallest"])
+
+        self.assertTrue(result.encoder.startswith("png-palette"), result)
+        self.assertLess(result.after, result.before)
+        self.assertEqual(result.after, path.stat().st_size)
+        with Image.open(path) as img:
+            self.assertEqual(img.format, "PNG")
+            self.assertEqual(img.mode, "P")
+            self.assertLessEqual(image_compression.rms_difference(img, flat_art()), 1.0)
+
+    def test_truecolor_only_keeps_a_lossless_24_bit_png(self) -> None:
+        import image_compression
+
+        path = self.dir / "feature.png"
+        flat_art().convert("RGBA").save(path)
+        result = image_compression.compress_file(path, image_compression.PROFILES["smallest"], truecolor_only=True)
+
+        self.assertEqual((result.encoder, result.rms), ("png", 0.0))
+        with Image.open(path) as img:
+            self.assertEqual(img.mode, "RGB")  # the fully opaque alpha channel is dropped
+            self.assertEqual(img.tobytes(), flat_art().tobytes())
+
+    def test_palette_is_rejected_when_the_difference_is_too_large(self) -> None:
+        import image_compression
+
+        encoder, _, rms = image_compression.encode_best(noise(), image_compression.PROFILES["smallest"])
+        self.assertEqual((encoder, rms), ("png", 0.0))
+
+    def test_transparency_survives(self) -> None:
+        import image_compression
+
+        img = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
+        ImageDraw.Draw(img).rectangle((8, 8, 24, 24), fill=(250, 148, 46, 255))
+        encoder, data, rms = image_compression.encode_best(img, image_compression.PROFILES["smallest"])
+        path = self.dir / "sprite.png"
+        path.write_bytes(data)
+        with Image.open(path) as decoded:
+            self.assertEqual(decoded.convert("RGBA").getpixel((0, 0))[3], 0)
+            self.assertEqual(decoded.convert("RGBA").getpixel((16, 16)), (250, 148, 46, 255))
+        self.assertLessEqual(rms, 1.0, encoder)
+
+    def test_fast_profile_only_tries_plain_png_and_never_grows_files(self) -> None:
+        import image_compression
+
+        fast = image_compression.PROFILES["fast"]
+        self.assertEqual([name for name, _, _ in image_compression.candidates(flat_art(), fast)], ["png"])
+
+        path = self.dir / "already.png"
+        flat_art().save(path, optimize=True)
+        before = path.read_bytes()
+        result = image_compression.compress_file(path, fast)
+        self.assertEqual((result.encoder, result.saved), ("kept", 0))
+        self.assertEqual(path.read_bytes(), before)
+
+    def test_report_totals_bytes_saved(self) -> None:
+        import image_compression
+
+        lines = []
+        image_compression.print_report(
+            [
+                image_compression.CompressionResult("a.png", 1000, 400, "png-palette16", 0.5),
+                image_compression.CompressionResult("b.png", 1000, 1000, "kept", 0.0),
+            ],
+            write=lines.append,
+        )
+        self.assertIn("saved      600 B", lines[0])
+        self.assertTrue(lines[-1].startswith("total"))
+        self.assertIn("(30.0%)", lines[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engdigital import intents  # noqa: E402
+from engdigital.intents import IntentDispatcher  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class IntentDispatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.launched = []
+        self.dispatcher = IntentDispatcher(launcher=self.launched.append, coalesce_seconds=1.0, clock=self.clock)
+
+    def _launch(self, uri: str):
+        thread = self.dispatcher.launch(uri)
+        if thread is not None:
+            thread.join(5)
+        return thread
+
+    def test_launch_runs_off_the_calling_thread_and_records_latency(self) -> None:
+        threads = []
+        dispatcher = IntentDispatcher(launcher=lambda uri: threads.append(threading.current_thread()))
+        dispatcher.launch("https://example.com").join(5)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertEqual(len(dispatcher.latencies_ms), 1)
+
+    def test_repeated_taps_within_the_window_are_coalesced(self) -> None:
+        self.assertIsNotNone(self._launch("https://example.com"))
+        self.clock.now += 0.4
+        self.assertIsNone(self._launch("https://example.com"))
+        self.assertIsNotNone(self._launch("mailto:a@example.com"))
+        self.clock.now += 1.0
+        self.assertIsNotNone(self._launch("https://example.com"))
+        self.assertEqual(self.launched, ["https://example.com", "mailto:a@example.com", "https://example.com"])
+
+    def test_launch_in_flight_is_not_repeated(self) -> None:
+        release = threading.Event()
+        dispatcher = IntentDispatcher(launcher=lambda uri: release.wait(5), coalesce_seconds=0, clock=self.clock)
+        first = dispatcher.launch("https://example.com")
+        self.assertIsNone(dispatcher.launch("https://example.com"))
+        release.set()
+        first.join(5)
+        self.assertIsNotNone(dispatcher.launch("https://example.com"))
+
+    def test_failed_launch_is_logged_and_can_be_retried(self) -> None:
+        def fail(uri: str) -> None:
+            raise OSError("no browser available")
+
+        dispatcher = IntentDispatcher(launcher=fail, coalesce_seconds=0, clock=self.clock)
+        with self.assertLogs("kivy", level="WARNING") as logs:
+            dispatcher.launch("https://example.com").join(5)
+        self.assertIn("no browser available", logs.output[0])
+        self.assertEqual(dispatcher.latencies_ms, [])
+        self.assertIsNotNone(dispatcher.launch("https://example.com"))
+
+    def test_empty_uri_is_ignored(self) -> None:
+        self.assertIsNone(self.dispatcher.launch(""))
+        self.assertEqual(self.launched, [])
+
+
+class LauncherTests(unittest.TestCase):
+    def test_mailto_encodes_recipient_and_subject(self) -> None:
+        self.assertEqual(
+            intents.mailto("contato@example.com"),
+            "mailto:contato%40example.com?subject=Contato%20-%20Engenho%20Digital",
+        )
+
+    def test_desktop_launcher_uses_webbrowser(self) -> None:
+        with mock.patch.dict(sys.modules, {"plyer": None}), mock.patch.object(
+            intents.webbrowser, "open", return_value=True
+        ) as browser_open:
+            intents._desktop_launcher("https://example.com")
+            intents._desktop_launcher(intents.mailto("a@example.com"))
+        self.assertEqual(browser_open.call_count, 2)
+
+    def test_desktop_launcher_raises_without_a_browser(self) -> None:
+        with mock.patch.object(intents.webbrowser, "open", return_value=False):
+            with self.assertRaises(OSError):
+                intents._desktop_launcher("https://example.com")
+
+    def test_android_launcher_only_on_android(self) -> None:
+        with mock.patch.dict(intents.os.environ, {}, clear=True):
+            self.assertIsNone(intents._android_launcher())
+            self.assertIs(intents.default_launcher(), intents._desktop_launcher)
+
+
+if __name__ == "__main__":
+    unittest.main()
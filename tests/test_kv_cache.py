@@ -0,0 +1,99 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+HAS_KIVY = importlib.util.find_spec("kivy") is not None
+
+if HAS_KIVY:
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+    from kivy.factory import Factory  # noqa: E402
+    from kivy.lang import Builder  # noqa: E402
+
+    from engdigital import kv_cache  # noqa: E402
+
+KV = """#:set card_padding 14
+<KvCacheTestCard@BoxLayout>:
+    title: "x"
+    padding: card_padding
+    Label:
+        text: root.title.upper() + str(int(root.padding[0] * 2))
+"""
+
+
+@unittest.skipIf(not HAS_KIVY, "Kivy is not installed")
+class KvCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.kv_path = self.root / "card.kv"
+        self.kv_path.write_text(KV, encoding="utf-8")
+        self.addCleanup(lambda: Builder.unload_file(str(self.kv_path)))
+
+    def test_miss_parses_text_and_writes_cache_for_next_launch(self) -> None:
+        write_dir = self.root / "data"
+        kv_cache.load_kv(self.kv_path, write_dir=write_dir)
+        cache_path = write_dir / "card.kv.kvc"
+        self.assertTrue(cache_path.is_file())
+        self.assertIsNotNone(kv_cache.read_cache(cache_path, kv_cache.cache_key(KV)))
+
+    def test_fresh_cache_skips_parsing_and_builds_widgets(self) -> None:
+        kv_cache.compile_kv(self.kv_path)
+        with mock.patch.object(kv_cache.Parser, "parse", side_effect=AssertionError("kv text was parsed")):
+            kv_cache.load_kv(self.kv_path)
+        card = Factory.KvCacheTestCard()
+        self.assertEqual(card.children[0].text, "X28")
+        self.assertEqual(card.padding, [14, 14, 14, 14])
+
+    def test_stale_cache_falls_back_to_text(self) -> None:
+        kv_cache.compile_kv(self.kv_path)
+        self.kv_path.write_text(KV.replace('"x"', '"y"'), encoding="utf-8")
+        self.assertIsNone(
+            kv_cache.read_cache(kv_cache.cache_path_for(self.kv_path), kv_cache.cache_key(self.kv_path.read_text()))
+        )
+        kv_cache.load_kv(self.kv_path)
+        self.assertEqual(Factory.KvCacheTestCard().title, "y")
+
+    def test_corrupt_cache_is_ignored(self) -> None:
+        cache_path = kv_cache.cache_path_for(self.kv_path)
+        cache_path.write_bytes(kv_cache.cache_key(KV).encode("ascii") + b"\nnot a pickle")
+        self.assertIsNone(kv_cache.read_cache(cache_path, kv_cache.cache_key(KV)))
+
+
+
+@unittest.skipIf(not HAS_KIVY, "Kivy is not installed")
+class CompileKvTests(unittest.TestCase):
+    def setUp(self) -> None:
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+        import compile_kv
+
+        self.compile_kv = compile_kv
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.spec = Path(tmp.name) / "buildozer.spec"
+
+    def test_installed_kivy_must_match_the_spec_pin(self) -> None:
+        import kivy
+
+        self.spec.write_text(f"[app]\nrequirements = python3,kivy=={kivy.__version__}\n", encoding="utf-8")
+        self.compile_kv.check_kivy_version(self.spec)
+
+        self.spec.write_text("[app]\nrequirements = python3,kivy==0.0.1\n", encoding="utf-8")
+        with self.assertRaises(SystemExit) as raised:
+            self.compile_kv.check_kivy_version(self.spec)
+        self.assertIn("kivy==0.0.1", str(raised.exception))
+
+        self.spec.write_text("[app]\nrequirements = python3,kivy\n", encoding="utf-8")
+        with self.assertRaises(SystemExit):
+            self.compile_kv.check_kivy_version(self.spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+HAS_KIVY = importlib.util.find_spec("kivy") is not None
+
+if HAS_KIVY:
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+    from kivy.uix.screenmanager import Screen  # noqa: E402
+
+    from engdigital.lazy_screens import LazyScreenManager  # noqa: E402
+
+
+@unittest.skipIf(not HAS_KIVY, "Kivy is not installed")
+class LazyScreenManagerTests(unittest.TestCase):
+    def _manager(self) -> tuple["LazyScreenManager", list[str]]:
+        built: list[str] = []
+
+        def factory(name: str):
+            def create() -> "Screen":
+                built.append(name)
+                return Screen(name=name)
+
+            return create
+
+        manager = LazyScreenManager()
+        for name in ("inicio", "servicos", "contato"):
+            manager.register(name, factory(name))
+        return manager, built
+
+    def test_screens_are_built_on_first_navigation_only(self) -> None:
+        manager, built = self._manager()
+        manager.ensure("inicio")
+        self.assertEqual(built, ["inicio"])
+        self.assertEqual(manager.current, "inicio")
+
+        self.assertTrue(manager.show("contato"))
+        self.assertTrue(manager.show("contato"))
+        self.assertEqual(built, ["inicio", "contato"])
+        self.assertEqual(manager.current, "contato")
+        self.assertEqual(manager.pending_names, ["servicos"])
+
+    def test_unknown_screen_is_ignored(self) -> None:
+        manager, built = self._manager()
+        manager.ensure("inicio")
+        self.assertFalse(manager.show("missing"))
+        self.assertFalse(manager.is_registered("missing"))
+        self.assertEqual(manager.current, "inicio")
+
+    def test_build_all_and_idle_prebuild_empty_the_queue(self) -> None:
+        manager, built = self._manager()
+        manager.build_all()
+        self.assertEqual(built, ["inicio", "servicos", "contato"])
+        self.assertEqual(manager.pending_names, [])
+
+        manager, built = self._manager()
+        manager.ensure("inicio")
+        for _ in range(3):
+            manager._prebuild_next(0)
+        self.assertEqual(sorted(manager.screen_names), ["contato", "inicio", "servicos"])
+
+    def test_register_rejects_already_built_screen(self) -> None:
+        manager, _ = self._manager()
+        manager.ensure("inicio")
+        with self.assertRaises(ValueError):
+            manager.register("inicio", lambda: Screen(name="inicio"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import security_scan  # noqa: E402
+
+# Fixtures are assembled at runtime so this file never matches the scanner itself.
+API_KEY = "AI" + "za" + "Sy" + "X" * 33
+PEM_HEADER = "-----BEGIN " + "PRIVATE KEY-----"
+
+
+class SecurityScanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, name: str, content) -> Path:
+        path = self.root / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        return path
+
+    def _rules_hit(self, *paths: Path, **kwargs) -> list[tuple[str, str, int]]:
+        findings = security_scan.scan_paths(list(paths), jobs=2, **kwargs)
+        return [(f.rule, f.path.name, f.line) for f in findings]
+
+    def test_each_rule_reports_its_location(self) -> None:
+        files = [
+            self._write("sa.json", '{\n  "type": "service_account",\n  "private_key": "x"\n}'),
+            self._write("key.pem", f"{PEM_HEADER}\n{'A' * 64}\n"),
+            self._write("config.py", f"# settings\nAPI = '{API_KEY}'\n"),
+            self._write("buildozer.spec", "[app]\ntitle = x\nandroid.release_keystore_pass = hunter2\n"),
+        ]
+
+        self.assertEqual(
+            sorted(self._rules_hit(*files)),
+            [
+                ("buildozer-keystore-password", "buildozer.spec", 3),
+                ("google-api-key", "config.py", 2),
+                ("pem-private-key", "key.pem", 1),
+                ("service-account-key", "sa.json", 3),
+            ],
+        )
+
+    def test_placeholders_and_empty_spec_values_are_not_flagged(self) -> None:
+        example = self._write("sa.json.example", f'{{"private_key": "{PEM_HEADER}\\nYOUR_PRIVATE_KEY\\n"}}')
+        spec = self._write("buildozer.spec", "[app]\nandroid.release_keystore_pass =\n")
+        self.assertEqual(self._rules_hit(example, spec), [])
+
+    def test_binary_and_oversized_files_are_skipped(self) -> None:
+        binary = self._write("image.png", b"\x89PNG\0\0" + API_KEY.encode())
+        big = self._write("big.txt", "x\n" * 1000 + API_KEY)
+        self.assertEqual(self._rules_hit(binary), [])
+        self.assertEqual(self._rules_hit(big, max_bytes=100), [])
+        self.assertEqual(self._rules_hit(big), [("google-api-key", "big.txt", 1001)])
+
+    def test_large_files_are_scanned_via_mmap(self) -> None:
+        big = self._write("large.log", "x" * security_scan.MMAP_THRESHOLD + "\n" + API_KEY)
+        self.assertEqual(self._rules_hit(big), [("google-api-key", "large.log", 2)])
+
+    def test_process_pool_matches_in_process_results(self) -> None:
+        files = [self._write(f"f{i}.py", f"# {i}\n" + (f"KEY = '{API_KEY}'\n" if i % 3 == 0 else "")) for i in range(9)]
+        expected = security_scan.scan_paths(files, jobs=1)
+        with mock.patch.object(security_scan, "PROCESS_POOL_MIN_BYTES", 0), mock.patch.object(
+            security_scan, "ProcessPoolExecutor", wraps=security_scan.ProcessPoolExecutor
+        ) as pool:
+            found = security_scan.scan_paths(files, jobs=2)
+        pool.assert_called_once_with(max_workers=2)
+        self.assertEqual(found, expected)
+        self.assertEqual(len(found), 3)
+
+    def test_tracked_files_are_clean(self) -> None:
+        self.assertEqual(security_scan.main(["--no-cache"]), 0)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class GitBlobScanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self._tmp.name)
+        self._git("init", "-q")
+        self.cache = security_scan.ScanCache(self.repo / ".cache" / "scan.json", security_scan.RULES, 1 << 20)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _git(self, *args: str) -> None:
+        subprocess.check_call(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+            cwd=str(self.repo),
+            stdout=subprocess.DEVNULL,
+        )
+
+    def _commit(self, name: str, content: str) -> None:
+        (self.repo / name).write_text(content, encoding="utf-8")
+        self._git("add", name)
+        self._git("commit", "-q", "-m", f"update {name}")
+
+    def test_history_finds_secrets_removed_from_the_tree(self) -> None:
+        self._commit("settings.py", f"KEY = '{API_KEY}'\n")
+        self._commit("settings.py", "KEY = ''\n")
+
+        worktree, _ = security_scan.scan_worktree(self.repo, security_scan.RULES, max_bytes=1 << 20, jobs=1, cache=None)
+        history, scanned = security_scan.scan_history(self.repo, security_scan.RULES, max_bytes=1 << 20, cache=None)
+
+        self.assertEqual(worktree, [])
+        self.assertEqual(scanned, 2)
+        self.assertEqual([(f.rule, f.path.name, f.line) for f in history], [("google-api-key", "settings.py", 1)])
+        self.assertTrue(history[0].blob)
+
+    def test_history_blob_gets_the_rules_of_every_path_it_had(self) -> None:
+        key = '{"private_key": "x"}\n'
+        # rev-list reports the blob once, under its last name; the key rule only applies to *.json.
+        self._commit("key.json", key)
+        self._git("mv", "key.json", "notes.txt")
+        self._git("commit", "-q", "-m", "rename")
+        self._git("rm", "-q", "notes.txt")
+        self._git("commit", "-q", "-m", "remove")
+
+        for cache in (None, self.cache, security_scan.ScanCache(self.cache.path, security_scan.RULES, 1 << 20)):
+            history, _ = security_scan.scan_history(self.repo, security_scan.RULES, max_bytes=1 << 20, cache=cache)
+            self.assertEqual([(f.rule, f.path.name) for f in history], [("service-account-key", "key.json")])
+            if cache:
+                cache.save()
+
+    def test_staged_scan_reads_index_content(self) -> None:
+        self._commit("README.md", "hello\n")
+        (self.repo / "notes.txt").write_text(f"x\n{API_KEY}\n", encoding="utf-8")
+        self._git("add", "notes.txt")
+        # Working tree no longer has the key, but the staged blob does.
+        (self.repo / "notes.txt").write_text("clean\n", encoding="utf-8")
+
+        findings, scanned = security_scan.scan_staged(self.repo, security_scan.RULES, max_bytes=1 << 20, cache=None)
+
+        self.assertEqual(scanned, 1)
+        self.assertEqual([(f.path.name, f.line) for f in findings], [("notes.txt", 2)])
+
+    def test_unchanged_blobs_are_served_from_cache(self) -> None:
+        self._commit("a.txt", "a\n")
+        self._commit("b.json", '{"private_key": "x"}')
+
+        first, _ = security_scan.scan_worktree(self.repo, security_scan.RULES, max_bytes=1 << 20, jobs=1, cache=self.cache)
+        self.cache.save()
+        cache = security_scan.ScanCache(self.cache.path, security_scan.RULES, 1 << 20)
+        second, _ = security_scan.scan_worktree(self.repo, security_scan.RULES, max_bytes=1 << 20, jobs=1, cache=cache)
+
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(first, second)
+        self.assertEqual([f.rule for f in second], ["service-account-key"])
+
+        # Local edits are rescanned instead of trusting the index blob's cached result.
+        (self.repo / "a.txt").write_text(API_KEY, encoding="utf-8")
+        third, _ = security_scan.scan_worktree(self.repo, security_scan.RULES, max_bytes=1 << 20, jobs=1, cache=cache)
+        self.assertEqual(sorted(f.rule for f in third), ["google-api-key", "service-account-key"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engdigital import startup_trace  # noqa: E402
+from engdigital.startup_trace import StartupTracer  # noqa: E402
+
+
+class StartupTraceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def test_disabled_without_env_var(self) -> None:
+        self.assertIsNone(startup_trace.install(env={}))
+        self.assertFalse(startup_trace.enabled())
+        with startup_trace.span("noop"):
+            pass
+        self.assertIsNone(startup_trace.finish())
+
+    def test_import_hook_records_new_modules_only(self) -> None:
+        (self.root / "trace_probe_mod.py").write_text("import trace_probe_dep\n", encoding="utf-8")
+        (self.root / "trace_probe_dep.py").write_text("VALUE = 1\n", encoding="utf-8")
+        sys.path.insert(0, str(self.root))
+        self.addCleanup(sys.path.remove, str(self.root))
+        self.addCleanup(sys.modules.pop, "trace_probe_mod", None)
+        self.addCleanup(sys.modules.pop, "trace_probe_dep", None)
+
+        tracer = StartupTracer()
+        tracer.install_import_hook()
+        try:
+            import trace_probe_mod  # noqa: F401
+            import json as _json  # noqa: F401  (already loaded: not recorded)
+        finally:
+            tracer.remove_import_hook()
+
+        names = [e["name"] for e in tracer.events]
+        self.assertEqual(names, ["import trace_probe_dep", "import trace_probe_mod"])
+        outer = tracer.events[1]
+        self.assertEqual(outer["args"], {"modules": 2})
+        self.assertAlmostEqual(tracer.import_ns / 1000, outer["dur"])
+
+    def test_write_produces_chrome_trace_json(self) -> None:
+        tracer = StartupTracer(self.root / "out" / "trace.json")
+        with tracer.span("build"):
+            with tracer.span("build.kv"):
+                pass
+        tracer.instant("first frame")
+
+        path = tracer.write()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        events = {e["name"]: e for e in data["traceEvents"]}
+        self.assertEqual(events["build"]["ph"], "X")
+        self.assertEqual(events["first frame"]["ph"], "i")
+        self.assertLessEqual(events["build"]["ts"], events["build.kv"]["ts"])
+        self.assertGreaterEqual(events["build"]["dur"], events["build.kv"]["dur"])
+        self.assertIn("build", tracer.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import sync_play_store_listing as sync  # noqa: E402
+from fake_androidpublisher import FakeHttpError, FakePublisher  # noqa: E402
+
+PACKAGE = "com.engenhodigital.app"
+LOCALE = "pt-BR"
+
+
+class ImageDiffSyncTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.service = FakePublisher()
+        self.edit_id = self.service.edits().insert(packageName=PACKAGE, body={}).execute()["id"]
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _file(self, name: str, content: bytes) -> Path:
+        path = self.root / name
+        path.write_bytes(content)
+        return path
+
+    def _sync(self, image_type: str, files: list[Path]) -> sync.ImageSyncPlan:
+        self.service.calls.clear()
+        return sync._sync_images(
+            self.service,
+            package_name=PACKAGE,
+            edit_id=self.edit_id,
+            locale=LOCALE,
+            image_type=image_type,
+            files=files,
+            media_factory=lambda p: p,
+        )
+
+    def _remote_sha256(self, image_type: str) -> list[str]:
+        return [image["sha256"] for image in self.service.images[(PACKAGE, LOCALE, image_type)]]
+
+    def _local_sha256(self, files: list[Path]) -> list[str]:
+        return [sync._file_digests(f)[1] for f in files]
+
+    def test_unchanged_images_are_not_touched(self) -> None:
+        files = [self._file("1.png", b"one"), self._file("2.png", b"two")]
+        self.service.seed_images(PACKAGE, LOCALE, "phoneScreenshots", files)
+
+        plan = self._sync("phoneScreenshots", files)
+
+        self.assertEqual((len(plan.keep), plan.delete, plan.upload), (2, [], []))
+        self.assertEqual(self.service.calls, [("list", "phoneScreenshots")])
+
+    def test_only_changed_and_removed_images_are_synced(self) -> None:
+        old = [self._file("1.png", b"one"), self._file("2.png", b"two"), self._file("3.png", b"three")]
+        self.service.seed_images(PACKAGE, LOCALE, "phoneScreenshots", old)
+        new = [old[0], self._file("2b.png", b"two-v2")]
+
+        plan = self._sync("phoneScreenshots", new)
+
+        self.assertEqual(len(plan.keep), 1)
+        self.assertEqual(len(plan.delete), 2)
+        self.assertEqual(plan.upload, [new[1]])
+        self.assertNotIn(("deleteall", "phoneScreenshots"), self.service.calls)
+        self.assertEqual(self._remote_sha256("phoneScreenshots"), self._local_sha256(new))
+
+    def test_reordered_screenshots_end_in_local_order(self) -> None:
+        a, b = self._file("a.png", b"a"), self._file("b.png", b"b")
+        self.service.seed_images(PACKAGE, LOCALE, "tenInchScreenshots", [a, b])
+
+        self._sync("tenInchScreenshots", [b, a])
+
+        self.assertEqual(self._remote_sha256("tenInchScreenshots"), self._local_sha256([b, a]))
+
+    def test_empty_remote_uploads_everything(self) -> None:
+        icon = self._file("icon.png", b"icon")
+
+        plan = self._sync("icon", [icon])
+
+        self.assertEqual(plan.upload, [icon])
+        self.assertEqual(self._remote_sha256("icon"), self._local_sha256([icon]))
+
+
+class ConcurrentUploadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.service = FakePublisher(latency=0.02)
+        self.edit_id = self.service.edits().insert(packageName=PACKAGE, body={}).execute()["id"]
+        self.sleeps: list[float] = []
+        self.policy = sync.RetryPolicy(max_retries=3, base_delay=0.5, sleep=self.sleeps.append)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _job(self, image_type: str, files: list[Path]):
+        def job(execute) -> None:
+            sync._sync_images(
+                self.service,
+                package_name=PACKAGE,
+                edit_id=self.edit_id,
+                locale=LOCALE,
+                image_type=image_type,
+                files=files,
+                media_factory=lambda p: p,
+                execute=execute,
+            )
+
+        return job
+
+    def _files(self, prefix: str, count: int) -> list[Path]:
+        files = []
+        for i in range(count):
+            path = self.root / f"{prefix}{i}.png"
+            path.write_bytes(f"{prefix}-{i}".encode())
+            files.append(path)
+        return files
+
+    def test_image_types_upload_concurrently_and_keep_order(self) -> None:
+        sets = {t: self._files(t, 3) for t in ("phoneScreenshots", "sevenInchScreenshots", "tenInchScreenshots")}
+
+        reports = sync._run_image_jobs(
+            [(LOCALE, t, self._job(t, files)) for t, files in sets.items()], workers=3, policy=self.policy
+        )
+
+        self.assertGreater(self.service.max_in_flight, 1)
+        self.assertEqual([r.image_type for r in reports], list(sets))
+        for image_type, files in sets.items():
+            remote = [image["sha256"] for image in self.service.images[(PACKAGE, LOCALE, image_type)]]
+            self.assertEqual(remote, [sync._file_digests(f)[1] for f in files])
+
+    def test_transient_errors_are_retried_with_backoff(self) -> None:
+        self.service.fail_next("upload", times=2, status=503)
+        files = self._files("icon", 1)
+
+        (report,) = sync._run_image_jobs([(LOCALE, "icon", self._job("icon", files))], workers=2, policy=self.policy)
+
+        self.assertEqual(report.retries, 2)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertTrue(all(0 <= delay <= 0.5 * 2**i for i, delay in enumerate(self.sleeps)))
+        self.assertEqual(len(self.service.images[(PACKAGE, LOCALE, "icon")]), 1)
+
+    def test_non_retryable_errors_and_exhausted_retries_propagate(self) -> None:
+        jobs = [(LOCALE, "featureGraphic", self._job("featureGraphic", self._files("fg", 1)))]
+
+        self.service.fail_next("upload", times=1, status=400)
+        with self.assertRaises(FakeHttpError):
+            sync._run_image_jobs(jobs, workers=1, policy=self.policy)
+        self.assertEqual(self.sleeps, [])
+
+        self.service.fail_next("upload", times=4, status=429)
+        with self.assertRaises(FakeHttpError):
+            sync._run_image_jobs(jobs, workers=1, policy=self.policy)
+        self.assertEqual(len(self.sleeps), 3)
+
+    def test_upload_whose_response_was_lost_is_not_sent_again(self) -> None:
+        files = self._files("shot", 2)
+        self.service.fail_next("upload", times=1, status=503, after=True)
+
+        (report,) = sync._run_image_jobs(
+            [(LOCALE, "phoneScreenshots", self._job("phoneScreenshots", files))], workers=1, policy=self.policy
+        )
+
+        remote = [image["sha256"] for image in self.service.images[(PACKAGE, LOCALE, "phoneScreenshots")]]
+        self.assertEqual(remote, [sync._file_digests(f)[1] for f in files])  # no duplicate screenshot
+        self.assertEqual([c for c, _ in self.service.calls].count("upload"), 2)
+        self.assertEqual(report.retries, 0)
+
+    def test_upload_that_never_landed_is_retried(self) -> None:
+        files = self._files("shot", 1)
+        self.service.fail_next("upload", times=1, status=503)
+
+        (report,) = sync._run_image_jobs(
+            [(LOCALE, "phoneScreenshots", self._job("phoneScreenshots", files))], workers=1, policy=self.policy
+        )
+
+        self.assertEqual(report.retries, 1)
+        self.assertIn(("list", "phoneScreenshots"), self.service.calls[2:])  # re-listed before the retry
+        self.assertEqual(len(self.service.images[(PACKAGE, LOCALE, "phoneScreenshots")]), 1)
+
+
+class MultiLocaleSyncTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.metadata_root = Path(self._tmp.name)
+        for locale in ("en-US", "es-ES", "pt-BR"):
+            self._write_locale(locale)
+        (self.metadata_root / "README").write_text("not a locale", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_locale(self, locale: str) -> None:
+        root = self.metadata_root / locale
+        images = root / "images"
+        (images / "phoneScreenshots").mkdir(parents=True)
+        for name in ("title", "short_description", "full_description"):
+            (root / f"{name}.txt").write_text(f"{name} {locale}", encoding="utf-8")
+        (images / "icon.png").write_bytes(f"icon-{locale}".encode())
+        (images / "featureGraphic.png").write_bytes(f"fg-{locale}".encode())
+        for i in (1, 2):
+            (images / "phoneScreenshots" / f"{i}.png").write_bytes(f"shot-{locale}-{i}".encode())
+
+    def test_all_locales_are_discovered_and_synced_in_one_edit(self) -> None:
+        locales = sync._discover_locales(self.metadata_root)
+        self.assertEqual(locales, ["en-US", "es-ES", "pt-BR"])
+
+        listings, load_seconds = sync._load_all_listing_inputs(self.metadata_root, locales, PACKAGE)
+        self.assertEqual(sorted(load_seconds), locales)
+
+        service = FakePublisher()
+        edit_id = service.edits().insert(packageName=PACKAGE, body={}).execute()["id"]
+        listing_seconds, reports = sync._sync_edit(
+            service,
+            listings,
+            edit_id=edit_id,
+            image_sync="diff",
+            workers=4,
+            policy=sync.RetryPolicy(sleep=lambda _: None),
+            media_factory=lambda p: p,
+        )
+        service.edits().commit(packageName=PACKAGE, editId=edit_id).execute()
+
+        self.assertEqual(sorted(listing_seconds), locales)
+        self.assertEqual(len(reports), 3 * 3)
+        self.assertEqual([c for c in service.calls if c[0] in ("insert", "commit")], [("insert", edit_id), ("commit", edit_id)])
+        for locale in locales:
+            self.assertEqual(service.listings[(PACKAGE, locale)]["title"], f"title {locale}")
+            self.assertEqual(len(service.images[(PACKAGE, locale, "phoneScreenshots")]), 2)
+
+    def test_invalid_locales_are_reported_together(self) -> None:
+        (self.metadata_root / "en-US" / "title.txt").unlink()
+        (self.metadata_root / "es-ES" / "images" / "icon.png").unlink()
+
+        with self.assertRaises(SystemExit) as ctx:
+            sync._load_all_listing_inputs(self.metadata_root, sync._discover_locales(self.metadata_root), PACKAGE)
+
+        message = str(ctx.exception)
+        self.assertIn("en-US", message)
+        self.assertIn("es-ES", message)
+        self.assertNotIn("pt-BR", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+HAS_KIVY = importlib.util.find_spec("kivy") is not None
+
+if HAS_KIVY:
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+    from kivy.cache import Cache  # noqa: E402
+    from kivy.core.text import LabelBase  # noqa: E402
+
+    from engdigital import wrap_label  # noqa: E402
+    from engdigital.wrap_label import WrapLabel  # noqa: E402
+
+TEXT = "Projetos elétricos, automação e sistemas sob medida para a sua empresa " * 3
+
+
+@unittest.skipIf(not HAS_KIVY, "Kivy is not installed")
+class WrapLabelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        Cache.remove(wrap_label.TEXTURE_CACHE)
+        renders = mock.patch.object(LabelBase, "refresh", autospec=True, side_effect=LabelBase.refresh)
+        self.refresh = renders.start()
+        self.addCleanup(renders.stop)
+
+    def test_width_changes_are_batched_into_one_render(self) -> None:
+        label = WrapLabel(text=TEXT, width=300)
+        label.width = 250
+        label.width = 200
+        label.texture_update()  # Label's own trigger firing before the batch pass
+        self.assertFalse(self.refresh.called)
+
+        wrap_label.flush()
+        self.assertEqual(self.refresh.call_count, 1)
+        self.assertEqual(tuple(label.text_size), (200, None))
+        self.assertLessEqual(label.texture_size[0], 200)
+        self.assertEqual(label.height, label.texture_size[1])
+
+    def test_returning_to_a_known_width_reuses_the_texture(self) -> None:
+        label = WrapLabel(text=TEXT, width=200)
+        wrap_label.flush()
+        narrow = label.texture
+        label.width = 400
+        wrap_label.flush()
+        self.assertEqual(self.refresh.call_count, 2)
+        self.assertLess(label.height, narrow.height)
+
+        label.width = 200
+        wrap_label.flush()
+        self.assertEqual(self.refresh.call_count, 2)
+        self.assertIs(label.texture, narrow)
+        self.assertEqual(label.height, narrow.height)
+
+        # Another label with the same text and options shares the cached texture.
+        twin = WrapLabel(text=TEXT, width=200)
+        wrap_label.flush()
+        self.assertIs(twin.texture, narrow)
+        self.assertEqual(self.refresh.call_count, 2)
+
+    def test_cached_textures_are_not_overwritten_by_later_renders(self) -> None:
+        label = WrapLabel(text="abc", width=200)
+        wrap_label.flush()
+        first, key = label.texture, label.texture_key()
+        label.text = "abd"  # same rendered size, so a reused core label would blit over it
+        label.texture_update()
+        self.assertIsNot(label.texture, first)
+        self.assertIs(Cache.get(wrap_label.TEXTURE_CACHE, key).texture, first)
+
+    def test_option_changes_miss_the_cache(self) -> None:
+        label = WrapLabel(text=TEXT, width=200)
+        wrap_label.flush()
+        key = label.texture_key()
+        label.font_size = label.font_size * 2
+        self.assertNotEqual(label.texture_key(), key)
+        label.texture_update()
+        self.assertEqual(self.refresh.call_count, 2)
+        self.assertGreater(label.height, 0)
+
+    def test_auto_height_can_be_disabled(self) -> None:
+        label = WrapLabel(text=TEXT, width=200, auto_height=False, height=10)
+        wrap_label.flush()
+        self.assertEqual(label.height, 10)
+        self.assertGreater(label.texture_size[1], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()